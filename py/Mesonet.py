@@ -14,172 +14,19 @@ import pandas as pd
 import io
 import re
 from datetime import datetime
+import http_client
+from mesonet_parser import build_valid_times, read_bulletin_block
+from station_registry import load_registry
 
 # --- Configuration Constants for Testing ---
-MESONET_URL_LIST = ['http://agebb.missouri.edu/weather/stations/boone/bull75s.htm',
-                    'http://agebb.missouri.edu/weather/stations/audrain/bull65s.htm',
-                    'http://agebb.missouri.edu/weather/stations/audrain/bull20s.htm',
-                    'http://agebb.missouri.edu/weather/stations/atchison/bull5s.htm',
-                    'http://agebb.missouri.edu/weather/stations/boone/bull70s.htm',
-                    'http://agebb.missouri.edu/weather/stations/boone/bull75s.htm',
-                    'http://agebb.missouri.edu/weather/stations/sanborn/bull35s.htm',
-                    'http://agebb.missouri.edu/weather/stations/boone/bull30s.htm',
-                    'http://agebb.missouri.edu/weather/stations/buchanan/bull10s.htm',
-                    "http://agebb.missouri.edu/weather/stations/callaway/bull55s.htm",
-                    'http://agebb.missouri.edu/weather/stations/carroll/bull40s.htm',
-                    'http://agebb.missouri.edu/weather/stations/gentry/bull15s.htm',
-                    'http://agebb.missouri.edu/weather/stations/knox/bull25s.htm',
-                    "http://agebb.missouri.edu/weather/stations/lafayette/bull110s.htm",
-                    'http://agebb.missouri.edu/weather/stations/lawrence/bull85t.htm',
-                    'http://agebb.missouri.edu/weather/stations/lincoln/bull90s.htm',
-                    'http://agebb.missouri.edu/weather/stations/linn/bull45s.htm',
-                    'http://agebb.missouri.edu/weather/stations/morgan/bull60t.htm',
-                    'http://agebb.missouri.edu/weather/stations/monroe/bull50s.htm',
-                    'http://agebb.missouri.edu/weather/stations/putnam/bull95s.htm',
-                    'http://agebb.missouri.edu/weather/stations/saline/bull100s.htm',
-                    'http://agebb.missouri.edu/weather/stations/stlouiscity/bull105s.htm',
-                    'http://agebb.missouri.edu/weather/stations/wright/bull80t.htm'
-                    ]
+# Stations come from the shared registry (Data/station_registry.csv, see station_registry.py)
+STATION_REGISTRY = load_registry()
+MESONET_URL_LIST = STATION_REGISTRY.mesonet_urls()
 
 # METADATA: Map the unique file identifier to static location data
-# NOTE: The keys are modified to match the full bull# identifier (e.g., 'bull75' instead of 'bull75s')
-STATION_METADATA = {
-    "bull5" : {
-        "station_id": "GravesMemorial_Atchison",
-        "lat": 39.75,
-        "lon": -94.79,
-        "year" : 2025,
-    },
-    "bull10" : {
-        "station_id" : "StJoe_Buchanan",
-        "lat" : 37.49,
-        "lon" : -94.31,
-        "year" : 2025,
-    },
-    "bull15" : {
-        "station_id": "Albany_Gentry",
-        "lat": 40.24,
-        "lon": -94.34,
-        "year": 2025,
-    },
-    "bull20" : {
-        "station_id": "Auxvasse_Audrain",
-        "lat": 39.30,
-        "lon":-91.51,
-        "year": 2025,
-    },
-    "bull25" : {
-        "station_id": "Greenley_Knox",
-        "lat": 40.01,
-        "lon": -92.19,
-        "year": 2025,
-    },
-    "bull30" : {
-        "station_id": "SouthFarm_boone",
-        "lat": 38.92,
-        "lon": -92.33,
-        "year": 2025
-    },
-    "bull35" : {
-        "station_id": "Sanborn_Boone",
-        "lat": 38.93,
-        "lon": -92.32,
-        "year": 2025
-    },
-    "bull40" : {
-        "station_id" : "Brunswick_carroll",
-        "lat": 39.41,
-        "lon": -93.19,
-        "year" : 2025,
-    },
-    "bull45" : {
-        "station_id": "Linneus_Linn",
-        "lat": 39.63,
-        "lon": -91.72,
-        "year": 2025,
-    },
-    "bull50" : {
-        "station_id": "MonroeCity_Monroe",
-        "lat": 39.33,
-        "lon": -92.02,
-        "year": 2025,
-    },
-    "bull55" : {
-        "station_id": "Williamsburg_Callaway",
-        "lat": 38.90,
-        "lon": -91.73,
-        "year": 2025,
-    },
-    "bull60" : {
-        "station_id": "Versailles_Morgan",
-        "lat": 38.43,
-        "lon": -92.85,
-        "year": 2025,
-    },
-    "bull65" : {
-        "station_id": "Van-Far_Audrian",
-        "lat": 39.30,
-        "lon": -91.51,
-        "year": 2025
-    },
-    "bull70" : {
-        'station_id': 'Bradford_Boone',
-        'lat': 38.93,
-        'lon': -92.32,
-        # Assuming the year from the <pre> tag is current for datetime construction
-        'year': 2025
-    },
-    "bull75" : {
-        'station_id': 'CapenPark_Boone',
-        'lat': 38.93,
-        'lon': -92.32,
-        # Assuming the year from the <pre> tag is current for datetime construction
-        'year': 2025
-    },
-    "bull80" : {
-        "station_id" : "MountainGrove_Wright",
-        "lat" : 37.15,
-        "lon" : -92.26,
-        "year" : 2025,
-    }, 
-    "bull85" : {
-        "station_id" : "MountVernon_Lawrence",
-        "lat" : 37.07,
-        "lon" : -93.87,
-        "year" : 2025,
-    },
-    "bull90" : {
-        "station_id" : "Moscow_Lincoln",
-        "lat" : 38.93,
-        "lon" : -90.93,
-        "year" : 2025,
-    },
-    "bull95" : {
-        "station_id" : "Unionville_Putnam",
-        "lat": 40.46,
-        "lon": -93.00,
-        "year": 2025,
-    },
-    "bull100" : {
-        "station_id" : "Marshall_Saline",
-        "lat": 39.12,
-        "lon": -92.21,
-        "year": 2025,
-    },
-    "bull105" : {
-        "station_id" : "StScienceCenter_StLouisCity",
-        "lat": 38.63,
-        "lon": -90.27,
-        "year": 2025,
-    },
-    "bull110" : {
-        "station_id" : "Alma_Lafayette",
-        "lat": 39.09,
-        "lon": -93.55,
-        "year": 2025,
-    },
-
-}
+# NOTE: The keys are the full bull# identifier (e.g., 'bull75' instead of 'bull75s')
+# Assuming the year from the <pre> tag is current for datetime construction
+STATION_METADATA = STATION_REGISTRY.mesonet_metadata(2025)
 
 def fetch_and_extract_pre_tag(url: str) -> str:
     """
@@ -193,13 +40,15 @@ def fetch_and_extract_pre_tag(url: str) -> str:
     """
     print(f"-> Attempting to fetch content from: {url}")
     try:
-        response = requests.get(url, timeout=15)
-        response.raise_for_status() # Raise exception for bad status codes
+        # Pooled, revalidating GET (raises for bad status codes)
+        result = http_client.conditional_get(url, timeout=15)
     except requests.exceptions.RequestException as e:
         print(f"[ERROR] Failed to fetch URL: {e}")
         return ""
 
-    raw_html = response.text
+    if result.not_modified:
+        print("-> Page not modified since last fetch (304). Using stored copy.")
+    raw_html = result.text
 
     # Use simple string splitting to reliably extract content between <pre> tags
     # We look for <pre> and </pre> ignoring case
@@ -243,54 +92,24 @@ def parse_mesonet_data(raw_text: str, metadata: dict) -> pd.DataFrame:
         'Wind_Speed_MPH', 'Wind_Dir_Deg', 'Solar_Rad_Wm2', 'Precip_Inches'
     ]
     
-    # We determined the header/metadata is 12 lines long from the sample
-    SKIP_LINES = 12 
-    
     try:
-        # Crucial step: Use sep='\s+' (one or more whitespace characters) to handle 
-        # the variable spacing between columns effectively.
-        df = pd.read_csv(
-            io.StringIO(raw_text),
-            sep='\s+',
-            skiprows=SKIP_LINES,
-            names=mesonet_cols,
-            engine='python', # Python engine is necessary for regex separator
-            skipinitialspace=True, # Helps with leading whitespace
-            # Skip the generic footer lines (usually 3 lines of links/graphics)
-            skipfooter=3 
-        )
+        # Locate the data block from the first month/day/time line (instead of a fixed
+        # 12-line header skip and 3-line footer skip) and read it with the fast C engine.
+        df = read_bulletin_block(raw_text, names=mesonet_cols)
     except Exception as e:
         print(f"[ERROR] Failed to parse Mesonet data into DataFrame: {e}")
         return pd.DataFrame()
     
+    if df is None:
+        print("[ERROR] Could not find the start of the hourly data block.")
+        return pd.DataFrame()
+    
     # Remove any completely empty rows that might result from trailing metadata lines
     df = df.dropna(how='all').reset_index(drop=True)
     
     # 2. Create a proper datetime column
-    def combine_date_time(row, year):
-        try:
-            # Pad month, day, and time strings (e.g., 100 -> 0100)
-            month = str(int(row['Month'])).zfill(2)
-            day = str(int(row['Day'])).zfill(2)
-            
-            # Time can be 100 (1:00) or 1000 (10:00) or 2400 (00:00 of next day)
-            time_int = int(row['Time_HHMM'])
-            
-            if time_int == 2400:
-                # Handle 2400 (end of day) as 00:00 of the next day
-                date_str = f"{year}-{month}-{day} 23:59"
-                dt = pd.to_datetime(date_str, format='%Y-%m-%d %H:%M')
-                return dt + pd.Timedelta(minutes=1) # Roll over to 00:00 of next day
-            else:
-                time_str = str(time_int).zfill(4)
-                hour = time_str[:-2].zfill(2)
-                minute = time_str[-2:]
-                date_str = f"{year}-{month}-{day} {hour}:{minute}"
-                return pd.to_datetime(date_str, format='%Y-%m-%d %H:%M', errors='coerce')
-        except:
-            return pd.NaT
-
-    df['valid'] = df.apply(lambda row: combine_date_time(row, data_year), axis=1)
+    # (vectorized; 2400 rolls over to 00:00 of the next day, invalid rows become NaT)
+    df['valid'] = build_valid_times(df['Month'], df['Day'], df['Time_HHMM'], data_year)
     
     # Filter out any rows where datetime creation failed
     df = df.dropna(subset=['valid'])
@@ -0,0 +1,239 @@
+'''
+Parallel backfill of historical hours with checkpoint/resume.
+
+Rebuilds the gridded NetCDF file and the PNG maps for every hour in a date/hour
+range. The work is split into two separately bounded stages:
+
+    network  a small thread pool downloads the range in contiguous blocks of
+             hours (one ASOS range request + one Mesonet pass per block, see
+             generator.fetch_and_process_range)
+    CPU      a process pool grids and renders each hour (every core by default)
+
+The fetch threads only hand an hour to the process pool when the CPU backlog has
+room, so downloads never run far ahead of processing. Every finished hour is
+recorded in a JSON manifest (written atomically after each hour). An hour only
+counts as completed once its NetCDF file and every map exist on disk; running
+the same command again skips the completed hours and retries the failed ones.
+
+Example:
+    python backfill.py --start 2025-11-01T00 --end 2025-11-30T23 --workers 8
+
+Author: Nathan Beach
+Last Modified: October 16, 2026
+'''
+
+import os
+import json
+import time
+import queue
+import shutil
+import argparse
+import threading
+import pandas as pd
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Dict, Any, List, Optional
+
+import generator
+
+# --- Configuration Constants ---
+BACKFILL_DATA_DIR = os.path.join(generator.BASE_DATA_DIR, 'backfill')
+BACKFILL_MAP_DIR = os.path.join('.', 'images', 'maps', 'backfill')
+MANIFEST_FILENAME = 'backfill_manifest.json'
+# Concurrent downloads (kept low to be polite to IEM / agebb)
+FETCH_WORKERS = 2
+# Hours downloaded per network request block
+HOURS_PER_FETCH = 24
+# Hours fetched and waiting for a CPU worker, per worker
+BACKLOG_PER_WORKER = 2
+
+
+def hour_key(target_hour: datetime) -> str:
+    """Manifest key of an hour ('2025-11-29T18')."""
+    return target_hour.strftime('%Y-%m-%dT%H')
+
+
+def hour_outputs(target_hour: datetime, output_dir: str, map_dir: str) -> Dict[str, str]:
+    """Per-hour output locations: <output_dir>/<YYYYMMDD>/mo_surface_<res>km_<YYYYMMDDHH>.nc and <map_dir>/<YYYYMMDDHH>/."""
+    stamp = target_hour.strftime('%Y%m%d%H')
+    return {
+        'netcdf': os.path.join(output_dir, stamp[:8], f'mo_surface_{generator.GRID_RESOLUTION_KM}km_{stamp}.nc'),
+        'maps': os.path.join(map_dir, stamp),
+    }
+
+
+class Manifest():
+    """
+    Checkpoint of a backfill: {'completed': {hour: details}, 'failed': {hour: error}}.
+    Only the coordinating process writes it; every save replaces the file atomically.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.completed: Dict[str, Dict[str, Any]] = {}
+        self.failed: Dict[str, str] = {}
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            self.completed = state.get('completed', {})
+            self.failed = state.get('failed', {})
+
+    def mark_completed(self, key: str, details: Dict[str, Any]) -> None:
+        self.completed[key] = details
+        self.failed.pop(key, None)
+        self.save()
+
+    def mark_failed(self, key: str, error: str) -> None:
+        self.failed[key] = error
+        self.save()
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'completed': self.completed, 'failed': self.failed}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+def _init_worker() -> None:
+    # Workers only write files; never try to open a display
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+def process_hour(target_hour: datetime, merged_df: pd.DataFrame, engine_name: str,
+                 output_dir: str, map_dir: str, render: bool) -> Dict[str, Any]:
+    """CPU stage for one hour (runs in a worker process): grid, save NetCDF and render maps."""
+    start = time.perf_counter()
+    if merged_df.empty:
+        raise ValueError('no usable reports for this hour')
+
+    outputs = hour_outputs(target_hour, output_dir, map_dir)
+    # Files left by an earlier, failed attempt must not count as this attempt's output
+    if os.path.exists(outputs['netcdf']):
+        os.remove(outputs['netcdf'])
+    if render and os.path.isdir(outputs['maps']):
+        shutil.rmtree(outputs['maps'])
+
+    # Absolute paths are kept as-is by regrid_and_save's join with BASE_DATA_DIR
+    ds = generator.regrid_and_save(
+        raw_df=merged_df,
+        resolution_km=generator.GRID_RESOLUTION_KM,
+        bounds=generator.MISSOURI_BOUNDS,
+        output_filepath=os.path.abspath(outputs['netcdf']),
+        engine=generator.make_engine(engine_name)
+    )
+    expected = [outputs['netcdf']]
+    if render:
+        generator.render_maps(ds, outputs['maps'])
+        expected += [os.path.join(outputs['maps'], generator.map_filename(var_name))
+                     for var_name in generator.PLOT_VARIABLES if var_name in ds.data_vars]
+    else:
+        outputs.pop('maps')
+
+    # The save helpers report write failures (disk full, permissions) without raising
+    missing = [path for path in expected if not os.path.exists(path)]
+    if missing:
+        raise OSError(f"{len(missing)} output file(s) not written: {', '.join(missing)}")
+    return {**outputs, 'reports': len(merged_df), 'seconds': round(time.perf_counter() - start, 2)}
+
+
+def hour_blocks(hours: List[datetime], hours_per_fetch: int) -> List[List[datetime]]:
+    """Splits sorted hours into runs of consecutive hours no longer than `hours_per_fetch`."""
+    blocks: List[List[datetime]] = []
+    for target_hour in hours:
+        if blocks and len(blocks[-1]) < hours_per_fetch and target_hour - blocks[-1][-1] == timedelta(hours=1):
+            blocks[-1].append(target_hour)
+        else:
+            blocks.append([target_hour])
+    return blocks
+
+
+def run_backfill(start_time: datetime, end_time: datetime, output_dir: str = BACKFILL_DATA_DIR,
+                 map_dir: str = BACKFILL_MAP_DIR, manifest_path: Optional[str] = None,
+                 workers: Optional[int] = None, fetch_workers: int = FETCH_WORKERS,
+                 hours_per_fetch: int = HOURS_PER_FETCH, engine_name: str = generator.GRID_INTERPOLATION_ENGINE,
+                 render: bool = True) -> Manifest:
+    """
+    Backfills every whole hour in [start_time, end_time] that the manifest does not list as
+    completed. Returns the updated manifest.
+    """
+    workers = workers or os.cpu_count() or 1
+    manifest = Manifest(manifest_path or os.path.join(output_dir, MANIFEST_FILENAME))
+    hours = [h for h in pd.date_range(start_time, end_time, freq='h').to_pydatetime() if hour_key(h) not in manifest.completed]
+    print(f"[BACKFILL] {len(hours)} hours to process ({len(manifest.completed)} already completed), "
+          f"{fetch_workers} fetch threads, {workers} worker processes")
+    if not hours:
+        return manifest
+
+    # Finished hours from both stages: (hour, details or None, error or None)
+    results: 'queue.Queue[tuple]' = queue.Queue()
+    backlog = threading.BoundedSemaphore(workers * BACKLOG_PER_WORKER)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as process_pool:
+
+        def hand_off(target_hour: datetime, merged_df: pd.DataFrame) -> None:
+            backlog.acquire()
+            try:
+                future = process_pool.submit(process_hour, target_hour, merged_df, engine_name, output_dir, map_dir, render)
+            except Exception:
+                # e.g. a broken pool: give the permit back, the caller records the failure
+                backlog.release()
+                raise
+
+            def done(f):
+                backlog.release()
+                error = f.exception()
+                results.put((target_hour, None if error else f.result(), error))
+            future.add_done_callback(done)
+
+        def fetch_block(block: List[datetime]) -> None:
+            try:
+                hourly = generator.fetch_and_process_range(block[0], block[-1])
+            except Exception as e:
+                for target_hour in block:
+                    results.put((target_hour, None, e))
+                return
+            for target_hour in block:
+                try:
+                    hand_off(target_hour, hourly.get(target_hour, pd.DataFrame()))
+                except Exception as e:
+                    results.put((target_hour, None, e))
+
+        with ThreadPoolExecutor(max_workers=fetch_workers) as fetch_pool:
+            for block in hour_blocks(hours, hours_per_fetch):
+                fetch_pool.submit(fetch_block, block)
+
+            for done_count in range(1, len(hours) + 1):
+                target_hour, details, error = results.get()
+                if error is None:
+                    manifest.mark_completed(hour_key(target_hour), details)
+                    print(f"[BACKFILL] ({done_count}/{len(hours)}) {hour_key(target_hour)} done in {details['seconds']} s")
+                else:
+                    manifest.mark_failed(hour_key(target_hour), f'{type(error).__name__}: {error}')
+                    print(f"[BACKFILL] ({done_count}/{len(hours)}) {hour_key(target_hour)} FAILED: {error}")
+
+    print(f"[BACKFILL] Finished: {len(manifest.completed)} completed, {len(manifest.failed)} failed "
+          f"(manifest: {manifest.path})")
+    return manifest
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Rebuild gridded NetCDF files and maps for a range of hours.')
+    parser.add_argument('--start', required=True, type=datetime.fromisoformat, help='first hour, e.g. 2025-11-01T00')
+    parser.add_argument('--end', required=True, type=datetime.fromisoformat, help='last hour (inclusive), e.g. 2025-11-30T23')
+    parser.add_argument('--output-dir', default=BACKFILL_DATA_DIR, help='NetCDF root directory')
+    parser.add_argument('--map-dir', default=BACKFILL_MAP_DIR, help='PNG map root directory')
+    parser.add_argument('--manifest', default=None, help=f'checkpoint file (default: <output-dir>/{MANIFEST_FILENAME})')
+    parser.add_argument('--workers', type=int, default=None, help='CPU worker processes (default: all cores)')
+    parser.add_argument('--fetch-workers', type=int, default=FETCH_WORKERS, help='concurrent download blocks')
+    parser.add_argument('--hours-per-fetch', type=int, default=HOURS_PER_FETCH, help='hours per download block')
+    parser.add_argument('--engine', default=generator.GRID_INTERPOLATION_ENGINE, help='interpolation engine (see interpolater.py)')
+    parser.add_argument('--no-maps', action='store_true', help='only write NetCDF files')
+    args = parser.parse_args()
+
+    run_backfill(
+        args.start, args.end, output_dir=args.output_dir, map_dir=args.map_dir, manifest_path=args.manifest,
+        workers=args.workers, fetch_workers=args.fetch_workers, hours_per_fetch=args.hours_per_fetch,
+        engine_name=args.engine, render=not args.no_maps
+    )
@@ -0,0 +1,108 @@
+'''
+Cache of projected, clipped basemap layers for the gridded maps.
+
+Every cartopy add_feature call queries the Natural Earth geometries that touch
+the view, reprojects each one into the axes projection and converts it to a
+matplotlib path, every time a figure is drawn. The geometries come back
+unclipped, so a 10x10 map of Missouri still carries the full outlines of the
+US, Canada and the Great Lakes into every render.
+
+BasemapCache does that work once per (projection, extent): every feature is
+projected, clipped to a slightly padded view box and turned into paths, and
+each later map only adds one PathCollection per feature referencing the same
+cached paths. The cache lives in memory, so long-lived worker processes
+(scheduler, backfill) pay for it once per process.
+
+Author: Nathan Beach
+Last Modified: October 16, 2026
+'''
+
+import threading
+import shapely
+import cartopy.feature as cfeature
+from cartopy.mpl.path import shapely_to_path
+from collections import OrderedDict
+from matplotlib.collections import PathCollection
+from matplotlib.path import Path
+from typing import Any, Dict, List, Sequence, Tuple
+
+# --- Configuration Constants ---
+# Extra margin around the view (fraction of its width/height) kept when clipping, so
+# outline strokes do not stop short of the axes edge
+CLIP_PADDING_FRACTION = 0.02
+# Distinct (projection, extent) layers kept in memory
+BASEMAP_MEMORY_ENTRIES = 16
+# Same default drawing order as cartopy's FeatureArtist: above images, below contours
+FEATURE_ZORDER = 1.5
+
+
+def feature_style(feature: cfeature.Feature, style: Dict[str, Any]) -> Dict[str, Any]:
+    """Matplotlib style for a feature: its own kwargs overridden by `style`, as add_feature does."""
+    merged = {'zorder': FEATURE_ZORDER, **feature.kwargs, **style}
+    if 'color' in merged:
+        merged['facecolor'] = merged['edgecolor'] = merged.pop('color')
+    # cartopy's 'never' means "no fill" for line features
+    if isinstance(merged.get('facecolor'), str) and merged['facecolor'] == 'never':
+        merged['facecolor'] = 'none'
+    return merged
+
+
+class BasemapCache():
+    """
+    Projected and clipped paths of a fixed list of (feature, style) pairs, built once per
+    (projection, extent) and reused by every map drawn on the same view.
+    """
+
+    def __init__(self, features: Sequence[Tuple[cfeature.Feature, Dict[str, Any]]],
+                 memory_entries: int = BASEMAP_MEMORY_ENTRIES):
+        self.features = list(features)
+        self.memory_entries = memory_entries
+        self._layers: 'OrderedDict[tuple, List[Tuple[List[Path], Dict[str, Any]]]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add_to(self, ax) -> List[PathCollection]:
+        """
+        Draws the basemap on a GeoAxes whose extent is already set (ax.set_extent) and
+        returns the added collections.
+        """
+        collections = []
+        for paths, style in self.layers(ax):
+            collection = PathCollection(paths, transform=ax.transData, **style)
+            collection.set_clip_path(ax.patch)
+            ax.add_collection(collection, autolim=False)
+            collections.append(collection)
+        return collections
+
+    def layers(self, ax) -> List[Tuple[List[Path], Dict[str, Any]]]:
+        """Cached (paths, style) per feature for the axes' projection and current extent."""
+        extent = ax.get_extent()
+        key = (ax.projection, tuple(round(v, 6) for v in extent))
+        with self._lock:
+            if key in self._layers:
+                self._layers.move_to_end(key)
+                return self._layers[key]
+
+        layers = self._build(ax, extent)
+        with self._lock:
+            self._layers[key] = layers
+            while len(self._layers) > self.memory_entries:
+                self._layers.popitem(last=False)
+        return layers
+
+    def _build(self, ax, extent: Sequence[float]) -> List[Tuple[List[Path], Dict[str, Any]]]:
+        min_x, max_x, min_y, max_y = extent
+        pad_x = CLIP_PADDING_FRACTION * (max_x - min_x)
+        pad_y = CLIP_PADDING_FRACTION * (max_y - min_y)
+        clip_box = shapely.box(min_x - pad_x, min_y - pad_y, max_x + pad_x, max_y + pad_y)
+
+        layers = []
+        for feature, style in self.features:
+            paths = []
+            for geom in feature.intersecting_geometries(ax.get_extent(feature.crs)):
+                if ax.projection != feature.crs:
+                    geom = ax.projection.project_geometry(geom, feature.crs)
+                geom = geom.intersection(clip_box)
+                if not geom.is_empty:
+                    paths.append(shapely_to_path(geom))
+            layers.append((paths, feature_style(feature, style)))
+        return layers
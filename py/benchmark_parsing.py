@@ -0,0 +1,143 @@
+'''
+Benchmark for the Mesonet bulletin parsing helpers.
+
+Builds a synthetic season-length bulletin (hourly rows for ~6 months), then times
+    - the original row-wise combine_date_time construction against the vectorized
+      mesonet_parser.build_valid_times, and
+    - the original python-engine read_csv (skipfooter=3) against the C-engine
+      mesonet_parser.read_bulletin_block,
+checking in both cases that the old and new paths produce identical output.
+
+Run from the repository root:  python py/benchmark_parsing.py
+
+Author: Nathan Beach
+Last Modified: October 16, 2026
+'''
+
+import io
+import re
+import time
+import numpy as np
+import pandas as pd
+from mesonet_parser import build_valid_times, read_bulletin_block
+
+SEASON_DAYS = 183
+BENCHMARK_YEAR = 2025
+
+
+def _rowwise_combine_date_time(row, year):
+    """Reference copy of the original per-row helper from parse_mesonet_data."""
+    try:
+        month = str(int(row['Month'])).zfill(2)
+        day = str(int(row['Day'])).zfill(2)
+        time_int = row['Time_HHMM']
+
+        if time_int == 2400:
+            dt_str = f"{year}-{month}-{day} 23:59"
+            dt = pd.to_datetime(dt_str, format='%Y-%m-%d %H:%M')
+            return dt + pd.Timedelta(minutes=1)
+        else:
+            time_str = str(int(time_int)).zfill(4)
+            hour = time_str[:-2].zfill(2)
+            minute = time_str[-2:]
+            dt_str = f"{year}-{month}-{day} {hour}:{minute}"
+            return pd.to_datetime(dt_str, format='%Y-%m-%d %H:%M', errors='coerce')
+    except:
+        return pd.NaT
+
+
+def make_season_columns(days: int = SEASON_DAYS) -> pd.DataFrame:
+    """Month/Day/Time_HHMM columns for `days` of hourly bulletin rows (times 100 ... 2400)."""
+    dates = pd.date_range(f'{BENCHMARK_YEAR}-04-01', periods=days, freq='D')
+    df = pd.DataFrame({
+        'Month': np.repeat(dates.month.values, 24).astype(float),
+        'Day': np.repeat(dates.day.values, 24).astype(float),
+        'Time_HHMM': np.tile(np.arange(100, 2500, 100), days),
+    })
+    # Sprinkle in the malformed rows seen in real bulletins
+    df.loc[5, 'Time_HHMM'] = 1260
+    df.loc[6, 'Time_HHMM'] = 2500
+    df.loc[7, 'Month'] = 13
+    df['Time_HHMM'] = df['Time_HHMM'].astype('Int64')
+    return df
+
+
+def benchmark_valid_times(days: int = SEASON_DAYS) -> None:
+    """Times row-wise vs vectorized timestamp construction and verifies they agree."""
+    df = make_season_columns(days)
+    print(f"-> Benchmarking timestamp construction on {len(df)} bulletin rows ({days} days)...")
+
+    t0 = time.perf_counter()
+    rowwise = df.apply(lambda row: _rowwise_combine_date_time(row, BENCHMARK_YEAR), axis=1)
+    rowwise_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    vectorized = build_valid_times(df['Month'], df['Day'], df['Time_HHMM'], BENCHMARK_YEAR)
+    vectorized_s = time.perf_counter() - t0
+
+    rowwise = pd.to_datetime(rowwise)
+    identical = rowwise.equals(vectorized) or (
+        (rowwise.isna() == vectorized.isna()).all() and (rowwise.dropna() == vectorized.dropna()).all()
+    )
+
+    print(f"   - Row-wise apply:  {rowwise_s * 1000:9.1f} ms")
+    print(f"   - Vectorized:      {vectorized_s * 1000:9.1f} ms")
+    print(f"   - Speedup:         {rowwise_s / vectorized_s:9.1f}x")
+    print(f"   - Identical output: {identical}")
+
+
+def make_season_bulletin(days: int = SEASON_DAYS) -> str:
+    """Full <pre> bulletin text (header, 14-column hourly rows, footer) for `days` of data."""
+    rng = np.random.default_rng(0)
+    columns = make_season_columns(days)
+    n = len(columns)
+    header = [
+        '                 University of Missouri Agricultural Weather Station',
+        f'                     Hourly Weather Data   Year = {BENCHMARK_YEAR}',
+        '',
+        'Mon Day Time Temp  Hum   2in   4in   8in  20in  40in   Speed  Dir   Rad    (in)',
+        '-' * 80,
+        '',
+    ]
+    values = np.column_stack([
+        rng.uniform(20, 95, n).round(1), rng.integers(20, 100, n),
+        *[rng.uniform(30, 85, n).round(1) for _ in range(5)],
+        rng.uniform(0, 25, n).round(1), rng.integers(0, 360, n), rng.integers(0, 900, n),
+        rng.uniform(0, 0.3, n).round(2),
+    ])
+    rows = [
+        f'{int(m):6d}{int(d):6d}{int(t):6d} ' + ' '.join(f'{v:6g}' for v in vals)
+        for m, d, t, vals in zip(columns['Month'], columns['Day'], columns['Time_HHMM'], values)
+    ]
+    footer = ['', '', '<a href="index.htm">Back to station list</a>']
+    return '\n'.join(header + rows + footer)
+
+
+def benchmark_block_reader(days: int = SEASON_DAYS) -> None:
+    """Times the python-engine bulletin read against the C-engine block reader."""
+    raw_text = make_season_bulletin(days)
+    lines = raw_text.splitlines()
+    print(f"-> Benchmarking bulletin block reading on {len(lines)} lines ({days} days)...")
+
+    t0 = time.perf_counter()
+    data_line_pattern = re.compile(r'^\s*\d{1,2}\s+\d{1,2}\s+\d{3,4}')
+    start = next(i for i, line in enumerate(lines) if data_line_pattern.match(line))
+    python_df = pd.read_csv(
+        io.StringIO(raw_text), sep=r'\s+', skiprows=start, header=None,
+        engine='python', skipinitialspace=True, skipfooter=3
+    )
+    python_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    c_df = read_bulletin_block(raw_text)
+    c_s = time.perf_counter() - t0
+
+    print(f"   - Python engine:   {python_s * 1000:9.1f} ms")
+    print(f"   - C engine block:  {c_s * 1000:9.1f} ms")
+    print(f"   - Speedup:         {python_s / c_s:9.1f}x")
+    print(f"   - Identical output: {python_df.equals(c_df)}")
+
+
+if __name__ == '__main__':
+    benchmark_valid_times()
+    benchmark_block_reader()
@@ -0,0 +1,126 @@
+'''
+Plain-NumPy kernels for the unit conversions and moisture/wind formulas used by
+the ASOS/Mesonet pipeline.
+
+These reproduce the MetPy (pint) calls in generator.py -- degF -> degC,
+knots/mph -> m/s, relative_humidity_from_dewpoint, dewpoint_from_relative_humidity
+and wind_components -- on bare float arrays, skipping the unit registry entirely.
+NaN inputs propagate to NaN outputs, so no masking is needed. The constants and
+formulations follow MetPy 1.7 (Ambaum 2020 saturation vapor pressure over liquid
+water, Bolton 1980 inversion for dewpoint); run this module directly to validate
+the kernels against MetPy.
+
+Author: Nathan Beach
+Last Modified: October 16, 2026
+'''
+
+import numpy as np
+
+# --- Physical Constants (MetPy 1.7 values) ---
+ZERO_DEGC_K = 273.15
+T0_K = 273.16                  # Triple point of water
+SAT_PRESSURE_0C_PA = 611.2
+LV_0 = 2500840.0               # Latent heat of vaporization at T0 (J/kg)
+CP_L = 4219.4                  # Specific heat of liquid water (J/kg/K)
+CP_V = 1860.078011865639       # Specific heat of water vapor at constant pressure (J/kg/K)
+RV = 461.52311572606084        # Specific gas constant of water vapor (J/kg/K)
+
+KNOTS_TO_MS = 1852.0 / 3600.0
+MPH_TO_MS = 0.44704
+
+# Tolerance used by validate_against_metpy
+VALIDATION_RTOL = 1e-6
+VALIDATION_ATOL = 1e-6
+
+
+def degf_to_degc(temp_f: np.ndarray) -> np.ndarray:
+    """Fahrenheit -> Celsius."""
+    return (np.asarray(temp_f, dtype=float) - 32.0) * (5.0 / 9.0)
+
+
+def knots_to_ms(speed_kt: np.ndarray) -> np.ndarray:
+    """Knots -> meters per second."""
+    return np.asarray(speed_kt, dtype=float) * KNOTS_TO_MS
+
+
+def mph_to_ms(speed_mph: np.ndarray) -> np.ndarray:
+    """Miles per hour -> meters per second."""
+    return np.asarray(speed_mph, dtype=float) * MPH_TO_MS
+
+
+def saturation_vapor_pressure(temp_c: np.ndarray) -> np.ndarray:
+    """Saturation vapor pressure over liquid water (Pa), Ambaum (2020) Eq. 13."""
+    temp_k = np.asarray(temp_c, dtype=float) + ZERO_DEGC_K
+    latent_heat = LV_0 - (CP_L - CP_V) * (temp_k - T0_K)
+    heat_power = (CP_L - CP_V) / RV
+    exp_term = (LV_0 / T0_K - latent_heat / temp_k) / RV
+    return SAT_PRESSURE_0C_PA * (T0_K / temp_k) ** heat_power * np.exp(exp_term)
+
+
+def relative_humidity_from_dewpoint(temp_c: np.ndarray, dewpoint_c: np.ndarray) -> np.ndarray:
+    """Relative humidity (percent) from air temperature and dewpoint (degC)."""
+    return 100.0 * saturation_vapor_pressure(dewpoint_c) / saturation_vapor_pressure(temp_c)
+
+
+def dewpoint_from_relative_humidity(temp_c: np.ndarray, rh_percent: np.ndarray) -> np.ndarray:
+    """Dewpoint (degC) from air temperature (degC) and relative humidity (percent)."""
+    vapor_pressure = (np.asarray(rh_percent, dtype=float) / 100.0) * saturation_vapor_pressure(temp_c)
+    val = np.log(vapor_pressure / SAT_PRESSURE_0C_PA)
+    return 243.5 * val / (17.67 - val)
+
+
+def wind_components(speed: np.ndarray, direction_deg: np.ndarray):
+    """(u, v) wind components in the units of `speed` from meteorological direction (degrees)."""
+    speed = np.asarray(speed, dtype=float)
+    direction_rad = np.deg2rad(np.asarray(direction_deg, dtype=float))
+    return -speed * np.sin(direction_rad), -speed * np.cos(direction_rad)
+
+
+def validate_against_metpy(n: int = 10000, seed: int = 0) -> bool:
+    """Compares every kernel with its MetPy equivalent on random inputs (with NaNs)."""
+    import metpy.calc as mpcalc
+    from metpy.units import units
+
+    rng = np.random.default_rng(seed)
+    temp_f = rng.uniform(-30, 115, n)
+    dewpoint_f = temp_f - rng.uniform(0, 40, n)
+    rh_percent = rng.uniform(1, 100, n)
+    speed = rng.uniform(0, 60, n)
+    direction = rng.uniform(0, 360, n)
+    for arr in (temp_f, dewpoint_f, rh_percent, speed, direction):
+        arr[rng.random(n) < 0.05] = np.nan
+
+    temp_q = temp_f * units.degF
+    dewpoint_q = dewpoint_f * units.degF
+    u_ref, v_ref = mpcalc.wind_components(speed * units.knots, direction * units.degrees)
+    u_fast, v_fast = wind_components(knots_to_ms(speed), direction)
+
+    checks = {
+        'degf_to_degc': (degf_to_degc(temp_f), temp_q.to('degC').magnitude),
+        'knots_to_ms': (knots_to_ms(speed), (speed * units.knots).to('m/s').magnitude),
+        'mph_to_ms': (mph_to_ms(speed), (speed * units('mile/hour')).to('m/s').magnitude),
+        'relative_humidity_from_dewpoint': (
+            relative_humidity_from_dewpoint(degf_to_degc(temp_f), degf_to_degc(dewpoint_f)),
+            mpcalc.relative_humidity_from_dewpoint(temp_q.to('K'), dewpoint_q.to('K')).to('percent').magnitude,
+        ),
+        'dewpoint_from_relative_humidity': (
+            dewpoint_from_relative_humidity(degf_to_degc(temp_f), rh_percent),
+            mpcalc.dewpoint_from_relative_humidity(temp_q.to('K'), rh_percent * units.percent).to('degC').magnitude,
+        ),
+        'wind_components_u': (u_fast, u_ref.to('m/s').magnitude),
+        'wind_components_v': (v_fast, v_ref.to('m/s').magnitude),
+    }
+
+    all_ok = True
+    for name, (fast, reference) in checks.items():
+        ok = np.allclose(fast, reference, rtol=VALIDATION_RTOL, atol=VALIDATION_ATOL, equal_nan=True)
+        max_err = np.nanmax(np.abs(fast - reference))
+        print(f"   - {name:<34} max abs diff {max_err:.3e}  {'OK' if ok else 'FAILED'}")
+        all_ok = all_ok and ok
+    return all_ok
+
+
+if __name__ == '__main__':
+    print("-> Validating NumPy kernels against MetPy...")
+    passed = validate_against_metpy()
+    print(f"-> Validation {'passed' if passed else 'FAILED'}.")
@@ -10,128 +10,264 @@ Last Modified: December 2, 2025
 # Required Imports
 import numpy as np
 import requests
-import io
 import pandas as pd
 import xarray as xr
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import os # NEW: Added os for file path management
-# Import SciPy for stable gridding
-import scipy.interpolate as si 
 import metpy.calc as mpcalc
 from metpy.units import units
 import cartopy.crs as ccrs
 import cartopy.feature as cfeature
 import matplotlib.pyplot as plt
 import re
-from typing import Dict, Any, List
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, Any, List, Optional, Tuple
+import http_client
+from response_cache import ResponseCache, FrameCache, WeightCache
+from mesonet_parser import DATA_LINE_PATTERN, build_valid_times, read_bulletin_block
+import fast_calc
+from station_registry import load_registry
+from interpolater import InterpolationEngine, CachedOperatorEngine, make_engine
+from basemap_cache import BasemapCache
+from plot_variables import PLOT_VARIABLES, VARIABLE_TO_FILENAME, map_filename
 
 # --- Configuration Constants ---
 # Approximate bounds for Missouri for mapping and gridding
 MISSOURI_BOUNDS = [-95.5, -89.0, 36.0, 40.7] # [min_lon, max_lon, min_lat, max_lat]
 GRID_RESOLUTION_KM = 3
+# Default interpolation backend for regrid_and_save (see interpolater.py: 'idw', 'barnes', 'linear', 'cubic', 'rbf')
+GRID_INTERPOLATION_ENGINE = 'cubic'
 # ASOS URL (network specified)
 ASOS_BASE_URL = 'https://mesonet.agron.iastate.edu/cgi-bin/request/asos.py?network=MO_ASOS'
 # Mesonet Base URL
 MESONET_BASE_URL = 'http://agebb.missouri.edu/weather/stations/'
+# Maximum number of Mesonet bulletin pages fetched at once (1 = sequential fetching)
+MESONET_MAX_WORKERS = 8
+# Use the plain-NumPy kernels in fast_calc.py instead of MetPy/pint for unit conversions
+# and RH/dewpoint/wind calculations (validated against MetPy: python py/fast_calc.py)
+FAST_UNIT_MODE = False
 
 # --- File Saving Configuration (Relative to the 'py' folder) ---
 BASE_DATA_DIR = os.path.join('.', 'Data')
 BASE_MAP_DIR = os.path.join('.', 'images', 'maps', 'full')
 
-# Mapping from xarray variable name to final PNG filename suffix
-VARIABLE_TO_FILENAME = {
-    'T_2m': 'air_temp',
-    'Td_2m': 'dew_point',
-    'RH': 'relative_humidity',
-    'WS': 'wind_speed',
-    'WG': 'wind_gust',
-    'ST_2in': 'soil_temp_2in',
-    'ST_4in': 'soil_temp_4in',
-}
+# --- Raw Response Cache Configuration ---
+# Set USE_RESPONSE_CACHE = False to always hit the network
+USE_RESPONSE_CACHE = True
+RESPONSE_CACHE_DIR = os.path.join(BASE_DATA_DIR, 'cache', 'responses')
+RESPONSE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+# Per-source time-to-live (seconds): archived ASOS hours are stable, Mesonet bulletins roll forward
+ASOS_CACHE_TTL = 7 * 24 * 3600
+MESONET_CACHE_TTL = 24 * 3600
+# Reports keep arriving (late and corrected observations) for this long after an hour ends;
+# responses covering newer data are used but never cached, so a still-filling hour is not replayed
+CACHE_SETTLE_SECONDS = 2 * 3600
+# First bytes of a valid ASOS CSV body (IEM reports errors as HTTP 200 text)
+ASOS_CSV_HEADER = 'station,'
+# Longest span downloaded in a single ASOS request when fetching a date/hour range
+ASOS_DAYS_PER_REQUEST = 7
+# Only these ASOS variables are requested from IEM and parsed (besides station/valid/lat/lon)
+ASOS_DATA_FIELDS = ['tmpf', 'dwpf', 'drct', 'sknt', 'gust']
+ASOS_CSV_COLUMNS = ['station', 'valid', 'lon', 'lat'] + ASOS_DATA_FIELDS
+ASOS_CSV_DTYPES = {'station': str, 'valid': str, **{col: 'float64' for col in ['lon', 'lat'] + ASOS_DATA_FIELDS}}
+ASOS_NA_VALUES = ['M', 'T', '', "null"]
+RESPONSE_CACHE = ResponseCache(RESPONSE_CACHE_DIR, max_bytes=RESPONSE_CACHE_MAX_BYTES)
+# Parsed, unit-converted Mesonet frames keyed by station and bulletin revision (memory + disk)
+MESONET_FRAME_CACHE_DIR = os.path.join(BASE_DATA_DIR, 'cache', 'mesonet_frames')
+MESONET_FRAME_CACHE = FrameCache(MESONET_FRAME_CACHE_DIR, max_bytes=RESPONSE_CACHE_MAX_BYTES)
+# Part of every parsed-frame cache key: bump whenever parse_mesonet_data, mesonet_parser or the
+# Mesonet unit conversions change what a frame contains, so frames parsed by older code are not reused
+MESONET_FRAME_VERSION = 2
+# Station -> grid weight matrices of linear interpolation engines, reused across hours (memory + disk)
+USE_WEIGHT_CACHE = True
+WEIGHT_CACHE_DIR = os.path.join(BASE_DATA_DIR, 'cache', 'weights')
+WEIGHT_CACHE = WeightCache(WEIGHT_CACHE_DIR, max_bytes=RESPONSE_CACHE_MAX_BYTES)
 
-# --- Mesonet Station Metadata ---
-# This list is used to iterate over all Mesonet stations
-MESONET_URL_LIST = [
-    'http://agebb.missouri.edu/weather/stations/boone/bull75s.htm',
-    'http://agebb.missouri.edu/weather/stations/audrain/bull65s.htm',
-    'http://agebb.missouri.edu/weather/stations/audrain/bull20s.htm',
-    'http://agebb.missouri.edu/weather/stations/atchison/bull5s.htm',
-    'http://agebb.missouri.edu/weather/stations/boone/bull70s.htm',
-    'http://agebb.missouri.edu/weather/stations/boone/bull75s.htm',
-    'http://agebb.missouri.edu/weather/stations/sanborn/bull35s.htm',
-    'http://agebb.missouri.edu/weather/stations/boone/bull30s.htm',
-    'http://agebb.missouri.edu/weather/stations/buchanan/bull10s.htm',
-    "http://agebb.missouri.edu/weather/stations/callaway/bull55s.htm",
-    'http://agebb.missouri.edu/weather/stations/carroll/bull40s.htm',
-    'http://agebb.missouri.edu/weather/stations/gentry/bull15s.htm',
-    'http://agebb.missouri.edu/weather/stations/knox/bull25s.htm',
-    "http://agebb.missouri.edu/weather/stations/lafayette/bull110s.htm",
-    'http://agebb.missouri.edu/weather/stations/lawrence/bull85t.htm',
-    'http://agebb.missouri.edu/weather/stations/lincoln/bull90s.htm',
-    'http://agebb.missouri.edu/weather/stations/linn/bull45s.htm',
-    'http://agebb.missouri.edu/weather/stations/morgan/bull60t.htm',
-    'http://agebb.missouri.edu/weather/stations/monroe/bull50s.htm',
-    'http://agebb.missouri.edu/weather/stations/putnam/bull95s.htm',
-    'http://agebb.missouri.edu/weather/stations/saline/bull100s.htm',
-    'http://agebb.missouri.edu/weather/stations/stlouiscity/bull105s.htm',
-    'http://agebb.missouri.edu/weather/stations/wright/bull80t.htm'
+# Basemap layers under every gridded map (feature, add_feature style), projected and clipped
+# once per extent by BASEMAP_CACHE instead of on every render
+BASEMAP_FEATURES = [
+    (cfeature.LAND, {'facecolor': 'lightgray'}),
+    (cfeature.OCEAN, {'facecolor': 'lightblue'}),
+    (cfeature.BORDERS, {'linestyle': ':'}),
+    (cfeature.NaturalEarthFeature(category='cultural', name='admin_1_states_provinces_lines', scale='50m', facecolor='none'),
+     {'edgecolor': 'black', 'linewidth': 1.0}),
+    (cfeature.LAKES, {'alpha': 0.5}),
 ]
+BASEMAP_CACHE = BasemapCache(BASEMAP_FEATURES)
 
-# Manual Metadata for this specific station URL
-STATION_METADATA: Dict[str, Dict[str, Any]] = {
-    "bull5": {"station_id": "GravesMemorial_Atchison", "lat": 39.75, "lon": -94.79, "year": 2025},
-    "bull10": {"station_id": "StJoe_Buchanan", "lat": 37.49, "lon": -94.31, "year": 2025},
-    "bull15": {"station_id": "Albany_Gentry", "lat": 40.24, "lon": -94.34, "year": 2025},
-    "bull20": {"station_id": "Auxvasse_Audrain", "lat": 39.30, "lon": -91.51, "year": 2025},
-    "bull25": {"station_id": "Greenley_Knox", "lat": 40.01, "lon": -92.19, "year": 2025},
-    "bull30": {"station_id": "SouthFarm_boone", "lat": 38.92, "lon": -92.33, "year": 2025},
-    "bull35": {"station_id": "Sanborn_Boone", "lat": 38.93, "lon": -92.32, "year": 2025},
-    "bull40": {"station_id": "Brunswick_carroll", "lat": 39.41, "lon": -93.19, "year": 2025},
-    "bull45": {"station_id": "Linneus_Linn", "lat": 39.63, "lon": -91.72, "year": 2025},
-    "bull50": {"station_id": "MonroeCity_Monroe", "lat": 39.33, "lon": -92.02, "year": 2025},
-    "bull55": {"station_id": "Williamsburg_Callaway", "lat": 38.90, "lon": -91.73, "year": 2025},
-    "bull60": {"station_id": "Versailles_Morgan", "lat": 38.43, "lon": -92.85, "year": 2025},
-    "bull65": {"station_id": "Van-Far_Audrian", "lat": 39.30, "lon": -91.51, "year": 2025},
-    "bull70": {'station_id': 'Bradford_Boone', 'lat': 38.93, 'lon': -92.32, 'year': 2025},
-    "bull75": {'station_id': 'CapenPark_Boone', 'lat': 38.93, 'lon': -92.32, 'year': 2025},
-    "bull80": {"station_id": "MountainGrove_Wright", "lat": 37.15, "lon": -92.26, "year": 2025}, 
-    "bull85": {"station_id": "MountVernon_Lawrence", "lat": 37.07, "lon": -93.87, "year": 2025},
-    "bull90": {"station_id": "Moscow_Lincoln", "lat": 38.93, "lon": -90.93, "year": 2025},
-    "bull95": {"station_id": "Unionville_Putnam", "lat": 40.46, "lon": -93.00, "year": 2025},
-    "bull100": {"station_id": "Marshall_Saline", "lat": 39.12, "lon": -92.21, "year": 2025},
-    "bull105": {"station_id": "StScienceCenter_StLouisCity", "lat": 38.63, "lon": -90.27, "year": 2025},
-    "bull110": {"station_id": "Alma_Lafayette", "lat": 39.09, "lon": -93.55, "year": 2025},
-}
+# Map render processes used by process_and_map_data (1: render in this process; None: every core)
+RENDER_WORKERS = 1
+
+# --- Mesonet Station Metadata ---
+# Stations come from the shared registry (Data/station_registry.csv, see station_registry.py)
+STATION_REGISTRY = load_registry()
+# Year stamped on the Mesonet bulletins' Month/Day/Time rows
+MESONET_BULLETIN_YEAR = 2025
+# This list is used to iterate over all Mesonet stations
+MESONET_URL_LIST = STATION_REGISTRY.mesonet_urls()
+# Static metadata keyed by the bull# identifier in each station URL
+STATION_METADATA: Dict[str, Dict[str, Any]] = STATION_REGISTRY.mesonet_metadata(MESONET_BULLETIN_YEAR)
 # Regex to extract the unique bull# identifier from the URL path
 BULL_ID_PATTERN = re.compile(r'/(bull\d+)[st]\.htm', re.IGNORECASE)
+# Fixed offset for LST -> UTC conversion (Missouri is UTC-6 during standard time)
+LST_TO_UTC_OFFSET = timedelta(hours=6)
+
+
+# --- Fast (pint-free) Unit Conversion ---
+
+def _convert_asos_units_fast(df: pd.DataFrame) -> None:
+    """FAST_UNIT_MODE version of the ASOS unit conversion and RH/wind calculation (in place)."""
+    tmpf = pd.to_numeric(df['tmpf'], errors='coerce').values
+    dwpf = pd.to_numeric(df['dwpf'], errors='coerce').values
+    df['sknt'] = pd.to_numeric(df['sknt'], errors='coerce')
+    df['drct'] = pd.to_numeric(df['drct'], errors='coerce')
+    df['gust'] = pd.to_numeric(df['gust'], errors='coerce')
+    
+    df['air_temp_c'] = fast_calc.degf_to_degc(tmpf)
+    df['dew_point_c'] = fast_calc.degf_to_degc(dwpf)
+    df['rh_percent'] = fast_calc.relative_humidity_from_dewpoint(df['air_temp_c'].values, df['dew_point_c'].values)
+    
+    df['wind_speed_ms'] = fast_calc.knots_to_ms(df['sknt'].values)
+    df['wind_gust_ms'] = fast_calc.knots_to_ms(df['gust'].values)
+    df['u'], df['v'] = fast_calc.wind_components(df['wind_speed_ms'].values, df['drct'].values)
+
+def _convert_mesonet_units_fast(df: pd.DataFrame) -> None:
+    """FAST_UNIT_MODE version of the Mesonet unit conversion and dewpoint/wind calculation (in place)."""
+    tair_f = pd.to_numeric(df['Air_Temp_F'], errors='coerce').values
+    rel_hum = pd.to_numeric(df['Rel_Hum_pct'], errors='coerce').values
+    
+    df['air_temp_c'] = fast_calc.degf_to_degc(tair_f)
+    df['dew_point_c'] = fast_calc.dewpoint_from_relative_humidity(df['air_temp_c'].values, rel_hum)
+    df['rh_percent'] = rel_hum
+    
+    df['soil_temp_2in_c'] = fast_calc.degf_to_degc(pd.to_numeric(df['Soil_Temp_2in_F'], errors='coerce').values)
+    df['soil_temp_4in_c'] = fast_calc.degf_to_degc(pd.to_numeric(df['Soil_Temp_4in_F'], errors='coerce').values)
+    
+    wind_speed_ms = fast_calc.mph_to_ms(pd.to_numeric(df['Wind_Speed_MPH'], errors='coerce').values)
+    wind_dir_deg = pd.to_numeric(df['Wind_Dir_Deg'], errors='coerce').values
+    df['u'], df['v'] = fast_calc.wind_components(wind_speed_ms, wind_dir_deg)
+    df['wind_speed_ms'] = wind_speed_ms
+    df['wind_gust_ms'] = np.nan
 
 
 # --- ASOS Fetching and Processing ---
 
-def _build_asos_url(date_time: datetime) -> str:
-    """Builds the ASOS request URL."""
-    year, month, day, hour = date_time.year, date_time.month, date_time.day, date_time.hour
+def _build_asos_url(start_time: datetime, end_time: Optional[datetime] = None) -> str:
+    """
+    Builds the ASOS request URL for the window [start_time, end_time), asking only for ASOS_DATA_FIELDS.
+    Defaults to the single hour starting at `start_time`.
+    """
+    if end_time is None:
+        end_time = start_time + timedelta(hours=1)
+    data_params = ''.join(f'&data={field}' for field in ASOS_DATA_FIELDS)
     query_params = (
-        f'&data=all&year1={year}&month1={month}&day1={day}&hour1={hour}&'
-        f'year2={year}&month2={month}&day2={day}&hour2={hour+1}&tz=Etc%2FUTC&format=onlycomma&'
-        'latlon=yes&elev=yes&missing=null&trace=T&direct=no&report_type=3&report_type=4'
+        f'{data_params}&year1={start_time.year}&month1={start_time.month}&day1={start_time.day}&hour1={start_time.hour}&'
+        f'year2={end_time.year}&month2={end_time.month}&day2={end_time.day}&hour2={end_time.hour}&tz=Etc%2FUTC&format=onlycomma&'
+        'latlon=yes&missing=null&trace=T&direct=no&report_type=3&report_type=4'
     )
     return f'{ASOS_BASE_URL}{query_params}'
 
+def _read_asos_csv(source, start_time: datetime, end_time: datetime) -> pd.DataFrame:
+    """
+    Parses an ASOS CSV (file path or open stream) chunk by chunk with fixed columns/dtypes,
+    keeping only reports inside [start_time, end_time) as they are read.
+    """
+    def in_window(chunk: pd.DataFrame) -> pd.DataFrame:
+        chunk['valid'] = pd.to_datetime(chunk['valid'])
+        return chunk[(chunk['valid'] >= start_time) & (chunk['valid'] < end_time)]
+
+    return http_client.read_csv_chunks(
+        source, usecols=ASOS_CSV_COLUMNS, dtype=ASOS_CSV_DTYPES, na_values=ASOS_NA_VALUES, chunk_filter=in_window
+    )
+
+def _has_settled(data_end: datetime) -> bool:
+    """True once every report up to `data_end` (naive UTC) should have arrived, so its response may be cached."""
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return (now - data_end).total_seconds() >= CACHE_SETTLE_SECONDS
+
+
+def _is_asos_csv(path: str) -> bool:
+    """Checks that a cached ASOS body starts with the CSV header rather than an error message."""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return f.readline().startswith(ASOS_CSV_HEADER)
+
+
+def fetch_asos_range(start_time: datetime, end_time: datetime, days_per_request: int = ASOS_DAYS_PER_REQUEST) -> pd.DataFrame:
+    """
+    Downloads every raw ASOS report in [start_time, end_time), splitting long ranges
+    into requests of at most `days_per_request` days. Responses are streamed (to the
+    response cache when enabled) and parsed in chunks, so only the reports in the window
+    are held in memory. Returns them with a parsed 'valid' column (empty DataFrame if
+    nothing could be fetched).
+    """
+    chunks: List[pd.DataFrame] = []
+    chunk_start = start_time
+    while chunk_start < end_time:
+        chunk_end = min(chunk_start + timedelta(days=days_per_request), end_time)
+        url = _build_asos_url(chunk_start, chunk_end)
+        
+        # Ranges reaching into the last CACHE_SETTLE_SECONDS are still filling: always fetch them fresh
+        use_cache = USE_RESPONSE_CACHE and _has_settled(chunk_end)
+        cached_path = RESPONSE_CACHE.get_path(url, chunk_start, ASOS_CACHE_TTL) if use_cache else None
+        try:
+            if cached_path is not None:
+                print(f"[ASOS] Using cached response for {chunk_start.isoformat()} -> {chunk_end.isoformat()} (no network request).")
+                chunks.append(_read_asos_csv(cached_path, chunk_start, chunk_end))
+            else:
+                with http_client.get(url, timeout=30, stream=True) as response:
+                    if use_cache:
+                        cached_path = RESPONSE_CACHE.put_stream(
+                            url, chunk_start, response.iter_content(chunk_size=http_client.STREAM_BLOCK_BYTES)
+                        )
+                        if cached_path is not None and not _is_asos_csv(cached_path):
+                            RESPONSE_CACHE.discard(url, chunk_start)
+                            raise ValueError('response is not an ASOS CSV (not cached)')
+                    if cached_path is not None:
+                        chunks.append(_read_asos_csv(cached_path, chunk_start, chunk_end))
+                    else:
+                        response.raw.decode_content = True
+                        chunks.append(_read_asos_csv(response.raw, chunk_start, chunk_end))
+        except requests.exceptions.RequestException as e:
+            print(f"[ERROR] Failed to fetch ASOS data: {e}")
+        except ValueError as e:
+            print(f"[ERROR] Could not parse ASOS response for {chunk_start.isoformat()}: {e}")
+        chunk_start = chunk_end
+
+    chunks = [chunk for chunk in chunks if not chunk.empty]
+    if not chunks:
+        return pd.DataFrame()
+    
+    df = pd.concat(chunks, ignore_index=True)
+    # Every report carries its station's coordinates: fill registry stations still missing them
+    STATION_REGISTRY.fill_coordinates(df[['station', 'lat', 'lon']])
+    return df
+
 def fetch_and_process_asos(target_datetime: datetime) -> pd.DataFrame:
     """Fetches raw ASOS data, standardizes units, and filters reports."""
     print(f"\n[ASOS] Fetching raw ASOS data for {target_datetime.isoformat()}...")
-    url = _build_asos_url(target_datetime)
-    
-    try:
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-    except requests.exceptions.RequestException as e:
-        print(f"[ERROR] Failed to fetch ASOS data: {e}")
+    df = fetch_asos_range(target_datetime, target_datetime + timedelta(hours=1))
+    return process_asos_reports(df, target_datetime)
+
+def fetch_and_process_asos_range(start_time: datetime, end_time: datetime) -> Dict[datetime, pd.DataFrame]:
+    """
+    Batched version of fetch_and_process_asos for every whole hour in [start_time, end_time].
+    The full range is downloaded once and split in memory, returning {target hour: reports}.
+    """
+    print(f"\n[ASOS] Fetching raw ASOS data for {start_time.isoformat()} -> {end_time.isoformat()}...")
+    target_hours = list(pd.date_range(start_time, end_time, freq='h').to_pydatetime())
+    df = fetch_asos_range(start_time, end_time + timedelta(hours=1))
+    return {target_hour: process_asos_reports(df, target_hour) for target_hour in target_hours}
+
+def process_asos_reports(df: pd.DataFrame, target_datetime: datetime) -> pd.DataFrame:
+    """Selects the best report per station for one target hour, standardizes units, and computes RH/wind."""
+    if df.empty:
+        print(f"[ASOS] No ASOS reports available for {target_datetime.isoformat()}.")
         return pd.DataFrame()
     
-    df = pd.read_csv(io.StringIO(response.text), na_values=['M', 'T', '', "null", ""])
-    df['valid'] = pd.to_datetime(df['valid'])
+    # Restrict to the hour a single-hour request would have returned
+    df = df[(df['valid'] >= target_datetime) & (df['valid'] < target_datetime + timedelta(hours=1))].copy()
     
     # Filtering Logic (30-minute window for ASOS)
     start_time = target_datetime
@@ -143,6 +279,8 @@ def fetch_and_process_asos(target_datetime: datetime) -> pd.DataFrame:
         print("[ASOS] Warning: No data in window. Trying nearest time across the day.")
         df['time_diff'] = abs(df['valid'] - target_datetime)
         df_filtered = df[df['time_diff'] == df['time_diff'].min()] if not df.empty else pd.DataFrame()
+        if df_filtered.empty:
+            return pd.DataFrame()
     else:
         # Select report closest to start_time for each station
         df_window['time_diff'] = abs(df_window['valid'] - start_time)
@@ -151,38 +289,41 @@ def fetch_and_process_asos(target_datetime: datetime) -> pd.DataFrame:
     df_filtered = df_filtered.dropna(subset=['lat', 'lon']).reset_index(drop=True)
 
     # Unit Conversion and Calculation (ASOS)
-    tair_f = df_filtered['tmpf'].values * units.degF
-    tdew_f = df_filtered['dwpf'].values * units.degF
-    df_filtered['air_temp_c'] = tair_f.to('degC').magnitude
-    df_filtered['dew_point_c'] = tdew_f.to('degC').magnitude
-    
-    # RH Calculation
-    valid_mask = (~np.isnan(tair_f.magnitude)) & (~np.isnan(tdew_f.magnitude))
-    rh_values = np.full_like(df_filtered['air_temp_c'].values, np.nan)
-    rh_calc = mpcalc.relative_humidity_from_dewpoint(tair_f[valid_mask].to('K'), tdew_f[valid_mask].to('K'))
-    rh_values[valid_mask] = rh_calc.to('percent').magnitude
-    df_filtered['rh_percent'] = rh_values
-    
-    # Wind Calculation
-    df_filtered['sknt'] = pd.to_numeric(df_filtered['sknt'], errors='coerce').fillna(np.nan)
-    df_filtered['drct'] = pd.to_numeric(df_filtered['drct'], errors='coerce').fillna(np.nan)
-    df_filtered['gust'] = pd.to_numeric(df_filtered['gust'], errors='coerce').fillna(np.nan) 
-    
-    wind_valid_mask = (~np.isnan(df_filtered['sknt'])) & (~np.isnan(df_filtered['drct']))
-    u_values = np.full_like(df_filtered['air_temp_c'].values, np.nan)
-    v_values = np.full_like(df_filtered['air_temp_c'].values, np.nan)
-    
-    u_knots, v_knots = mpcalc.wind_components(
-        df_filtered['sknt'][wind_valid_mask].values * units.knots,
-        df_filtered['drct'][wind_valid_mask].values * units.degrees
-    )
-    u_values[wind_valid_mask] = u_knots.to('m/s').magnitude
-    v_values[wind_valid_mask] = v_knots.to('m/s').magnitude
+    if FAST_UNIT_MODE:
+        _convert_asos_units_fast(df_filtered)
+    else:
+        tair_f = df_filtered['tmpf'].values * units.degF
+        tdew_f = df_filtered['dwpf'].values * units.degF
+        df_filtered['air_temp_c'] = tair_f.to('degC').magnitude
+        df_filtered['dew_point_c'] = tdew_f.to('degC').magnitude
+    
+        # RH Calculation
+        valid_mask = (~np.isnan(tair_f.magnitude)) & (~np.isnan(tdew_f.magnitude))
+        rh_values = np.full_like(df_filtered['air_temp_c'].values, np.nan)
+        rh_calc = mpcalc.relative_humidity_from_dewpoint(tair_f[valid_mask].to('K'), tdew_f[valid_mask].to('K'))
+        rh_values[valid_mask] = rh_calc.to('percent').magnitude
+        df_filtered['rh_percent'] = rh_values
+    
+        # Wind Calculation
+        df_filtered['sknt'] = pd.to_numeric(df_filtered['sknt'], errors='coerce').fillna(np.nan)
+        df_filtered['drct'] = pd.to_numeric(df_filtered['drct'], errors='coerce').fillna(np.nan)
+        df_filtered['gust'] = pd.to_numeric(df_filtered['gust'], errors='coerce').fillna(np.nan) 
+    
+        wind_valid_mask = (~np.isnan(df_filtered['sknt'])) & (~np.isnan(df_filtered['drct']))
+        u_values = np.full_like(df_filtered['air_temp_c'].values, np.nan)
+        v_values = np.full_like(df_filtered['air_temp_c'].values, np.nan)
+    
+        u_knots, v_knots = mpcalc.wind_components(
+            df_filtered['sknt'][wind_valid_mask].values * units.knots,
+            df_filtered['drct'][wind_valid_mask].values * units.degrees
+        )
+        u_values[wind_valid_mask] = u_knots.to('m/s').magnitude
+        v_values[wind_valid_mask] = v_knots.to('m/s').magnitude
     
-    df_filtered['u'] = u_values
-    df_filtered['v'] = v_values
-    df_filtered['wind_speed_ms'] = (df_filtered['sknt'].values * units.knots).to('m/s').magnitude
-    df_filtered['wind_gust_ms'] = (df_filtered['gust'].values * units.knots).to('m/s').magnitude
+        df_filtered['u'] = u_values
+        df_filtered['v'] = v_values
+        df_filtered['wind_speed_ms'] = (df_filtered['sknt'].values * units.knots).to('m/s').magnitude
+        df_filtered['wind_gust_ms'] = (df_filtered['gust'].values * units.knots).to('m/s').magnitude
 
     # Final standardized columns for ASOS
     final_cols = ['station', 'valid', 'lat', 'lon', 'air_temp_c', 'dew_point_c', 'rh_percent', 
@@ -198,17 +339,31 @@ def fetch_and_process_asos(target_datetime: datetime) -> pd.DataFrame:
 
 # --- Mesonet Fetching and Processing ---
 
-def fetch_and_extract_pre_tag(url: str) -> str:
-    """Fetches HTML and extracts the raw text block found inside the <pre> tag."""
+def fetch_and_extract_pre_tag(url: str, target_datetime: Optional[datetime] = None) -> str:
+    """
+    Fetches HTML and extracts the raw text block found inside the <pre> tag.
+    When a target hour is given the extracted block is served from / stored in the
+    on-disk response cache, once that hour has settled (CACHE_SETTLE_SECONDS) and only if
+    the block contains bulletin data rows.
+    """
+    use_cache = (USE_RESPONSE_CACHE and target_datetime is not None
+                 and _has_settled(target_datetime + timedelta(hours=1)))
+    if use_cache:
+        cached_text = RESPONSE_CACHE.get(url, target_datetime, MESONET_CACHE_TTL)
+        if cached_text is not None:
+            return cached_text
+
     try:
-        response = requests.get(url, timeout=15)
-        response.raise_for_status()
+        result = http_client.conditional_get(url, timeout=15)
     except requests.exceptions.RequestException as e:
         print(f"[ERROR] Failed to fetch URL {url}: {e}")
         return ""
 
-    pre_match = re.search(r'<pre>(.*?)</pre>', response.text, re.DOTALL | re.IGNORECASE)
-    return pre_match.group(1).strip() if pre_match else ""
+    pre_match = re.search(r'<pre>(.*?)</pre>', result.text, re.DOTALL | re.IGNORECASE)
+    raw_text = pre_match.group(1).strip() if pre_match else ""
+    if use_cache and DATA_LINE_PATTERN.search(raw_text):
+        RESPONSE_CACHE.put(url, target_datetime, raw_text)
+    return raw_text
 
 def parse_mesonet_data(raw_text: str, metadata: dict) -> pd.DataFrame:
     """
@@ -217,24 +372,7 @@ def parse_mesonet_data(raw_text: str, metadata: dict) -> pd.DataFrame:
     """
     print(f"       -[MESONET] Parsing data for station: {metadata['station_id']}...")
     
-    # 1. Dynamic Skip Line Calculation
-    lines = raw_text.splitlines()
-    data_start_line = -1
-    # Find the first line starting with numerical date/time data
-    data_line_pattern = re.compile(r'^\s*\d{1,2}\s+\d{1,2}\s+\d{3,4}')
-
-    for i, line in enumerate(lines):
-        if data_line_pattern.match(line):
-            data_start_line = i
-            break
-
-    if data_start_line == -1:
-        print(f"[ERROR] Could not find the start of the hourly data block for {metadata['station_id']}. Skipping.")
-        return pd.DataFrame()
-    
-    SKIP_LINES_DYNAMIC = data_start_line
-    
-    # 2. Extract Year
+    # 1. Extract Year
     year_match = re.search(r'Year\s*=\s*(\d{4})', raw_text)
     data_year = int(year_match.group(1)) if year_match else metadata.get('year', datetime.now().year)
         
@@ -247,17 +385,17 @@ def parse_mesonet_data(raw_text: str, metadata: dict) -> pd.DataFrame:
     ]
     
     try:
-        # Read the entire block of data starting from the dynamic line.
+        # 2. Locate the data block (first month/day/time line through the last numeric row,
+        # skipping header and footer lines) and read it with the C engine.
         # Use header=None initially to get raw columns.
-        df_raw = pd.read_csv(
-            io.StringIO(raw_text), sep='\s+', 
-            skiprows=SKIP_LINES_DYNAMIC, header=None,
-            engine='python', skipinitialspace=True, 
-            skipfooter=3
-        )
+        df_raw = read_bulletin_block(raw_text)
     except Exception as e:
         print(f"[ERROR] Mesonet read_csv failed for {metadata['station_id']}: {e}")
         return pd.DataFrame()
+    
+    if df_raw is None:
+        print(f"[ERROR] Could not find the start of the hourly data block for {metadata['station_id']}. Skipping.")
+        return pd.DataFrame()
         
     # --- Dynamic Column Mapping (CRITICAL FIX) ---
     df_raw = df_raw.dropna(how='all', axis=1)
@@ -303,27 +441,8 @@ def parse_mesonet_data(raw_text: str, metadata: dict) -> pd.DataFrame:
     df['Time_HHMM'] = df['Time_HHMM'].astype('Int64', errors='ignore')
     df = df.dropna(subset=['Time_HHMM', 'Month', 'Day'])
     
-    # 3. Create Datetime Column (Naive LST)
-    def combine_date_time(row, year):
-        try:
-            month = str(int(row['Month'])).zfill(2)
-            day = str(int(row['Day'])).zfill(2)
-            time_int = row['Time_HHMM']
-            
-            if time_int == 2400:
-                dt_str = f"{year}-{month}-{day} 23:59"
-                dt = pd.to_datetime(dt_str, format='%Y-%m-%d %H:%M')
-                return dt + pd.Timedelta(minutes=1)
-            else:
-                time_str = str(int(time_int)).zfill(4) 
-                hour = time_str[:-2].zfill(2)
-                minute = time_str[-2:]
-                dt_str = f"{year}-{month}-{day} {hour}:{minute}"
-                return pd.to_datetime(dt_str, format='%Y-%m-%d %H:%M', errors='coerce')
-        except:
-            return pd.NaT
-
-    df['valid'] = df.apply(lambda row: combine_date_time(row, data_year), axis=1)
+    # 3. Create Datetime Column (Naive LST), vectorized over all rows
+    df['valid'] = build_valid_times(df['Month'], df['Day'], df['Time_HHMM'], data_year)
     df = df.dropna(subset=['valid'])
     
     # 4. Add Metadata
@@ -332,39 +451,44 @@ def parse_mesonet_data(raw_text: str, metadata: dict) -> pd.DataFrame:
     df['lon'] = metadata['lon']
     
     # 5. Standardize Units and Variables (Matching ASOS output)
-    tair_f = pd.to_numeric(df['Air_Temp_F'], errors='coerce').values * units.degF
-    rel_hum = pd.to_numeric(df['Rel_Hum_pct'], errors='coerce').values * units.percent
+    if FAST_UNIT_MODE:
+        _convert_mesonet_units_fast(df)
+    else:
+        tair_f = pd.to_numeric(df['Air_Temp_F'], errors='coerce').values * units.degF
+        rel_hum = pd.to_numeric(df['Rel_Hum_pct'], errors='coerce').values * units.percent
     
-    # Td Calculation
-    tdew_k = mpcalc.dewpoint_from_relative_humidity(tair_f.to('K'), rel_hum)
+        # Td Calculation
+        tdew_k = mpcalc.dewpoint_from_relative_humidity(tair_f.to('K'), rel_hum)
     
-    df['air_temp_c'] = tair_f.to('degC').magnitude
-    df['dew_point_c'] = tdew_k.to('degC').magnitude
-    df['rh_percent'] = rel_hum.magnitude
+        df['air_temp_c'] = tair_f.to('degC').magnitude
+        df['dew_point_c'] = tdew_k.to('degC').magnitude
+        df['rh_percent'] = rel_hum.magnitude
     
-    # Soil Temp Conversion (F -> C)
-    soil_2in_f = pd.to_numeric(df['Soil_Temp_2in_F'], errors='coerce').values * units.degF
-    soil_4in_f = pd.to_numeric(df['Soil_Temp_4in_F'], errors='coerce').values * units.degF
-    df['soil_temp_2in_c'] = soil_2in_f.to('degC').magnitude
-    df['soil_temp_4in_c'] = soil_4in_f.to('degC').magnitude
+        # Soil Temp Conversion (F -> C)
+        soil_2in_f = pd.to_numeric(df['Soil_Temp_2in_F'], errors='coerce').values * units.degF
+        soil_4in_f = pd.to_numeric(df['Soil_Temp_4in_F'], errors='coerce').values * units.degF
+        df['soil_temp_2in_c'] = soil_2in_f.to('degC').magnitude
+        df['soil_temp_4in_c'] = soil_4in_f.to('degC').magnitude
     
-    # Wind Conversion
-    wind_speed_mph = pd.to_numeric(df['Wind_Speed_MPH'], errors='coerce').fillna(np.nan)
-    wind_dir_deg = pd.to_numeric(df['Wind_Dir_Deg'], errors='coerce').fillna(np.nan)
+        # Wind Conversion
+        wind_speed_mph = pd.to_numeric(df['Wind_Speed_MPH'], errors='coerce').fillna(np.nan)
+        wind_dir_deg = pd.to_numeric(df['Wind_Dir_Deg'], errors='coerce').fillna(np.nan)
 
-    wind_valid_mask = (~np.isnan(wind_speed_mph)) & (~np.isnan(wind_dir_deg))
-    u_values = np.full_like(df['air_temp_c'].values, np.nan)
-    v_values = np.full_like(df['air_temp_c'].values, np.nan)
+        wind_valid_mask = (~np.isnan(wind_speed_mph)) & (~np.isnan(wind_dir_deg))
+        u_values = np.full_like(df['air_temp_c'].values, np.nan)
+        v_values = np.full_like(df['air_temp_c'].values, np.nan)
     
-    u_mph, v_mph = mpcalc.wind_components(
-        wind_speed_mph[wind_valid_mask].values * units('mile/hour'),
-        wind_dir_deg[wind_valid_mask].values * units.degrees
-    )
+        u_mph, v_mph = mpcalc.wind_components(
+            wind_speed_mph[wind_valid_mask].values * units('mile/hour'),
+            wind_dir_deg[wind_valid_mask].values * units.degrees
+        )
     
-    df['u'] = u_mph.to('m/s').magnitude
-    df['v'] = v_mph.to('m/s').magnitude
-    df['wind_speed_ms'] = (wind_speed_mph.values * units('mile/hour')).to('m/s').magnitude
-    df['wind_gust_ms'] = np.nan 
+        u_values[wind_valid_mask] = u_mph.to('m/s').magnitude
+        v_values[wind_valid_mask] = v_mph.to('m/s').magnitude
+        df['u'] = u_values
+        df['v'] = v_values
+        df['wind_speed_ms'] = (wind_speed_mph.values * units('mile/hour')).to('m/s').magnitude
+        df['wind_gust_ms'] = np.nan 
 
     final_cols = ['station', 'valid', 'lat', 'lon', 'air_temp_c', 'dew_point_c', 'rh_percent', 
                   'wind_speed_ms', 'wind_gust_ms', 'u', 'v', 
@@ -374,19 +498,9 @@ def parse_mesonet_data(raw_text: str, metadata: dict) -> pd.DataFrame:
     return df[final_cols]
 
 
-def fetch_and_process_mesonet(target_datetime: datetime) -> pd.DataFrame:
-    """Iterates through all Mesonet stations, fetches data, converts LST to UTC, and filters."""
-    print(f"\n[MESONET] Starting fetch for Mesonet stations...")
-    all_stations_data: List[pd.DataFrame] = []
-    
-    # Fixed offset for LST -> UTC conversion (Missouri is UTC-6 during standard time)
-    LST_TO_UTC_OFFSET = timedelta(hours=6)
-    
-    print(f"[MESONET] Assuming Mesonet reports are in LST (UTC-6). All times will be converted to UTC.")
-    
-    # Time filter is now simplified to target the exact hour only
-    target_time_utc = target_datetime
-    
+def _resolve_mesonet_stations() -> List[Tuple[str, Dict[str, Any]]]:
+    """Pairs every Mesonet URL with its static metadata, skipping unknown stations."""
+    stations: List[Tuple[str, Dict[str, Any]]] = []
     for url in MESONET_URL_LIST:
         match = BULL_ID_PATTERN.search(url)
         if not match:
@@ -397,81 +511,157 @@ def fetch_and_process_mesonet(target_datetime: datetime) -> pd.DataFrame:
         
         if not metadata:
             continue
-            
-        # 1. Fetch and Parse raw Mesonet data (resulting in Naive LST times)
-        raw_text_data = fetch_and_extract_pre_tag(url)
-        
+        stations.append((url, metadata))
+    return stations
+
+
+def get_mesonet_frame(raw_text: str, metadata: dict) -> pd.DataFrame:
+    """
+    Returns the parsed, unit-converted frame for one bulletin, parsing it at most once.
+    Frames are cached in memory and on disk under the station id and a hash of everything
+    the frame depends on: the bulletin text, the station metadata (lat/lon/year), the unit
+    mode and MESONET_FRAME_VERSION. An unchanged page is never re-parsed for another target
+    hour, while a parser or mode change never reuses an old frame.
+    """
+    revision = hashlib.sha1()
+    revision.update(f"v{MESONET_FRAME_VERSION}|fast={FAST_UNIT_MODE}|".encode('utf-8'))
+    revision.update(repr(sorted(metadata.items())).encode('utf-8'))
+    revision.update(raw_text.encode('utf-8'))
+    cache_key = f"{metadata['station_id']}_{revision.hexdigest()}"
+    
+    mesonet_df = MESONET_FRAME_CACHE.get_frame(cache_key) if USE_RESPONSE_CACHE else None
+    if mesonet_df is not None:
+        print(f"       -[MESONET] Bulletin unchanged for {metadata['station_id']}. Reusing parsed data.")
+        return mesonet_df
+    
+    mesonet_df = parse_mesonet_data(raw_text, metadata)
+    if USE_RESPONSE_CACHE and not mesonet_df.empty:
+        MESONET_FRAME_CACHE.put_frame(cache_key, mesonet_df)
+    return mesonet_df
+
+
+def fetch_mesonet_frames(fetch_hour: Optional[datetime] = None, max_workers: int = MESONET_MAX_WORKERS) -> List[Tuple[Dict[str, Any], pd.DataFrame]]:
+    """
+    Fetches and parses every Mesonet bulletin once, returning (metadata, frame) pairs in
+    MESONET_URL_LIST order. Each frame holds all hours on the page with a 'valid_utc' column.
+    Bulletin pages are downloaded concurrently by up to `max_workers` threads; `fetch_hour`
+    keys the raw response cache.
+    """
+    print(f"[MESONET] Assuming Mesonet reports are in LST (UTC-6). All times will be converted to UTC.")
+    
+    stations = _resolve_mesonet_stations()
+    urls = [url for url, _ in stations]
+    
+    # 1. Fetch the raw <pre> blocks (network bound, so overlap the waits)
+    if max_workers > 1 and len(urls) > 1:
+        print(f"[MESONET] Fetching {len(urls)} bulletin pages with up to {max_workers} concurrent requests...")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            raw_texts = list(executor.map(lambda url: fetch_and_extract_pre_tag(url, fetch_hour), urls))
+    else:
+        raw_texts = [fetch_and_extract_pre_tag(url, fetch_hour) for url in urls]
+    
+    frames: List[Tuple[Dict[str, Any], pd.DataFrame]] = []
+    for (url, metadata), raw_text_data in zip(stations, raw_texts):
+        # 2. Parse raw Mesonet data (resulting in Naive LST times)
         if raw_text_data:
-            mesonet_df = parse_mesonet_data(raw_text_data, metadata)
+            mesonet_df = get_mesonet_frame(raw_text_data, metadata)
             
             if not mesonet_df.empty:
-                # 2. Convert Naive LST column to UTC
+                # 3. Convert Naive LST column to UTC
                 # Apply the fixed offset to the entire 'valid' column (LST + 6 hours = UTC)
                 mesonet_df['valid_utc'] = pd.to_datetime(mesonet_df['valid']) + LST_TO_UTC_OFFSET
-                
-                # 3. Filter using the standardized UTC time (exactly the target hour, 0-59 minutes)
-                # We target the date and hour of the observation time.
-                filtered_df = mesonet_df[
-                    (mesonet_df['valid_utc'].dt.date == target_time_utc.date()) & 
-                    (mesonet_df['valid_utc'].dt.hour == target_time_utc.hour)
-                ].copy()
-                
-                if not filtered_df.empty:
-                    print(f"[MESONET] Found {len(filtered_df)} reports in the target hour for {metadata['station_id']}. Selecting best report...")
-                    # Select the report closest to the target UTC time (which is the start of the hour)
-                    filtered_df['time_diff'] = abs(filtered_df['valid_utc'] - target_time_utc)
-                    best_report = filtered_df.loc[filtered_df['time_diff'].idxmin()].copy()
-                    
-                    # Set the final valid time to the precise UTC time
-                    best_report['valid'] = best_report['valid_utc']
-                    
-                    # Append cleaned report to list
-                    all_stations_data.append(best_report.drop(columns=['valid_utc', 'time_diff']).to_frame().T)
-
-    if all_stations_data:
-        final_df = pd.concat(all_stations_data, ignore_index=True)
-        print(f"[MESONET] Processed and merged {len(final_df)} unique Mesonet reports.")
-        return final_df
-    else:
+                frames.append((metadata, mesonet_df))
+    return frames
+
+
+def select_mesonet_reports(frames: List[Tuple[Dict[str, Any], pd.DataFrame]], target_datetime: datetime) -> pd.DataFrame:
+    """
+    Selects the report closest to the target UTC hour for every Mesonet station.
+    All parsed station frames are concatenated once (keeping their native dtypes) and the
+    best report per station is picked with a single grouped idxmin.
+    """
+    if not frames:
+        print("[MESONET] No Mesonet data successfully processed.")
+        return pd.DataFrame()
+    
+    combined = pd.concat([mesonet_df for _, mesonet_df in frames], ignore_index=True)
+    
+    # Filter using the standardized UTC time (exactly the target hour, 0-59 minutes)
+    hour_start = pd.Timestamp(target_datetime).floor('h')
+    in_hour = combined[
+        (combined['valid_utc'] >= hour_start) & (combined['valid_utc'] < hour_start + pd.Timedelta(hours=1))
+    ].copy()
+    
+    if in_hour.empty:
         print("[MESONET] No Mesonet data successfully processed.")
         return pd.DataFrame()
+    
+    # Select the report closest to the target UTC time (which is the start of the hour) per station,
+    # keeping stations in MESONET_URL_LIST order
+    in_hour['time_diff'] = (in_hour['valid_utc'] - pd.Timestamp(target_datetime)).abs()
+    best_idx = in_hour.groupby('station', sort=False)['time_diff'].idxmin()
+    final_df = in_hour.loc[best_idx.values]
+    
+    # Set the final valid time to the precise UTC time
+    final_df = final_df.assign(valid=final_df['valid_utc']).drop(columns=['valid_utc', 'time_diff']).reset_index(drop=True)
+    
+    print(f"[MESONET] Processed and merged {len(final_df)} unique Mesonet reports.")
+    return final_df
 
 
-# --- Gridding, NetCDF, and Plotting Functions ---
+def fetch_and_process_mesonet(target_datetime: datetime, max_workers: int = MESONET_MAX_WORKERS) -> pd.DataFrame:
+    """
+    Iterates through all Mesonet stations, fetches data, converts LST to UTC, and filters.
+    Parsing and selection run in MESONET_URL_LIST order so the result matches a sequential run.
+    """
+    print(f"\n[MESONET] Starting fetch for Mesonet stations...")
+    frames = fetch_mesonet_frames(target_datetime, max_workers=max_workers)
+    return select_mesonet_reports(frames, target_datetime)
 
-def regrid_and_save(raw_df: pd.DataFrame, resolution_km: float, bounds: list, output_filepath: str):
+
+def fetch_and_process_mesonet_range(start_time: datetime, end_time: datetime, max_workers: int = MESONET_MAX_WORKERS) -> Dict[datetime, pd.DataFrame]:
     """
-    Converts raw station data to xarray, interpolates it to a regular grid,
-    and saves the resulting NetCDF file.
+    Batched version of fetch_and_process_mesonet for every whole hour in [start_time, end_time].
+    Each bulletin is fetched and parsed once and every target hour is selected from that parse.
     """
-    print("\n-> Converting to xarray and interpolating to regular grid (scipy.interpolate.griddata)...")
-    
-    # Ensure all data columns are numeric before extraction
-    numeric_cols = ['lat', 'lon', 'air_temp_c', 'dew_point_c', 'rh_percent', 'wind_speed_ms', 'wind_gust_ms', 'u', 'v', 
-                    'soil_temp_2in_c', 'soil_temp_4in_c']
-    for col in numeric_cols:
-        raw_df[col] = pd.to_numeric(raw_df[col], errors='coerce')
-        
-    # Extract coordinates and variables from the dataframe
-    lats = raw_df['lat'].values
-    lons = raw_df['lon'].values
-    
-    # Variables for interpolation
-    points = np.column_stack((lons, lats))
-    data = {
-        'T_2m': raw_df['air_temp_c'].values,
-        'Td_2m': raw_df['dew_point_c'].values,
-        'RH': raw_df['rh_percent'].values,
-        'WS': raw_df['wind_speed_ms'].values,
-        'WG': raw_df['wind_gust_ms'].values.copy(), 
-        'U_wind': raw_df['u'].values, 
-        'V_wind': raw_df['v'].values,
-        # New Soil Temperature Variables
-        'ST_2in': raw_df['soil_temp_2in_c'].values,
-        'ST_4in': raw_df['soil_temp_4in_c'].values,
+    print(f"\n[MESONET] Starting fetch for Mesonet stations ({start_time.isoformat()} -> {end_time.isoformat()})...")
+    frames = fetch_mesonet_frames(start_time, max_workers=max_workers)
+    target_hours = list(pd.date_range(start_time, end_time, freq='h').to_pydatetime())
+    return {target_hour: select_mesonet_reports(frames, target_hour) for target_hour in target_hours}
+
+
+def fetch_and_process_range(start_time: datetime, end_time: datetime) -> Dict[datetime, pd.DataFrame]:
+    """Merged ASOS + Mesonet reports for every whole hour in [start_time, end_time] (input for regrid_and_save_batch)."""
+    asos_by_hour = fetch_and_process_asos_range(start_time, end_time)
+    mesonet_by_hour = fetch_and_process_mesonet_range(start_time, end_time)
+    return {
+        target_hour: merge_reports(asos_by_hour.get(target_hour), mesonet_by_hour.get(target_hour))
+        for target_hour in sorted(set(asos_by_hour) | set(mesonet_by_hour))
     }
 
-    # --- Determine Grid Size (3km resolution) ---
+
+# --- Gridding, NetCDF, and Plotting Functions ---
+
+# Gridded variable -> (source column, NetCDF attributes)
+GRID_VARIABLES = {
+    'T_2m': ('air_temp_c', {'units': 'degC', 'long_name': '2-meter Air Temperature'}),
+    'Td_2m': ('dew_point_c', {'units': 'degC', 'long_name': '2-meter Dew Point'}),
+    'RH': ('rh_percent', {'units': '%', 'long_name': 'Relative Humidity'}),
+    'WS': ('wind_speed_ms', {'units': 'm/s', 'long_name': 'Wind Speed'}),
+    'WG': ('wind_gust_ms', {'units': 'm/s', 'long_name': 'Wind Gust Speed'}),
+    'U_wind': ('u', {'units': 'm/s', 'long_name': 'U-component of Wind'}),
+    'V_wind': ('v', {'units': 'm/s', 'long_name': 'V-component of Wind'}),
+    # New Soil Temperature Variables
+    'ST_2in': ('soil_temp_2in_c', {'units': 'degC', 'long_name': 'Soil Temp 2in Depth'}),
+    'ST_4in': ('soil_temp_4in_c', {'units': 'degC', 'long_name': 'Soil Temp 4in Depth'}),
+}
+
+
+def build_grid(resolution_km: float, bounds: list) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Regular lat/lon grid with roughly `resolution_km` spacing over `bounds`
+    ([min_lon, max_lon, min_lat, max_lat]). Returns (grid_lon, grid_lat, X, Y) with X/Y the meshgrid.
+    """
     min_lon, max_lon, min_lat, max_lat = bounds
     center_lat = (min_lat + max_lat) / 2
     deg_per_km_lat = 1 / 111.
@@ -489,27 +679,62 @@ def regrid_and_save(raw_df: pd.DataFrame, resolution_km: float, bounds: list, ou
     grid_lat = np.linspace(min_lat, max_lat, ny)
     
     X, Y = np.meshgrid(grid_lon, grid_lat)
+    return grid_lon, grid_lat, X, Y
+
+
+def _prepare_engine(engine: Optional[InterpolationEngine]) -> InterpolationEngine:
+    """Default engine, wrapped in CachedOperatorEngine for linear backends when USE_WEIGHT_CACHE is set."""
+    if engine is None:
+        engine = make_engine(GRID_INTERPOLATION_ENGINE)
+    # Linear engines reduce to one cached sparse weight matrix per station subset
+    if USE_WEIGHT_CACHE and engine.linear and not isinstance(engine, CachedOperatorEngine):
+        engine = CachedOperatorEngine(engine, WEIGHT_CACHE)
+    return engine
+
+
+def _ensure_numeric(raw_df: pd.DataFrame) -> None:
+    """Coerces the coordinate and gridded source columns to numbers in place."""
+    numeric_cols = ['lat', 'lon'] + [column for column, _ in GRID_VARIABLES.values()]
+    # (the ingestion paths already return float columns, so this only touches object columns)
+    for col in numeric_cols:
+        if not pd.api.types.is_numeric_dtype(raw_df[col]):
+            raw_df[col] = pd.to_numeric(raw_df[col], errors='coerce')
+
+
+def _save_netcdf(ds: xr.Dataset, output_filepath: str) -> None:
+    """Writes `ds` to BASE_DATA_DIR/output_filepath, reporting (not raising) failures."""
+    try:
+        final_filepath = os.path.join(BASE_DATA_DIR, output_filepath)
+        os.makedirs(os.path.dirname(final_filepath), exist_ok=True)
+        ds.to_netcdf(final_filepath)
+        print(f"[OUTPUT] Successfully saved NetCDF file to: {final_filepath}")
+    except Exception as e:
+        print(f"[ERROR] Failed to save NetCDF file to {BASE_DATA_DIR}: {e}")
+
+
+def regrid_and_save(raw_df: pd.DataFrame, resolution_km: float, bounds: list, output_filepath: str,
+                    engine: Optional[InterpolationEngine] = None):
+    """
+    Converts raw station data to xarray, interpolates it to a regular grid with `engine`
+    (default: GRID_INTERPOLATION_ENGINE), and saves the resulting NetCDF file. Linear engines
+    are wrapped in CachedOperatorEngine when USE_WEIGHT_CACHE is set.
+    """
+    engine = _prepare_engine(engine)
+    print(f"\n-> Converting to xarray and interpolating to regular grid ({engine.name})...")
     
-    # --- Perform Interpolation (SciPy Griddata) ---
-    gridded_data: Dict[str, np.ndarray] = {}
-    for var_name, var_data in data.items():
-        valid_indices = ~np.isnan(var_data)
+    # Ensure all data columns are numeric before extraction
+    _ensure_numeric(raw_df)
         
-        # NOTE: Only require 2 valid points for basic mapping of sparse Mesonet data
-        if np.sum(valid_indices) < 2: 
-             print(f"Warning: Not enough valid data points for {var_name} (found {np.sum(valid_indices)}). Skipping interpolation.")
-             gridded_data[var_name] = np.full((ny, nx), np.nan)
-             continue
+    # Variables for interpolation
+    points = np.column_stack((raw_df['lon'].values, raw_df['lat'].values))
+    data = {var_name: raw_df[column].values for var_name, (column, _) in GRID_VARIABLES.items()}
 
-        print(f"   - Gridding {var_name}...")
-        
-        grid_vals = si.griddata(
-            points[valid_indices], 
-            var_data[valid_indices], 
-            (X, Y), 
-            method='cubic'
-        )
-        gridded_data[var_name] = grid_vals
+    # --- Determine Grid Size (3km resolution) ---
+    grid_lon, grid_lat, X, Y = build_grid(resolution_km, bounds)
+    
+    # --- Perform Interpolation (one engine setup per valid-station mask, see interpolater.py) ---
+    gridded_data = engine.grid(points, data, X, Y)
+    print(f"   - Interpolation cost: {engine.cost_report()}")
 
     # --- Create xarray Dataset ---
     ds = xr.Dataset(
@@ -519,15 +744,8 @@ def regrid_and_save(raw_df: pd.DataFrame, resolution_km: float, bounds: list, ou
             'longitude': ('longitude', grid_lon)
         },
         data_vars={
-            'T_2m': (('latitude', 'longitude'), gridded_data.get('T_2m', np.zeros((ny, nx))), {'units': 'degC', 'long_name': '2-meter Air Temperature'}),
-            'Td_2m': (('latitude', 'longitude'), gridded_data.get('Td_2m', np.zeros((ny, nx))), {'units': 'degC', 'long_name': '2-meter Dew Point'}),
-            'RH': (('latitude', 'longitude'), gridded_data.get('RH', np.zeros((ny, nx))), {'units': '%', 'long_name': 'Relative Humidity'}),
-            'WS': (('latitude', 'longitude'), gridded_data.get('WS', np.zeros((ny, nx))), {'units': 'm/s', 'long_name': 'Wind Speed'}),
-            'WG': (('latitude', 'longitude'), gridded_data.get('WG', np.zeros((ny, nx))), {'units': 'm/s', 'long_name': 'Wind Gust Speed'}),
-            'U_wind': (('latitude', 'longitude'), gridded_data.get('U_wind', np.zeros((ny, nx))), {'units': 'm/s', 'long_name': 'U-component of Wind'}),
-            'V_wind': (('latitude', 'longitude'), gridded_data.get('V_wind', np.zeros((ny, nx))), {'units': 'm/s', 'long_name': 'V-component of Wind'}),
-            'ST_2in': (('latitude', 'longitude'), gridded_data.get('ST_2in', np.full((ny, nx), np.nan)), {'units': 'degC', 'long_name': 'Soil Temp 2in Depth'}),
-            'ST_4in': (('latitude', 'longitude'), gridded_data.get('ST_4in', np.full((ny, nx), np.nan)), {'units': 'degC', 'long_name': 'Soil Temp 4in Depth'}),
+            var_name: (('latitude', 'longitude'), gridded_data[var_name], attrs)
+            for var_name, (_, attrs) in GRID_VARIABLES.items()
         }
     )
     
@@ -535,20 +753,82 @@ def regrid_and_save(raw_df: pd.DataFrame, resolution_km: float, bounds: list, ou
     ds.attrs['source_time'] = ds['time'].item()
     
     # --- NetCDF Saving Logic ---
-    try:
-        os.makedirs(BASE_DATA_DIR, exist_ok=True)
-        final_filepath = os.path.join(BASE_DATA_DIR, output_filepath)
-        ds.to_netcdf(final_filepath)
-        print(f"[OUTPUT] Successfully saved NetCDF file to: {final_filepath}")
-    except Exception as e:
-        print(f"[ERROR] Failed to save NetCDF file to {BASE_DATA_DIR}: {e}")
+    _save_netcdf(ds, output_filepath)
     
     return ds
 
-def plot_gridded_data(ds: xr.Dataset, var_name: str, title: str, cmap: str):
+
+def regrid_and_save_batch(hourly_data: Dict[datetime, pd.DataFrame], resolution_km: float, bounds: list,
+                          output_filepath: str, engine: Optional[InterpolationEngine] = None) -> xr.Dataset:
+    """
+    Batched regrid_and_save: grids the observations of many hours ({target hour: merged
+    DataFrame}, e.g. from fetch_and_process_range) into (time, latitude, longitude) variables
+    and writes them to one NetCDF file.
+
+    The grid is built once. Stations are aligned on the union of all (station, lat, lon)
+    seen in the batch, so every variable of every hour is one column of a single array and
+    the engine sets up once per distinct set of reporting stations across the whole batch
+    (grid_columns). A station missing at one time only changes that column's mask; hours
+    without data become all-NaN slices.
+    """
+    engine = _prepare_engine(engine)
+    times = sorted(hourly_data)
+    print(f"\n-> Gridding {len(times)} hours into one (time, latitude, longitude) cube ({engine.name})...")
+
+    frames = []
+    for time_index, target_hour in enumerate(times):
+        df = hourly_data[target_hour]
+        if df is None or df.empty:
+            continue
+        df = df.copy()
+        _ensure_numeric(df)
+        frames.append(df.assign(time_index=time_index))
+    if frames:
+        combined = pd.concat(frames, ignore_index=True)
+    else:
+        # Every hour is empty: no stations, so every slice of the cube stays NaN
+        combined = pd.DataFrame(columns=['station', 'lat', 'lon', 'time_index'] + [column for column, _ in GRID_VARIABLES.values()])
+    combined = combined.dropna(subset=['lat', 'lon']).drop_duplicates(['time_index', 'station', 'lat', 'lon'])
+
+    # Union of stations over the batch; each (variable, hour) becomes one column over it
+    station_keys = combined[['station', 'lat', 'lon']].drop_duplicates().reset_index(drop=True)
+    station_index = pd.MultiIndex.from_frame(station_keys).get_indexer(pd.MultiIndex.from_frame(combined[['station', 'lat', 'lon']]))
+    points = np.column_stack((station_keys['lon'].values.astype(float), station_keys['lat'].values.astype(float)))
+
+    var_names = list(GRID_VARIABLES)
+    columns = np.full((len(station_keys), len(var_names) * len(times)), np.nan)
+    time_index = combined['time_index'].values.astype(int)
+    for var_position, var_name in enumerate(var_names):
+        source_column = GRID_VARIABLES[var_name][0]
+        columns[station_index, var_position * len(times) + time_index] = combined[source_column].values
+    labels = [f"{var_name}@{target_hour:%Y-%m-%dT%H}" for var_name in var_names for target_hour in times]
+
+    grid_lon, grid_lat, X, Y = build_grid(resolution_km, bounds)
+    gridded = engine.grid_columns(points, columns, X, Y, labels=labels)
+    gridded = gridded.reshape((len(var_names), len(times)) + X.shape)
+    print(f"   - Interpolation cost: {engine.cost_report()}")
+
+    ds = xr.Dataset(
+        coords={
+            'time': ('time', pd.to_datetime(times)),
+            'latitude': ('latitude', grid_lat),
+            'longitude': ('longitude', grid_lon)
+        },
+        data_vars={
+            var_name: (('time', 'latitude', 'longitude'), gridded[var_position], GRID_VARIABLES[var_name][1])
+            for var_position, var_name in enumerate(var_names)
+        }
+    )
+    ds.attrs['title'] = f'Gridded Missouri ASOS/Mesonet Data ({resolution_km}km)'
+    ds.attrs['stations'] = len(station_keys)
+
+    _save_netcdf(ds, output_filepath)
+    return ds
+
+def plot_gridded_data(ds: xr.Dataset, var_name: str, title: str, cmap: str, map_dir: str = BASE_MAP_DIR):
     """
     Generates a map of the gridded data and saves the resulting PNG file 
-    to the images/maps/full directory.
+    to `map_dir` (default: the images/maps/full directory).
     """
     print(f"\n-> Generating map for {title}...")
     
@@ -559,14 +839,8 @@ def plot_gridded_data(ds: xr.Dataset, var_name: str, title: str, cmap: str):
     
     ax.set_extent(MISSOURI_BOUNDS, crs=ccrs.PlateCarree())
     
-    ax.add_feature(cfeature.LAND, facecolor='lightgray')
-    ax.add_feature(cfeature.OCEAN, facecolor='lightblue')
-    ax.add_feature(cfeature.BORDERS, linestyle=':')
-    states_provinces = cfeature.NaturalEarthFeature(
-        category='cultural', name='admin_1_states_provinces_lines', scale='50m', facecolor='none'
-    )
-    ax.add_feature(states_provinces, edgecolor='black', linewidth=1.0)
-    ax.add_feature(cfeature.LAKES, alpha=0.5)
+    # Land, ocean, borders, state lines and lakes (cached per extent, see basemap_cache.py)
+    BASEMAP_CACHE.add_to(ax)
     
     # Plot Gridded Data (Contourf with Color Table)
     data_plot = data_var.plot.contourf(
@@ -579,15 +853,11 @@ def plot_gridded_data(ds: xr.Dataset, var_name: str, title: str, cmap: str):
     
     # --- PNG Saving Logic ---
     try:
-        # Get the standardized filename suffix
-        filename_suffix = VARIABLE_TO_FILENAME.get(var_name, var_name.lower())
-        
-        # Construct the full path
-        png_filename = f'interpolated_{filename_suffix}.png'
-        os.makedirs(BASE_MAP_DIR, exist_ok=True)
-        final_filepath = os.path.join(BASE_MAP_DIR, png_filename)
+        # Construct the full path from the standardized filename
+        os.makedirs(map_dir, exist_ok=True)
+        final_filepath = os.path.join(map_dir, map_filename(var_name))
         
-        plt.savefig(final_filepath, bbox_inches='tight', dpi=150)
+        fig.savefig(final_filepath, bbox_inches='tight', dpi=150)
         print(f"[OUTPUT] Successfully saved PNG map to: {final_filepath}")
     except Exception as e:
         print(f"[ERROR] Failed to save PNG map for {title}: {e}")
@@ -595,13 +865,125 @@ def plot_gridded_data(ds: xr.Dataset, var_name: str, title: str, cmap: str):
     plt.close(fig)
 
 
+def render_maps(ds: xr.Dataset, map_dir: str = BASE_MAP_DIR, workers: Optional[int] = 1) -> List[str]:
+    """
+    Renders every PLOT_VARIABLES map of `ds` and returns the directories written.
+
+    A single-time dataset renders into `map_dir`; a dataset with a time dimension (e.g. from
+    regrid_and_save_batch) renders each hour into `map_dir`/<YYYYMMDDHH>/. File names never
+    depend on the worker that drew them. With `workers` other than 1 (None: every core) the
+    maps are drawn in a process pool that reads the gridded fields from shared memory
+    (_share_dataset), so the dataset is copied once instead of pickled for every map.
+    """
+    var_names = [var_name for var_name in PLOT_VARIABLES if var_name in ds.data_vars]
+    time_indices = list(range(ds.sizes['time'])) if 'time' in ds.dims else [None]
+    tasks = [(var_name, time_index, map_dir) for time_index in time_indices for var_name in var_names]
+    if not tasks:
+        return []
+
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    if workers == 1:
+        return sorted(set(_render_map(ds, *task) for task in tasks))
+
+    shm, spec = _share_dataset(ds, var_names)
+    try:
+        print(f"[RENDER] Rendering {len(tasks)} maps in {workers} processes...")
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach_shared_dataset, initargs=(spec,)) as executor:
+            return sorted(set(executor.map(_render_shared_map, tasks)))
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _render_map(ds: xr.Dataset, var_name: str, time_index: Optional[int], map_dir: str) -> str:
+    """Renders one variable (at one hour of a time series) and returns its directory."""
+    if time_index is not None:
+        ds = ds.isel(time=time_index)
+        map_dir = os.path.join(map_dir, pd.Timestamp(ds['time'].item()).strftime('%Y%m%d%H'))
+    plot_info = PLOT_VARIABLES[var_name]
+    plot_gridded_data(ds=ds, var_name=var_name, title=plot_info['title'], cmap=plot_info['cmap'], map_dir=map_dir)
+    return map_dir
+
+
+def _share_dataset(ds: xr.Dataset, var_names: List[str]) -> Tuple[shared_memory.SharedMemory, Dict[str, Any]]:
+    """
+    Copies the `var_names` fields of `ds` (same dims) into one shared memory block. Returns the
+    block (the caller closes and unlinks it) and the small picklable spec workers rebuild the
+    dataset from: block name, array shape, dims, coordinates and attributes.
+    """
+    dims = ds[var_names[0]].dims
+    shape = (len(var_names),) + tuple(ds.sizes[dim] for dim in dims)
+    shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)) * np.dtype(np.float64).itemsize)
+    fields = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+    for position, var_name in enumerate(var_names):
+        fields[position] = ds[var_name].transpose(*dims).values
+    spec = {
+        'name': shm.name, 'shape': shape, 'dims': dims, 'var_names': var_names,
+        'coords': {name: (coord.dims, coord.values) for name, coord in ds.coords.items()},
+        'var_attrs': {var_name: dict(ds[var_name].attrs) for var_name in var_names},
+        'attrs': dict(ds.attrs),
+    }
+    del fields
+    return shm, spec
+
+
+# Per render worker: the shared memory block and the dataset viewing it (_attach_shared_dataset)
+_SHARED_BLOCK: Optional[shared_memory.SharedMemory] = None
+_SHARED_DATASET: Optional[xr.Dataset] = None
+
+
+def _attach_shared_dataset(spec: Dict[str, Any]) -> None:
+    """Render worker initializer: maps the shared block and wraps it in a dataset without copying."""
+    global _SHARED_BLOCK, _SHARED_DATASET
+    # Workers only write files; never try to open a display
+    plt.switch_backend('Agg')
+    _SHARED_BLOCK = shared_memory.SharedMemory(name=spec['name'])
+    fields = np.ndarray(spec['shape'], dtype=np.float64, buffer=_SHARED_BLOCK.buf)
+    _SHARED_DATASET = xr.Dataset(
+        coords=spec['coords'],
+        data_vars={
+            var_name: (spec['dims'], fields[position], spec['var_attrs'][var_name])
+            for position, var_name in enumerate(spec['var_names'])
+        },
+        attrs=spec['attrs']
+    )
+
+
+def _render_shared_map(task: tuple) -> str:
+    return _render_map(_SHARED_DATASET, *task)
+
+
+def merge_reports(raw_df_asos: pd.DataFrame, raw_df_mesonet: pd.DataFrame) -> pd.DataFrame:
+    """
+    Merges one hour of ASOS and Mesonet reports and drops rows missing critical data
+    (lat/lon/temperature) so the result can be gridded.
+    """
+    # Concatenate the two DataFrames. Since columns are standardized, they merge cleanly.
+    frames = [df for df in (raw_df_asos, raw_df_mesonet) if df is not None and not df.empty]
+    if not frames:
+        return pd.DataFrame()
+    all_raw_df = pd.concat(frames, ignore_index=True)
+    
+    # *** FIX: Ensure the 'valid' column retains its datetime type after concatenation ***
+    all_raw_df['valid'] = pd.to_datetime(all_raw_df['valid'])
+
+    # Drop rows that are missing critical data (Lat/Lon/Temp) to prevent gridding failure
+    return all_raw_df.dropna(subset=['lat', 'lon', 'air_temp_c']).reset_index(drop=True)
+
+
 def process_and_map_data(
     target_date: str, 
     target_time_hour: int, 
-    output_filename: str = 'mo_surface_3km_regridded.nc'
+    output_filename: str = 'mo_surface_3km_regridded.nc',
+    engine: Optional[InterpolationEngine] = None,
+    map_dir: str = BASE_MAP_DIR,
+    render_workers: Optional[int] = RENDER_WORKERS
 ) -> pd.DataFrame:
     """
     Main workflow function to fetch, process, merge, regrid, and plot the data.
+    `engine` selects the interpolation backend (default: GRID_INTERPOLATION_ENGINE);
+    `output_filename` (relative to BASE_DATA_DIR) and `map_dir` set where the NetCDF file
+    and the PNG maps are written; `render_workers` processes draw the maps (see render_maps).
     Returns the final merged raw DataFrame for inspection.
     """
     # 1. Define Target Date/Time
@@ -618,14 +1000,7 @@ def process_and_map_data(
     raw_df_mesonet = fetch_and_process_mesonet(target_datetime)
     
     # 3. Merge Datasets
-    # Concatenate the two DataFrames. Since columns are standardized, they merge cleanly.
-    all_raw_df = pd.concat([raw_df_asos, raw_df_mesonet], ignore_index=True)
-    
-    # *** FIX: Ensure the 'valid' column retains its datetime type after concatenation ***
-    all_raw_df['valid'] = pd.to_datetime(all_raw_df['valid'])
-
-    # Drop rows that are missing critical data (Lat/Lon/Temp) to prevent gridding failure
-    all_raw_df = all_raw_df.dropna(subset=['lat', 'lon', 'air_temp_c']).reset_index(drop=True)
+    all_raw_df = merge_reports(raw_df_asos, raw_df_mesonet)
 
     print(f"\n--- Merging Complete ---")
     print(f"Total Unique Reports for Gridding: {len(all_raw_df)}")
@@ -639,25 +1014,12 @@ def process_and_map_data(
         raw_df=all_raw_df, 
         resolution_km=GRID_RESOLUTION_KM, 
         bounds=MISSOURI_BOUNDS, 
-        output_filepath=output_filename
+        output_filepath=output_filename,
+        engine=engine
     )
 
     # 5. Plotting
-    plot_variables = {
-        'T_2m': {'title': '2-meter Air Temperature', 'cmap': 'RdYlBu_r'},
-        'Td_2m': {'title': '2-meter Dew Point', 'cmap': 'viridis'},
-        'RH': {'title': 'Relative Humidity', 'cmap': 'Greens'},
-        'WS': {'title': 'Wind Speed', 'cmap': 'YlOrRd'},
-        'WG': {'title': 'Wind Gust Speed', 'cmap': 'Reds'},
-        'ST_2in': {'title': 'Soil Temp 2in', 'cmap': 'YlOrBr'},
-        'ST_4in': {'title': 'Soil Temp 4in', 'cmap': 'YlOrBr_r'},
-    }
-    
-    for var_key, plot_info in plot_variables.items():
-        if var_key in final_ds.data_vars:
-            plot_gridded_data(
-                ds=final_ds, var_name=var_key, title=plot_info['title'], cmap=plot_info['cmap']
-            )
+    render_maps(final_ds, map_dir, workers=render_workers)
 
     return all_raw_df
 
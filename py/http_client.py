@@ -0,0 +1,196 @@
+'''
+Shared HTTP client layer for the ASOS/Mesonet data pipeline.
+
+All modules fetch through a single pooled requests.Session so that connections
+to agebb.missouri.edu and mesonet.agron.iastate.edu are kept alive and reused
+between requests instead of opening a new TCP connection for every page.
+Station bulletin pages are additionally revalidated with If-Modified-Since /
+If-None-Match so unchanged pages answer 304 and are served from memory, and
+large CSV responses (IEM ASOS queries) can be parsed incrementally while they
+stream in so memory stays flat regardless of the requested range or region.
+Independent CSV queries (e.g. the regional METAR pulls in map_generation.py)
+can be streamed in parallel with per-request retries under one shared deadline.
+
+Author: Nathan Beach
+Last Modified: October 16, 2026
+'''
+
+import time
+import threading
+import requests
+import pandas as pd
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, Any, List, Optional, NamedTuple, Callable, Union, IO
+
+# --- Configuration Constants ---
+# Number of distinct hosts kept in the connection pool
+POOL_CONNECTIONS = 10
+# Keep-alive connections kept per host (should be >= the largest concurrent fetch pool)
+POOL_MAXSIZE = 16
+USER_AGENT = 'atms4800-mo-surface-pipeline'
+# Rows parsed per chunk when streaming CSV responses
+CSV_CHUNK_ROWS = 50000
+# Bytes per read when copying a streamed response to disk
+STREAM_BLOCK_BYTES = 1024 * 1024
+# Extra attempts per request in stream_csv_concurrently, and the base of its exponential backoff (seconds)
+FETCH_RETRIES = 2
+RETRY_BACKOFF_SECONDS = 2.0
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+# Last seen validators and body per URL: {'etag': str, 'last_modified': str, 'text': str}
+_VALIDATOR_CACHE: Dict[str, Dict[str, Any]] = {}
+_VALIDATOR_LOCK = threading.Lock()
+
+
+class FetchResult(NamedTuple):
+    """Body of a (possibly revalidated) GET request."""
+    text: str
+    not_modified: bool      # True when the server answered 304 and `text` came from memory
+    revision: Optional[str] # ETag or Last-Modified value identifying this version of the page
+
+
+def get_session() -> requests.Session:
+    """Returns the process-wide pooled session, creating it on first use."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers.update({'User-Agent': USER_AGENT})
+            _SESSION = session
+        return _SESSION
+
+
+def get(url: str, timeout: float, **kwargs) -> requests.Response:
+    """Plain GET through the pooled session. Raises requests exceptions on failure."""
+    response = get_session().get(url, timeout=timeout, **kwargs)
+    response.raise_for_status()
+    return response
+
+
+def conditional_get(url: str, timeout: float) -> FetchResult:
+    """
+    GET with ETag / Last-Modified revalidation.
+
+    The first request for a URL is a normal download. Later requests send the stored
+    validators; a 304 answer skips the download and returns the body kept in memory
+    with `not_modified=True`. Raises requests exceptions on failure.
+    """
+    with _VALIDATOR_LOCK:
+        cached = _VALIDATOR_CACHE.get(url)
+
+    headers = {}
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+    response = get_session().get(url, timeout=timeout, headers=headers)
+
+    if response.status_code == 304 and cached:
+        return FetchResult(cached['text'], True, cached.get('etag') or cached.get('last_modified'))
+
+    response.raise_for_status()
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    text = response.text
+
+    if etag or last_modified:
+        with _VALIDATOR_LOCK:
+            _VALIDATOR_CACHE[url] = {'etag': etag, 'last_modified': last_modified, 'text': text}
+
+    return FetchResult(text, False, etag or last_modified)
+
+
+def read_csv_chunks(source: Union[str, IO],
+                    usecols: Optional[List[str]] = None,
+                    dtype: Optional[Dict[str, Any]] = None,
+                    na_values: Optional[List[str]] = None,
+                    chunksize: int = CSV_CHUNK_ROWS,
+                    chunk_filter: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None) -> pd.DataFrame:
+    """
+    Parses a CSV file path or stream `chunksize` rows at a time with explicit columns/dtypes.
+    `chunk_filter` is applied to every chunk before it is kept, so only the surviving rows
+    are ever held in memory together. Returns an empty DataFrame (with `usecols` as its
+    columns) when nothing is left or the body is empty.
+    """
+    kept: List[pd.DataFrame] = []
+    try:
+        reader = pd.read_csv(source, usecols=usecols, dtype=dtype, na_values=na_values, chunksize=chunksize)
+        for chunk in reader:
+            if chunk_filter is not None:
+                chunk = chunk_filter(chunk)
+            if not chunk.empty:
+                kept.append(chunk)
+    except pd.errors.EmptyDataError:
+        pass
+
+    if not kept:
+        return pd.DataFrame(columns=usecols) if usecols else pd.DataFrame()
+    return pd.concat(kept, ignore_index=True)
+
+
+def stream_csv(url: str, timeout: float, **kwargs) -> pd.DataFrame:
+    """
+    GETs a CSV and parses it incrementally as it downloads (see read_csv_chunks for kwargs).
+    The body is never held in memory as a whole. Raises requests exceptions on failure.
+    """
+    with get_session().get(url, timeout=timeout, stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        return read_csv_chunks(response.raw, **kwargs)
+
+
+def _is_retryable(error: requests.exceptions.RequestException) -> bool:
+    """Connection problems, timeouts, broken streams and 5xx answers are worth retrying; 4xx are not."""
+    if isinstance(error, requests.exceptions.HTTPError):
+        return error.response is not None and error.response.status_code >= 500
+    return True
+
+
+def stream_csv_concurrently(urls: Dict[str, str],
+                            total_timeout: float,
+                            request_timeout: float = 120,
+                            retries: int = FETCH_RETRIES,
+                            max_workers: Optional[int] = None,
+                            **csv_kwargs) -> Dict[str, pd.DataFrame]:
+    """
+    Streams several independent CSV queries at once and returns {name: DataFrame} in the
+    order of `urls`, so the whole batch takes about as long as its slowest query.
+
+    Each query is retried up to `retries` times with exponential backoff on retryable
+    errors. All queries share one deadline `total_timeout` seconds from the call; reaching
+    it raises TimeoutError naming the unfinished queries. A query that runs out of retries
+    re-raises its last requests exception. `csv_kwargs` are passed to read_csv_chunks.
+    """
+    deadline = time.monotonic() + total_timeout
+
+    def fetch(url: str) -> pd.DataFrame:
+        for attempt in range(retries + 1):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"No time left to request {url}")
+            try:
+                return stream_csv(url, timeout=min(request_timeout, remaining), **csv_kwargs)
+            except requests.exceptions.RequestException as e:
+                if attempt == retries or not _is_retryable(e):
+                    raise
+                print(f"[HTTP] Retrying ({attempt + 1}/{retries}) after error: {e}")
+                time.sleep(min(RETRY_BACKOFF_SECONDS * 2 ** attempt, max(0.0, deadline - time.monotonic())))
+
+    executor = ThreadPoolExecutor(max_workers=max_workers or max(1, len(urls)))
+    try:
+        futures = {name: executor.submit(fetch, url) for name, url in urls.items()}
+        _, pending = wait(futures.values(), timeout=max(0.0, deadline - time.monotonic()))
+        if pending:
+            unfinished = [name for name, future in futures.items() if future in pending]
+            raise TimeoutError(f"Downloads did not finish within {total_timeout:g} s: {', '.join(unfinished)}")
+        return {name: future.result() for name, future in futures.items()}
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,82 @@
+'''
+Shared helpers for parsing the pre-formatted hourly bulletins published by the
+Missouri Mesonet (agebb.missouri.edu <pre> pages).
+
+Used by both generator.py and the standalone Mesonet.py parser so the two stay
+in agreement on how the data block is located, read and timestamped.
+
+Author: Nathan Beach
+Last Modified: October 16, 2026
+'''
+
+import io
+import re
+import numpy as np
+import pandas as pd
+from typing import List, Optional
+
+# First line of the hourly data block: month, day and HHMM time
+DATA_LINE_PATTERN = re.compile(r'^[ \t]*\d{1,2}\s+\d{1,2}\s+\d{3,4}', re.MULTILINE)
+# Any numeric row inside the data block (text, blank and footer lines are dropped)
+NUMERIC_ROW_PATTERN = re.compile(r'^[ \t]*\d.*$', re.MULTILINE)
+
+
+def extract_data_block(raw_text: str) -> Optional[str]:
+    """
+    Returns only the numeric rows of a bulletin, starting at the first month/day/time line.
+    Header, blank and footer lines are located here rather than by fixed skip counts, so the
+    block can be handed straight to the C CSV engine. Returns None if no data line exists.
+    """
+    start_match = DATA_LINE_PATTERN.search(raw_text)
+    if start_match is None:
+        return None
+    return '\n'.join(NUMERIC_ROW_PATTERN.findall(raw_text, start_match.start()))
+
+
+def read_bulletin_block(raw_text: str, names: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+    """
+    Reads the whitespace-separated data block of a bulletin with pandas' C engine.
+    Columns are numbered 0..N-1 unless `names` is given. Returns None if no data line exists;
+    malformed blocks raise the usual pandas parser errors.
+    """
+    block = extract_data_block(raw_text)
+    if block is None:
+        return None
+    return pd.read_csv(io.StringIO(block), sep=r'\s+', header=None, names=names, engine='c')
+
+
+def build_valid_times(month: pd.Series, day: pd.Series, time_hhmm: pd.Series, year: int) -> pd.Series:
+    """
+    Builds naive datetimes from the bulletin's Month / Day / Time_HHMM columns in one pass.
+
+    Matches the old row-by-row combine_date_time helper:
+        - Month, Day and Time are truncated to integers (as int() did).
+        - Time 2400 rolls over to 00:00 of the following day.
+        - Rows with missing parts, negative times, minutes >= 60, hours >= 24 (other than 2400)
+          or impossible calendar dates become NaT.
+    """
+    month = pd.to_numeric(month, errors='coerce').astype('float64')
+    day = pd.to_numeric(day, errors='coerce').astype('float64')
+    time_hhmm = pd.to_numeric(time_hhmm, errors='coerce').astype('float64')
+
+    time_int = np.trunc(time_hhmm)
+    hour = time_int // 100
+    minute = time_int % 100
+
+    # 2400 (end of day) is the only hour >= 24 allowed, and it carries 24 * 60 minutes into the next day
+    valid_rows = (
+        month.notna() & day.notna() & time_hhmm.notna() & (time_int >= 0) & (minute < 60)
+        & ((hour < 24) | (time_hhmm == 2400))
+    )
+
+    dates = pd.to_datetime(
+        pd.DataFrame({
+            'year': year,
+            'month': np.trunc(month.where(valid_rows)),
+            'day': np.trunc(day.where(valid_rows)),
+        }),
+        errors='coerce'
+    )
+    offsets = pd.to_timedelta((hour * 60 + minute).where(valid_rows), unit='min')
+
+    return (dates + offsets).where(valid_rows)
@@ -0,0 +1,63 @@
+'''
+Vectorized decoding of raw METAR strings (the IEM 'metar' column).
+
+The wind group and the SLP remark are pulled out of a whole column at once with
+compiled patterns (pandas str.extract), instead of running re.search line by
+line over the joined response text. Results come back as typed columns aligned
+with the input index, so they can be attached to the parsed DataFrame directly.
+
+Author: Nathan Beach
+Last Modified: October 16, 2026
+'''
+
+import re
+import numpy as np
+import pandas as pd
+
+# dddff(f)(Gff(f))KT -- direction may be VRB, speed and gust are 2-3 digits
+WIND_PATTERN = re.compile(r'\b(?P<dir>VRB|\d{3})(?P<speed>\d{2,3})(?:G(?P<gust>\d{2,3}))?KT\b')
+# SLPppp remark -- sea level pressure in tenths of hPa, leading 9/10 dropped
+SLP_PATTERN = re.compile(r'\bSLP(?P<slp>\d{3})\b')
+
+
+def decode_slp(slp_code: pd.Series) -> pd.Series:
+    """
+    Converts 3-digit SLP remark codes to hPa. Codes below 500 are read as 10xx.x hPa,
+    the rest as 9xx.x hPa (the usual METAR convention). Missing codes stay NaN.
+    """
+    tenths = pd.to_numeric(slp_code, errors='coerce').astype('float64')
+    return pd.Series(np.where(tenths < 500, 1000.0, 900.0) + tenths / 10.0, index=slp_code.index, name='slp_hpa')
+
+
+def slp_station_code(slp_hpa: pd.Series) -> pd.Series:
+    """Inverse of decode_slp for plotting: the 3-digit code ('835' for 983.5 hPa), None where missing."""
+    tenths = np.round(pd.to_numeric(slp_hpa, errors='coerce') * 10) % 1000
+    return tenths.map(lambda code: None if pd.isna(code) else f'{int(code):03d}')
+
+
+def decode_metar(metar: pd.Series) -> pd.DataFrame:
+    """
+    Decodes a column of raw METAR strings.
+
+    Returns a DataFrame on the same index with float columns
+        slp_hpa         sea level pressure (hPa) from the SLP remark
+        wind_dir_deg    wind direction (degrees; NaN for VRB)
+        wind_speed_kt   sustained wind speed (knots)
+        wind_gust_kt    gust speed (knots; NaN without a gust group)
+    Reports without a group (or missing METARs) get NaN for the affected columns.
+    """
+    metar = metar.astype('string')
+    wind = metar.str.extract(WIND_PATTERN)
+    slp = metar.str.extract(SLP_PATTERN)
+
+    return pd.DataFrame({
+        'slp_hpa': decode_slp(slp['slp']),
+        'wind_dir_deg': pd.to_numeric(wind['dir'].replace('VRB', pd.NA), errors='coerce').astype('float64'),
+        'wind_speed_kt': pd.to_numeric(wind['speed'], errors='coerce').astype('float64'),
+        'wind_gust_kt': pd.to_numeric(wind['gust'], errors='coerce').astype('float64'),
+    }, index=metar.index)
+
+
+def attach_decoded_metar(df: pd.DataFrame, metar_column: str = 'metar') -> pd.DataFrame:
+    """Returns `df` with the decode_metar columns appended (row-aligned by index)."""
+    return pd.concat([df, decode_metar(df[metar_column])], axis=1)
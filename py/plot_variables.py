@@ -0,0 +1,39 @@
+'''
+Gridded variables that are drawn as map products, and their output names.
+
+Shared by generator.render_maps (cartopy maps) and raster_renderer (plain
+PNG rasters) so both write the same file names and color tables. Kept free
+of heavy imports on purpose: importing it must not pull in cartopy,
+matplotlib figures or the station registry.
+
+Author: Nathan Beach
+Last Modified: October 16, 2026
+'''
+
+# --- Configuration Constants ---
+# Mapping from xarray variable name to final PNG filename suffix
+VARIABLE_TO_FILENAME = {
+    'T_2m': 'air_temp',
+    'Td_2m': 'dew_point',
+    'RH': 'relative_humidity',
+    'WS': 'wind_speed',
+    'WG': 'wind_gust',
+    'ST_2in': 'soil_temp_2in',
+    'ST_4in': 'soil_temp_4in',
+}
+
+# Variables rendered as PNG maps by render_maps (title and color table)
+PLOT_VARIABLES = {
+    'T_2m': {'title': '2-meter Air Temperature', 'cmap': 'RdYlBu_r'},
+    'Td_2m': {'title': '2-meter Dew Point', 'cmap': 'viridis'},
+    'RH': {'title': 'Relative Humidity', 'cmap': 'Greens'},
+    'WS': {'title': 'Wind Speed', 'cmap': 'YlOrRd'},
+    'WG': {'title': 'Wind Gust Speed', 'cmap': 'Reds'},
+    'ST_2in': {'title': 'Soil Temp 2in', 'cmap': 'YlOrBr'},
+    'ST_4in': {'title': 'Soil Temp 4in', 'cmap': 'YlOrBr_r'},
+}
+
+
+def map_filename(var_name: str) -> str:
+    """PNG file name of a variable's map or raster, e.g. 'interpolated_air_temp.png'."""
+    return f"interpolated_{VARIABLE_TO_FILENAME.get(var_name, var_name.lower())}.png"
@@ -0,0 +1,203 @@
+'''
+Fast raster rendering of the gridded fields, without cartopy or matplotlib figures.
+
+plot_gridded_data draws a full cartopy map (basemap, 20-level contourf,
+colorbar, title) and saves it with bbox_inches='tight' at 150 dpi. Consumers
+that overlay the analysis on their own map only need the colored field itself,
+one pixel per grid cell. This module produces exactly that, with NumPy only:
+
+    1. the field is scaled to [vmin, vmax] and quantized into LUT_SIZE
+       (or `levels`) bins
+    2. the bins index a precomputed RGBA lookup table of the color map;
+       NaN cells (outside the station coverage) become fully transparent;
+       matplotlib is only asked once per color map to fill the table
+    3. the RGBA rows are written as a PNG with zlib + struct
+    4. georeferencing is written next to it: a .pgw world file (GDAL/QGIS/
+       Leaflet plugins) and a .json sidecar with the bounds, CRS, value range,
+       units and valid time
+
+North is at the top of the image and pixel centers sit on the grid points, so
+the image registers with the NetCDF file exactly.
+
+Example:
+    python raster_renderer.py ./Data/mo_surface_3km_regridded.nc --output-dir ./images/rasters
+
+Author: Nathan Beach
+Last Modified: October 16, 2026
+'''
+
+import os
+import json
+import zlib
+import time
+import struct
+import argparse
+import numpy as np
+import pandas as pd
+import xarray as xr
+from functools import lru_cache
+from matplotlib import colormaps
+from typing import Any, Dict, List, Optional
+
+from plot_variables import PLOT_VARIABLES, map_filename
+
+# --- Configuration Constants ---
+BASE_RASTER_DIR = os.path.join('.', 'images', 'rasters')
+# Colors in a lookup table (bins between vmin and vmax)
+LUT_SIZE = 256
+# zlib level of the PNG data stream (1 = fastest, 9 = smallest)
+PNG_COMPRESSION_LEVEL = 6
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+RASTER_CRS = 'EPSG:4326'
+
+
+@lru_cache(maxsize=None)
+def colormap_lut(cmap: str, size: int = LUT_SIZE) -> np.ndarray:
+    """(size + 1, 4) uint8 RGBA table of a named color map; the last row is transparent (NaN)."""
+    lut = np.zeros((size + 1, 4), dtype=np.uint8)
+    lut[:size] = colormaps[cmap](np.linspace(0.0, 1.0, size), bytes=True)
+    lut.setflags(write=False)
+    return lut
+
+
+def quantize(values: np.ndarray, vmin: float, vmax: float, size: int = LUT_SIZE) -> np.ndarray:
+    """LUT indices of `values`: size bins over [vmin, vmax] (clipped), and `size` for NaN."""
+    values = np.asarray(values, dtype=np.float64)
+    span = vmax - vmin if vmax > vmin else 1.0
+    with np.errstate(invalid='ignore'):
+        scaled = np.clip((values - vmin) * (size / span), 0, size - 1)
+    indices = np.full(values.shape, size, dtype=np.intp)
+    valid = np.isfinite(values)
+    indices[valid] = scaled[valid].astype(np.intp)
+    return indices
+
+
+def encode_png(rgba: np.ndarray, compression: int = PNG_COMPRESSION_LEVEL) -> bytes:
+    """Encodes an (height, width, 4) uint8 array as an 8-bit RGBA PNG (filter type 0 on every row)."""
+    height, width, _ = rgba.shape
+    # Every scanline is prefixed with its filter type byte (0 = None)
+    scanlines = np.zeros((height, width * 4 + 1), dtype=np.uint8)
+    scanlines[:, 1:] = rgba.reshape(height, width * 4)
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+    header = struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)
+    return b''.join([
+        PNG_SIGNATURE,
+        chunk(b'IHDR', header),
+        chunk(b'IDAT', zlib.compress(scanlines.tobytes(), compression)),
+        chunk(b'IEND', b''),
+    ])
+
+
+def field_to_rgba(values: np.ndarray, cmap: str, vmin: float, vmax: float,
+                  levels: Optional[int] = None) -> np.ndarray:
+    """
+    RGBA image of a 2D field through the `cmap` lookup table; NaN is transparent. `levels`
+    (e.g. 20, like contourf) quantizes into that many flat color bands instead of LUT_SIZE.
+    """
+    size = levels or LUT_SIZE
+    return colormap_lut(cmap, size)[quantize(values, vmin, vmax, size)]
+
+
+def _world_file(lons: np.ndarray, lats: np.ndarray) -> str:
+    """
+    ESRI world file lines for west -> east `lons` and north -> south `lats`: pixel size,
+    rotation terms and the center of the upper-left pixel.
+    """
+    dx = (lons[-1] - lons[0]) / max(len(lons) - 1, 1)
+    dy = (lats[-1] - lats[0]) / max(len(lats) - 1, 1)
+    return '\n'.join(f'{v:.10f}' for v in (dx, 0.0, 0.0, dy, lons[0], lats[0])) + '\n'
+
+
+def render_raster(da: xr.DataArray, path: str, cmap: str, vmin: Optional[float] = None,
+                  vmax: Optional[float] = None, levels: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Writes one (latitude, longitude) field to `path` (.png) with its .pgw world file and .json
+    sidecar, and returns the sidecar contents. The value range defaults to the field's own
+    finite min/max; pass fixed `vmin`/`vmax` to keep colors comparable between hours.
+    """
+    if set(da.dims) != {'latitude', 'longitude'}:
+        raise ValueError(f"render_raster needs a (latitude, longitude) field, got {da.name} with dims {da.dims}; "
+                         "select one time first (render_rasters does this per hour)")
+    da = da.transpose('latitude', 'longitude')
+    lats = da['latitude'].values
+    lons = da['longitude'].values
+    values = da.values
+    # Image rows run north -> south
+    if lats[0] < lats[-1]:
+        values = values[::-1]
+        lats = lats[::-1]
+
+    finite = values[np.isfinite(values)]
+    if vmin is None:
+        vmin = float(finite.min()) if finite.size else 0.0
+    if vmax is None:
+        vmax = float(finite.max()) if finite.size else 1.0
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(encode_png(field_to_rgba(values, cmap, vmin, vmax, levels)))
+
+    stem = os.path.splitext(path)[0]
+    with open(f'{stem}.pgw', 'w', encoding='utf-8') as f:
+        f.write(_world_file(lons, lats))
+
+    half_dx = abs(lons[-1] - lons[0]) / max(len(lons) - 1, 1) / 2
+    half_dy = abs(lats[-1] - lats[0]) / max(len(lats) - 1, 1) / 2
+    metadata = {
+        'variable': da.name,
+        'long_name': da.attrs.get('long_name'),
+        'units': da.attrs.get('units'),
+        'time': pd.Timestamp(da['time'].item()).isoformat() if 'time' in da.coords and da['time'].size == 1 else None,
+        'crs': RASTER_CRS,
+        'width': len(lons),
+        'height': len(lats),
+        # Outer edges of the edge pixels: [min_lon, max_lon, min_lat, max_lat]
+        'bounds': [float(lons.min() - half_dx), float(lons.max() + half_dx), float(lats.min() - half_dy), float(lats.max() + half_dy)],
+        'cmap': cmap,
+        'vmin': vmin,
+        'vmax': vmax,
+        'levels': levels or LUT_SIZE,
+        'nodata': 'transparent',
+    }
+    with open(f'{stem}.json', 'w', encoding='utf-8') as f:
+        json.dump(metadata, f, indent=1)
+    return metadata
+
+
+def render_rasters(ds: xr.Dataset, raster_dir: str = BASE_RASTER_DIR, levels: Optional[int] = None) -> List[str]:
+    """
+    Renders every PLOT_VARIABLES field of `ds` to `raster_dir`/interpolated_<name>.png (same
+    names as the cartopy maps) and returns the paths. Like generator.render_maps, a dataset with
+    a time dimension (e.g. from regrid_and_save_batch) renders each hour into `raster_dir`/<YYYYMMDDHH>/.
+    """
+    if 'time' in ds.dims:
+        paths = []
+        for time_index in range(ds.sizes['time']):
+            hour = ds.isel(time=time_index)
+            hour_dir = os.path.join(raster_dir, pd.Timestamp(hour['time'].item()).strftime('%Y%m%d%H'))
+            paths.extend(render_rasters(hour, hour_dir, levels=levels))
+        return paths
+
+    paths = []
+    for var_name, plot_info in PLOT_VARIABLES.items():
+        if var_name not in ds.data_vars:
+            continue
+        path = os.path.join(raster_dir, map_filename(var_name))
+        render_raster(ds[var_name], path, plot_info['cmap'], levels=levels)
+        paths.append(path)
+    return paths
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Write georeferenced PNG rasters of a gridded NetCDF file.')
+    parser.add_argument('netcdf', help='file written by regrid_and_save or regrid_and_save_batch')
+    parser.add_argument('--output-dir', default=BASE_RASTER_DIR, help='raster directory')
+    parser.add_argument('--levels', type=int, default=None, help=f'color bands (default: {LUT_SIZE}, a smooth ramp)')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    with xr.open_dataset(args.netcdf) as ds:
+        written = render_rasters(ds.load(), args.output_dir, levels=args.levels)
+    print(f"[RASTER] Wrote {len(written)} rasters to {args.output_dir} in {time.perf_counter() - start:.3f} s")
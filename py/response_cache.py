@@ -0,0 +1,259 @@
+'''
+Persistent on-disk cache for raw ASOS CSV bodies and Mesonet <pre> blocks.
+
+Entries are keyed by the request URL and the target hour they were fetched for,
+expire after a per-source TTL, and the cache directory is held under a disk
+budget by evicting the least recently used entries first. Re-running the
+pipeline for an hour that is already cached performs no network I/O.
+
+FrameCache applies the same directory/eviction scheme to parsed pandas
+DataFrames (with an in-memory layer on top) so a bulletin is parsed only once
+per revision, and WeightCache does the same for sparse interpolation weight
+matrices (see interpolater.CachedOperatorEngine).
+
+Author: Nathan Beach
+Last Modified: October 16, 2026
+'''
+
+import os
+import time
+import hashlib
+import threading
+import pandas as pd
+import scipy.sparse as sp
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, List, Tuple, Iterable
+
+# --- Configuration Constants ---
+# Default disk budget for the whole cache directory (bytes)
+CACHE_MAX_BYTES = 512 * 1024 * 1024
+CACHE_FILE_SUFFIX = '.cache'
+FRAME_FILE_SUFFIX = '.pkl'
+WEIGHT_FILE_SUFFIX = '.npz'
+# Parsed frames kept in memory per FrameCache before the oldest are dropped
+FRAME_MEMORY_ENTRIES = 256
+
+
+class ResponseCache():
+    """
+    Directory of cached response bodies with TTL expiry and LRU eviction.
+
+    Each entry is one file named after a hash of (url, target hour). The file's mtime
+    records when it was fetched (used for the TTL) and its atime records the last read
+    (used for LRU ordering, set explicitly so it does not depend on mount options).
+    """
+
+    suffix = CACHE_FILE_SUFFIX
+
+    def __init__(self, directory: str, max_bytes: int = CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url: str, target_hour: Optional[datetime] = None) -> str:
+        """Builds the cache key for a URL fetched for a given target hour."""
+        hour_part = target_hour.strftime('%Y%m%d%H') if target_hour is not None else ''
+        return hashlib.sha256(f'{url}|{hour_part}'.encode('utf-8')).hexdigest()
+
+    def path_for(self, key: str) -> str:
+        """Returns the file path backing a cache key."""
+        return os.path.join(self.directory, key + self.suffix)
+
+    def get(self, url: str, target_hour: Optional[datetime], ttl_seconds: float) -> Optional[str]:
+        """Returns the cached body, or None when missing or older than `ttl_seconds`."""
+        path = self.path_for(self.make_key(url, target_hour))
+        try:
+            fetched_at = os.path.getmtime(path)
+        except OSError:
+            return None
+
+        if time.time() - fetched_at > ttl_seconds:
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                text = f.read()
+            # Mark as recently used for LRU eviction (keep mtime as the fetch time)
+            os.utime(path, (time.time(), fetched_at))
+        except OSError:
+            return None
+        return text
+
+    def get_path(self, url: str, target_hour: Optional[datetime], ttl_seconds: float) -> Optional[str]:
+        """Like get(), but returns the path of the cached file so large bodies can be streamed."""
+        path = self.path_for(self.make_key(url, target_hour))
+        try:
+            fetched_at = os.path.getmtime(path)
+            if time.time() - fetched_at > ttl_seconds:
+                return None
+            os.utime(path, (time.time(), fetched_at))
+        except OSError:
+            return None
+        return path
+
+    def put_stream(self, url: str, target_hour: Optional[datetime], blocks: Iterable[bytes]) -> Optional[str]:
+        """Copies a byte stream into the cache block by block; returns the entry's path (None on failure)."""
+        def write(tmp_path: str):
+            with open(tmp_path, 'wb') as f:
+                for block in blocks:
+                    f.write(block)
+        path = self.path_for(self.make_key(url, target_hour))
+        return path if self._store(path, write) else None
+
+    def put(self, url: str, target_hour: Optional[datetime], text: str) -> None:
+        """Stores a body atomically, then evicts old entries if over the disk budget."""
+        def write(tmp_path: str):
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+        self._store(self.path_for(self.make_key(url, target_hour)), write)
+
+    def discard(self, url: str, target_hour: Optional[datetime]) -> None:
+        """Removes an entry (e.g. a body that failed validation after it was streamed in)."""
+        try:
+            os.remove(self.path_for(self.make_key(url, target_hour)))
+        except OSError:
+            pass
+
+    def _store(self, path: str, write) -> bool:
+        """Writes an entry through `write(tmp_path)` and atomically moves it into place."""
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            write(tmp_path)
+            os.replace(tmp_path, path)
+            # Stamp fetch/use times from the same clock that get() compares against
+            now = time.time()
+            os.utime(path, (now, now))
+        except OSError as e:
+            print(f"[CACHE] Warning: Could not write cache entry {path}: {e}")
+            return False
+        finally:
+            # Never leave a partial body behind (e.g. a stream that broke mid-download)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self.evict()
+        return True
+
+    def evict(self) -> None:
+        """Deletes least recently used entries until the directory fits in `max_bytes`."""
+        with self._lock:
+            entries: List[Tuple[float, int, str]] = []
+            try:
+                with os.scandir(self.directory) as it:
+                    for entry in it:
+                        if entry.name.endswith(self.suffix):
+                            stat = entry.stat()
+                            entries.append((stat.st_atime, stat.st_size, entry.path))
+            except OSError:
+                return
+
+            total_bytes = sum(size for _, size, _ in entries)
+            if total_bytes <= self.max_bytes:
+                return
+
+            for _, size, path in sorted(entries):
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total_bytes -= size
+                if total_bytes <= self.max_bytes:
+                    break
+
+
+class FrameCache(ResponseCache):
+    """
+    Two-level cache of parsed DataFrames keyed by an arbitrary string (e.g. station + revision).
+
+    Lookups hit an in-memory LRU first and fall back to pickled frames on disk, which
+    share ResponseCache's LRU eviction against the disk budget. Entries never expire:
+    the key itself identifies the immutable content they were parsed from.
+    """
+    suffix = FRAME_FILE_SUFFIX
+
+    def __init__(self, directory: str, max_bytes: int = CACHE_MAX_BYTES, memory_entries: int = FRAME_MEMORY_ENTRIES):
+        super().__init__(directory, max_bytes)
+        self.memory_entries = memory_entries
+        self._memory: 'OrderedDict[str, pd.DataFrame]' = OrderedDict()
+        self._memory_lock = threading.Lock()
+
+    def get_frame(self, key: str) -> Optional[pd.DataFrame]:
+        """Returns a copy of the cached frame, or None if it is in neither layer."""
+        with self._memory_lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key].copy()
+
+        path = self.path_for(key)
+        try:
+            df = pd.read_pickle(path)
+            os.utime(path, (time.time(), os.path.getmtime(path)))
+        except Exception:
+            return None
+
+        self._remember(key, df)
+        return df.copy()
+
+    def put_frame(self, key: str, df: pd.DataFrame) -> None:
+        """Stores a frame in memory and on disk."""
+        self._remember(key, df.copy())
+        self._store(self.path_for(key), lambda tmp_path: df.to_pickle(tmp_path))
+
+    def _remember(self, key: str, df: pd.DataFrame) -> None:
+        with self._memory_lock:
+            self._memory[key] = df
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+
+class WeightCache(ResponseCache):
+    """
+    Two-level cache of sparse matrices (scipy save_npz files) keyed by an arbitrary string.
+    Same layout as FrameCache: an in-memory LRU over files evicted against the disk budget;
+    entries never expire because the key identifies what the matrix was built from.
+    """
+    suffix = WEIGHT_FILE_SUFFIX
+
+    def __init__(self, directory: str, max_bytes: int = CACHE_MAX_BYTES, memory_entries: int = FRAME_MEMORY_ENTRIES):
+        super().__init__(directory, max_bytes)
+        self.memory_entries = memory_entries
+        self._memory: 'OrderedDict[str, sp.csr_matrix]' = OrderedDict()
+        self._memory_lock = threading.Lock()
+
+    def get_matrix(self, key: str) -> Optional[sp.csr_matrix]:
+        """Returns the cached matrix (treat as read-only), or None if it is in neither layer."""
+        with self._memory_lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+
+        path = self.path_for(key)
+        try:
+            matrix = sp.csr_matrix(sp.load_npz(path))
+            os.utime(path, (time.time(), os.path.getmtime(path)))
+        except Exception:
+            return None
+
+        self._remember(key, matrix)
+        return matrix
+
+    def put_matrix(self, key: str, matrix: sp.spmatrix) -> None:
+        """Stores a matrix in memory and on disk."""
+        matrix = sp.csr_matrix(matrix)
+        self._remember(key, matrix)
+
+        def write(tmp_path: str):
+            # Write through a file object: save_npz would append '.npz' to the temporary name
+            with open(tmp_path, 'wb') as f:
+                sp.save_npz(f, matrix)
+        self._store(self.path_for(key), write)
+
+    def _remember(self, key: str, matrix: sp.csr_matrix) -> None:
+        with self._memory_lock:
+            self._memory[key] = matrix
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
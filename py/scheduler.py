@@ -0,0 +1,225 @@
+'''
+Long-running hourly scheduler that pipelines the live products.
+
+process_and_map_data runs fetch -> merge -> grid -> render strictly in sequence.
+Here each stage runs on its own and hands work to the next one through a
+bounded queue, so the network and the CPU are busy at the same time:
+
+    ingest   (main thread) waits for the trigger SCHEDULE_DELAY_SECONDS after
+             the top of every hour and fetches ASOS and Mesonet concurrently
+    grid     (thread) merges, grids and writes the hour's NetCDF file
+    render   (thread) draws the hour's PLOT_VARIABLES maps with
+             generator.render_maps (a process pool reading the grid from
+             shared memory) and publishes them
+    prefetch (thread) re-polls the Mesonet bulletins PREFETCH_LEAD_SECONDS
+             before the next trigger, so the top-of-hour fetch mostly revalidates
+             (304) warm connections and already-parsed bulletins
+
+While one hour is gridded and rendered, the ingest stage is already waiting for
+(and fetching) the next one. Queues are bounded: a stage that falls behind
+blocks the stage before it instead of piling up hours in memory. A failing
+cycle is logged and skipped; the service keeps running.
+
+Every hour is written to its own staging paths first and then swapped into the
+published NetCDF/PNG paths with os.replace. The grid and render stages each
+handle one hour at a time in order, so a late older hour can never overwrite a
+newer one, and readers never see a half-written file. Each cycle reports its
+top-of-hour -> published latency.
+
+Example:
+    python scheduler.py                 # run until interrupted
+    python scheduler.py --once          # one cycle for the current hour, now
+
+Author: Nathan Beach
+Last Modified: October 16, 2026
+'''
+
+import os
+import time
+import queue
+import argparse
+import threading
+import xarray as xr
+import pandas as pd
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import generator
+
+# --- Configuration Constants ---
+# Seconds after the top of the hour at which a cycle starts (gives late reports time to arrive)
+SCHEDULE_DELAY_SECONDS = 5 * 60
+# Seconds before the next trigger at which the Mesonet bulletins are pre-polled
+PREFETCH_LEAD_SECONDS = 4 * 60
+# Fetched hours waiting to be gridded
+GRID_QUEUE_SIZE = 2
+# Gridded hours waiting to be rendered
+RENDER_QUEUE_SIZE = 1
+# Per-hour staging directory (inside the map directory) that renders write to before publishing
+STAGING_DIRNAME = '.staging'
+
+
+def utc_now() -> datetime:
+    """Current UTC time as a naive datetime (the convention of every generator.py timestamp)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class HourlyScheduler():
+    """
+    Runs the ingest / grid / render pipeline once per hour (see module docstring).
+    `render_workers` is passed to generator.render_maps (None: every core). `max_cycles`
+    stops after that many cycles; `run_now` starts the first cycle immediately for the
+    current hour instead of waiting for the next trigger.
+    """
+
+    def __init__(self, render_workers: Optional[int] = None, delay_seconds: float = SCHEDULE_DELAY_SECONDS,
+                 prefetch_lead_seconds: float = PREFETCH_LEAD_SECONDS, engine_name: str = generator.GRID_INTERPOLATION_ENGINE,
+                 output_filename: str = 'mo_surface_3km_regridded.nc', map_dir: str = generator.BASE_MAP_DIR,
+                 max_cycles: Optional[int] = None, run_now: bool = False):
+        self.render_workers = render_workers
+        self.delay_seconds = delay_seconds
+        self.prefetch_lead_seconds = prefetch_lead_seconds
+        self.engine_name = engine_name
+        self.output_filename = output_filename
+        self.map_dir = map_dir
+        self.max_cycles = max_cycles
+        self.run_now = run_now
+
+        self._grid_queue: 'queue.Queue[Optional[tuple]]' = queue.Queue(maxsize=GRID_QUEUE_SIZE)
+        self._render_queue: 'queue.Queue[Optional[tuple]]' = queue.Queue(maxsize=RENDER_QUEUE_SIZE)
+        self._stop = threading.Event()
+
+    def trigger_time(self, target_hour: datetime) -> datetime:
+        """Wall-clock time at which the cycle for `target_hour` starts."""
+        return target_hour + timedelta(seconds=self.delay_seconds)
+
+    def _sleep_until(self, moment: datetime) -> bool:
+        """Sleeps until `moment` (UTC); returns False if the scheduler was stopped meanwhile."""
+        return not self._stop.wait(max(0.0, (moment - utc_now()).total_seconds()))
+
+    def _ingest(self, fetch_pool: ThreadPoolExecutor, target_hour: datetime) -> pd.DataFrame:
+        """Fetches ASOS and Mesonet for `target_hour` concurrently and merges them."""
+        asos = fetch_pool.submit(generator.fetch_and_process_asos, target_hour)
+        mesonet = fetch_pool.submit(generator.fetch_and_process_mesonet, target_hour)
+        return generator.merge_reports(asos.result(), mesonet.result())
+
+    def _prefetch(self, target_hour: datetime) -> None:
+        """Pre-polls the Mesonet bulletins ahead of the cycle for `target_hour`."""
+        if not self._sleep_until(self.trigger_time(target_hour) - timedelta(seconds=self.prefetch_lead_seconds)):
+            return
+        try:
+            print(f"[SCHEDULER] Prefetching Mesonet bulletins ahead of {target_hour:%Y-%m-%d %H}Z")
+            generator.fetch_mesonet_frames()
+        except Exception as e:
+            print(f"[SCHEDULER] Warning: Prefetch failed: {e}")
+
+    def _grid_stage(self) -> None:
+        """Grid thread: grids each fetched hour, publishes its NetCDF file and queues it for rendering."""
+        while True:
+            item = self._grid_queue.get()
+            if item is None:
+                self._render_queue.put(None)
+                return
+            target_hour, merged_df = item
+            try:
+                if merged_df.empty:
+                    print(f"[SCHEDULER] No usable reports for {target_hour:%Y-%m-%d %H}Z; skipping this cycle.")
+                    continue
+                stem, extension = os.path.splitext(self.output_filename)
+                staging_filename = f'{stem}_{target_hour:%Y%m%d%H}{extension}'
+                ds = generator.regrid_and_save(
+                    raw_df=merged_df, resolution_km=generator.GRID_RESOLUTION_KM, bounds=generator.MISSOURI_BOUNDS,
+                    output_filepath=staging_filename, engine=generator.make_engine(self.engine_name)
+                )
+                staging_path = os.path.join(generator.BASE_DATA_DIR, staging_filename)
+                if os.path.exists(staging_path):
+                    os.replace(staging_path, os.path.join(generator.BASE_DATA_DIR, self.output_filename))
+                # Blocks while the render stage is still busy with the previous hour
+                self._render_queue.put((target_hour, ds))
+            except Exception as e:
+                print(f"[SCHEDULER] Gridding failed for {target_hour:%Y-%m-%d %H}Z: {e}")
+
+    def _render_stage(self) -> None:
+        """Render thread: renders each gridded hour into its staging directory, then publishes the maps."""
+        while True:
+            item = self._render_queue.get()
+            if item is None:
+                return
+            target_hour, ds = item
+            try:
+                self._publish_maps(target_hour, ds)
+            except Exception as e:
+                print(f"[SCHEDULER] Rendering failed for {target_hour:%Y-%m-%d %H}Z: {e}")
+
+    def _publish_maps(self, target_hour: datetime, ds: xr.Dataset) -> None:
+        staging_dir = os.path.join(self.map_dir, STAGING_DIRNAME, f'{target_hour:%Y%m%d%H}')
+        generator.render_maps(ds, staging_dir, workers=self.render_workers)
+
+        published = 0
+        if os.path.isdir(staging_dir):
+            for filename in sorted(os.listdir(staging_dir)):
+                os.replace(os.path.join(staging_dir, filename), os.path.join(self.map_dir, filename))
+                published += 1
+            os.rmdir(staging_dir)
+        expected = sum(var_name in ds.data_vars for var_name in generator.PLOT_VARIABLES)
+        latency = (utc_now() - target_hour).total_seconds()
+        print(f"[SCHEDULER] Published {target_hour:%Y-%m-%d %H}Z: {published}/{expected} maps, {latency:.0f} s after the top of the hour")
+
+    def run(self) -> None:
+        """Runs cycles until interrupted (Ctrl+C) or `max_cycles` is reached."""
+        now = utc_now()
+        target_hour = now.replace(minute=0, second=0, microsecond=0)
+        if not self.run_now and now >= self.trigger_time(target_hour):
+            target_hour += timedelta(hours=1)
+
+        fetch_pool = ThreadPoolExecutor(max_workers=2)
+        grid_thread = threading.Thread(target=self._grid_stage, name='grid-stage')
+        render_thread = threading.Thread(target=self._render_stage, name='render-stage')
+        grid_thread.start()
+        render_thread.start()
+
+        cycles = 0
+        try:
+            while self.max_cycles is None or cycles < self.max_cycles:
+                if not (self.run_now and cycles == 0):
+                    threading.Thread(target=self._prefetch, args=(target_hour,), daemon=True).start()
+                    print(f"[SCHEDULER] Next cycle: {target_hour:%Y-%m-%d %H}Z at {self.trigger_time(target_hour):%H:%M:%S} UTC")
+                    if not self._sleep_until(self.trigger_time(target_hour)):
+                        break
+
+                started = time.perf_counter()
+                try:
+                    merged_df = self._ingest(fetch_pool, target_hour)
+                    print(f"[SCHEDULER] Ingested {len(merged_df)} reports for {target_hour:%Y-%m-%d %H}Z in {time.perf_counter() - started:.1f} s")
+                    # Blocks when gridding has fallen GRID_QUEUE_SIZE hours behind
+                    self._grid_queue.put((target_hour, merged_df))
+                except Exception as e:
+                    print(f"[SCHEDULER] Ingest failed for {target_hour:%Y-%m-%d %H}Z: {e}")
+
+                cycles += 1
+                target_hour += timedelta(hours=1)
+        except KeyboardInterrupt:
+            print("\n[SCHEDULER] Interrupted; finishing queued work...")
+        finally:
+            self._stop.set()
+            self._grid_queue.put(None)
+            grid_thread.join()
+            render_thread.join()
+            fetch_pool.shutdown()
+            print("[SCHEDULER] Stopped.")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Produce the gridded surface products every hour.')
+    parser.add_argument('--once', action='store_true', help='run a single cycle for the current hour immediately')
+    parser.add_argument('--cycles', type=int, default=None, help='stop after this many cycles')
+    parser.add_argument('--render-workers', type=int, default=None, help='map render processes (default: every core)')
+    parser.add_argument('--delay', type=float, default=SCHEDULE_DELAY_SECONDS, help='seconds after the top of the hour to start a cycle')
+    parser.add_argument('--engine', default=generator.GRID_INTERPOLATION_ENGINE, help='interpolation engine (see interpolater.py)')
+    args = parser.parse_args()
+
+    HourlyScheduler(
+        render_workers=args.render_workers, delay_seconds=args.delay, engine_name=args.engine,
+        max_cycles=1 if args.once else args.cycles, run_now=args.once
+    ).run()
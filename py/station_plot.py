@@ -0,0 +1,155 @@
+'''
+Batched station-model rendering for the surface station maps.
+
+Station coordinates are projected into the map projection once with a single
+vectorized transform_points call, and each station-model field is drawn as one
+artist (MetPy StationPlot TextCollections for the text fields, one barb and one
+scatter collection) instead of one ax.text per station and value. The layout
+matches the original map_generation.py station model:
+
+      temp (red)       | pressure (blue)
+                  cloud/barb
+      dewpoint (green) | station id (black)
+
+Before drawing, overlapping stations can be thinned with a KD-tree (MetPy
+reduce_point_density): stations are visited in priority order and every lower
+priority station closer than a minimum separation is dropped. The separation is
+derived from the map extent, so zooming in reveals more stations.
+
+Author: Nathan Beach
+Last Modified: October 16, 2026
+'''
+
+import numpy as np
+import cartopy.crs as ccrs
+import metpy.calc as mpcalc
+from matplotlib import cbook
+from metpy.plots import StationPlot
+from metpy.plots.text import TextCollection
+from typing import Optional, Sequence, Tuple
+
+# --- Configuration Constants ---
+STATION_FONT_SIZE = 12
+BARB_LENGTH = 10
+BARB_LINEWIDTH = 1.4
+STATION_ZORDER = 10
+# Minimum distance between plotted stations as a fraction of the projected map width
+STATION_SEPARATION_FRACTION = 0.025
+
+
+class StationText(TextCollection):
+    """
+    MetPy TextCollection (one artist drawing one string per station) that also draws on
+    matplotlib >= 3.11, where Text._get_layout describes each line as (text, size, (x, y))
+    instead of the (text, size, x, y) that TextCollection.draw unpacks.
+    """
+
+    def _get_layout(self, renderer):
+        bbox, info, descent = super()._get_layout(renderer)
+        return bbox, [line if len(line) == 4 else (line[0], line[1], *line[2]) for line in info], descent
+
+
+class StationModelPlot(StationPlot):
+    """StationPlot whose text fields are drawn with StationText (see above)."""
+
+    def plot_text(self, location, text, **kwargs):
+        location = self._handle_location(location)
+        kwargs = {'verticalalignment': 'center', 'horizontalalignment': 'center', 'clip_on': False,
+                  'transform': self.ax.transData, **self._make_kwargs(kwargs)}
+        size = kwargs.pop('fontsize', self.fontsize)
+
+        x, y, text = cbook.delete_masked_points(self.x, self.y, text)
+        if location in self.items:
+            self.items.pop(location).remove()
+        if x.size == 0:
+            return None
+
+        text_collection = StationText(x, y, text, offset=location, size=size, **kwargs)
+        self.ax.add_artist(text_collection)
+        # Text is not clipped by the axes patch path; clip to the axes box like MetPy's scattertext
+        text_collection.clipbox = self.ax.bbox
+        self.items[location] = text_collection
+        return text_collection
+
+
+def project_stations(projection: ccrs.Projection, lons: np.ndarray, lats: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Projects lon/lat arrays (degrees) into `projection` coordinates in one vectorized call."""
+    points = projection.transform_points(ccrs.PlateCarree(), np.asarray(lons, dtype=float), np.asarray(lats, dtype=float))
+    return points[:, 0], points[:, 1]
+
+
+def separation_for_extent(projection: ccrs.Projection, extent: Sequence[float],
+                          fraction: float = STATION_SEPARATION_FRACTION) -> float:
+    """
+    Minimum station separation (projection units) for a [min_lon, max_lon, min_lat, max_lat]
+    extent: `fraction` of the extent's projected width, so it shrinks as the map zooms in.
+    """
+    min_lon, max_lon, min_lat, max_lat = extent
+    corners = projection.transform_points(
+        ccrs.PlateCarree(), np.array([min_lon, max_lon, min_lon, max_lon]), np.array([min_lat, min_lat, max_lat, max_lat])
+    )
+    return fraction * (corners[:, 0].max() - corners[:, 0].min())
+
+
+def thin_stations(x: np.ndarray, y: np.ndarray, min_separation: float,
+                  priority: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Boolean mask of the stations to keep so that no two kept stations are closer than
+    `min_separation` (same units as x/y). Higher `priority` stations are kept first;
+    non-finite coordinates are always dropped. Uses a KD-tree, O(n log n).
+    """
+    points = np.column_stack([np.asarray(x, dtype=float), np.asarray(y, dtype=float)])
+    if priority is not None:
+        # Stable tie-break on input order so equal-priority stations thin deterministically
+        priority = np.asarray(priority, dtype=float) - np.arange(len(points)) / (10.0 * max(len(points), 1))
+    return mpcalc.reduce_point_density(points, min_separation, priority=priority)
+
+
+def station_priority(*fields: np.ndarray) -> np.ndarray:
+    """Priority score = number of usable (finite, and non-empty for strings) values each station reports."""
+    score = np.zeros(len(fields[0]), dtype=float)
+    for field in fields:
+        field = np.asarray(field)
+        if field.dtype.kind in 'fc':
+            score += np.isfinite(field)
+        else:
+            score += np.array([value not in (None, '', 'None', 'nan') for value in field])
+    return score
+
+
+def plot_station_models(ax, projection: ccrs.Projection, lons: np.ndarray, lats: np.ndarray,
+                        air_temp: np.ndarray, dew_point: np.ndarray, pressure: np.ndarray, station_id: np.ndarray,
+                        u: np.ndarray, v: np.ndarray, cloud_cover: Optional[np.ndarray] = None,
+                        fontsize: int = STATION_FONT_SIZE, barb_length: float = BARB_LENGTH,
+                        min_separation: Optional[float] = None, priority: Optional[np.ndarray] = None) -> StationModelPlot:
+    """
+    Draws the station model for every station on a map axes using `projection`.
+
+    Coordinates are projected once; every field then becomes a single collection drawn
+    in projection coordinates, so the artist count does not grow with the station count.
+    Text fields use StationText, which draws on every supported matplotlib version.
+    With `min_separation` (projection units, see separation_for_extent) stations are first
+    thinned by thin_stations using `priority`. Returns the StationModelPlot so callers can add
+    further fields.
+    """
+    x, y = project_stations(projection, lons, lats)
+
+    if min_separation is not None:
+        keep = thin_stations(x, y, min_separation, priority)
+        x, y = x[keep], y[keep]
+        air_temp, dew_point, pressure, station_id, u, v = (
+            np.asarray(field)[keep] for field in (air_temp, dew_point, pressure, station_id, u, v)
+        )
+        if cloud_cover is not None:
+            cloud_cover = np.asarray(cloud_cover)[keep]
+
+    if cloud_cover is not None:
+        ax.scatter(x, y, c=cloud_cover, cmap='Reds', transform=projection, zorder=STATION_ZORDER)
+
+    stationplot = StationModelPlot(ax, x, y, transform=projection, fontsize=fontsize, zorder=STATION_ZORDER)
+    stationplot.plot_parameter('NW', air_temp, formatter='.1f', color='red')
+    stationplot.plot_parameter('SW', dew_point, formatter='.0f', color='green')
+    stationplot.plot_text('NE', pressure, color='blue')
+    stationplot.plot_text('SE', station_id, color='black')
+    stationplot.plot_barb(u, v, length=barb_length, linewidth=BARB_LINEWIDTH)
+    return stationplot
@@ -0,0 +1,251 @@
+'''
+Single registry of every surface station the pipeline knows about.
+
+Stations live in one table (Data/station_registry.csv) with the columns
+    id, network, region, state, lat, lon, source, key, url
+where `source` is 'asos' (IEM METAR/ASOS sites) or 'mesonet' (Missouri Mesonet
+bulletin pages; `key` is the bull# identifier and `url` the bulletin page).
+Regions follow the groupings used by map_generation.py: CARIBB, CAN, GRL, CAM,
+MEX, CONUS and OCONUS; `state` is the lower-case state/province/country name.
+
+StationRegistry indexes the table by region, state and source, and by a
+regular lat/lon grid, so "all stations in state Y" or "all stations in bbox X"
+are dictionary lookups instead of scans. IEM query strings (station=...&) and
+Mesonet metadata are built from those lookups.
+
+Stations without coordinates are invisible to bbox lookups. The first bbox
+lookup that would skip ASOS stations fetches their networks' coordinates from
+IEM's network GeoJSON and saves them to the CSV, so the spatial index works on
+a fresh checkout and stays offline afterwards (a lookup still warns if stations
+remain unlocated). Coordinates are also filled in memory from every ASOS
+response the pipeline downloads (IEM returns lat/lon per report); run this
+module with --refresh-coordinates to fill the whole registry at once.
+
+Author: Nathan Beach
+Last Modified: October 16, 2026
+'''
+
+import os
+import argparse
+import threading
+import numpy as np
+import pandas as pd
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
+
+# --- Configuration Constants ---
+REGISTRY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Data', 'station_registry.csv')
+REGISTRY_COLUMNS = ['id', 'network', 'region', 'state', 'lat', 'lon', 'source', 'key', 'url']
+# Size (degrees) of the lat/lon cells used by the spatial index
+GRID_CELL_DEG = 1.0
+# IEM network metadata (station coordinates) used by --refresh-coordinates
+IEM_NETWORK_GEOJSON_URL = 'https://mesonet.agron.iastate.edu/geojson/network/{network}.geojson'
+# Let the first bbox lookup that meets unlocated ASOS stations fetch (and save) their coordinates
+AUTO_REFRESH_COORDINATES = True
+
+Selector = Optional[Union[str, Sequence[str]]]
+
+
+class StationRegistry():
+    """
+    Station table with region/state/source and spatial-grid indexes.
+
+    Lookups return slices of the table in registry (file) order. Bounding boxes use the
+    repo's [min_lon, max_lon, min_lat, max_lat] convention (see MISSOURI_BOUNDS).
+    """
+
+    def __init__(self, table: pd.DataFrame, cell_deg: float = GRID_CELL_DEG, path: Optional[str] = None):
+        self.table = table.reset_index(drop=True)
+        self.cell_deg = cell_deg
+        # CSV that coordinates fetched by a bbox lookup are saved to (None: keep them in memory)
+        self.path = path
+        # fill_coordinates may run from concurrent fetch threads
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._refreshed = False
+        self._build_indexes()
+
+    @classmethod
+    def load(cls, path: str = REGISTRY_PATH, cell_deg: float = GRID_CELL_DEG) -> 'StationRegistry':
+        """Reads the registry CSV."""
+        table = pd.read_csv(
+            path, dtype={col: str for col in REGISTRY_COLUMNS if col not in ('lat', 'lon')},
+            keep_default_na=False, na_values={'lat': [''], 'lon': ['']}
+        )
+        return cls(table[REGISTRY_COLUMNS], cell_deg, path)
+
+    def save(self, path: str = REGISTRY_PATH) -> None:
+        """Writes the registry CSV (coordinates rounded to 4 decimals)."""
+        self.table.to_csv(path, index=False, float_format='%.4f', lineterminator='\n')
+
+    def _build_indexes(self) -> None:
+        def index_on(column: str) -> Dict[str, np.ndarray]:
+            keys = self.table[column].str.lower()
+            return {key: positions for key, positions in keys.groupby(keys, sort=False).indices.items()}
+
+        self._by_region = index_on('region')
+        self._by_state = index_on('state')
+        self._by_source = index_on('source')
+
+        located = self.table['lat'].notna() & self.table['lon'].notna()
+        positions = np.flatnonzero(located.values)
+        cells = pd.DataFrame({
+            'x': np.floor(self.table.loc[located, 'lon'].values / self.cell_deg).astype(int),
+            'y': np.floor(self.table.loc[located, 'lat'].values / self.cell_deg).astype(int),
+        })
+        self._grid: Dict[Tuple[int, int], np.ndarray] = {
+            cell: positions[rows] for cell, rows in cells.groupby(['x', 'y'], sort=False).indices.items()
+        }
+
+    @staticmethod
+    def _lookup(index: Dict[str, np.ndarray], selector: Selector) -> np.ndarray:
+        keys = [selector] if isinstance(selector, str) else list(selector)
+        hits = [index.get(key.lower(), np.empty(0, dtype=int)) for key in keys]
+        return np.unique(np.concatenate(hits)) if hits else np.empty(0, dtype=int)
+
+    def _bbox_positions(self, bbox: Sequence[float]) -> np.ndarray:
+        min_lon, max_lon, min_lat, max_lat = bbox
+        x_range = range(int(np.floor(min_lon / self.cell_deg)), int(np.floor(max_lon / self.cell_deg)) + 1)
+        y_range = range(int(np.floor(min_lat / self.cell_deg)), int(np.floor(max_lat / self.cell_deg)) + 1)
+        candidates = [self._grid[(x, y)] for x in x_range for y in y_range if (x, y) in self._grid]
+        if not candidates:
+            return np.empty(0, dtype=int)
+
+        candidates = np.concatenate(candidates)
+        lon = self.table['lon'].values[candidates]
+        lat = self.table['lat'].values[candidates]
+        inside = (lon >= min_lon) & (lon <= max_lon) & (lat >= min_lat) & (lat <= max_lat)
+        return np.sort(candidates[inside])
+
+    def stations(self, region: Selector = None, state: Selector = None, source: Selector = None,
+                 bbox: Optional[Sequence[float]] = None) -> pd.DataFrame:
+        """
+        Returns the stations matching every given filter (in registry order). `region`,
+        `state` and `source` accept one name or a list of names (case-insensitive).
+        """
+        selected: Optional[np.ndarray] = None
+        for index, selector in ((self._by_region, region), (self._by_state, state), (self._by_source, source)):
+            if selector is not None:
+                positions = self._lookup(index, selector)
+                selected = positions if selected is None else np.intersect1d(selected, positions)
+        if bbox is not None:
+            unlocated = self._unlocated(selected)
+            if unlocated.any() and AUTO_REFRESH_COORDINATES:
+                self._refresh_once(self.table.loc[unlocated[unlocated].index])
+                unlocated = self._unlocated(selected)
+            if unlocated.any():
+                print(f"[REGISTRY] Warning: {int(unlocated.sum())} stations have no coordinates and are skipped by "
+                      f"the bbox lookup (run station_registry.py --refresh-coordinates).")
+            positions = self._bbox_positions(bbox)
+            selected = positions if selected is None else np.intersect1d(selected, positions)
+
+        if selected is None:
+            return self.table.copy()
+        return self.table.iloc[selected].copy()
+
+    def _unlocated(self, selected: Optional[np.ndarray]) -> pd.Series:
+        unlocated = self.table['lat'].isna() | self.table['lon'].isna()
+        return unlocated if selected is None else unlocated.iloc[selected]
+
+    def _refresh_once(self, unlocated: pd.DataFrame) -> None:
+        """Fetches the coordinates of the unlocated stations' ASOS networks (once per registry) and saves them."""
+        networks = unlocated.loc[unlocated['source'] == 'asos', 'network'].drop_duplicates().tolist()
+        with self._refresh_lock:
+            if self._refreshed or not networks:
+                return
+            self._refreshed = True
+            print(f"[REGISTRY] Fetching coordinates of {len(networks)} ASOS networks for the bbox lookup...")
+            if refresh_coordinates(self, networks) and self.path is not None:
+                with self._lock:
+                    self.save(self.path)
+
+    def states(self, region: Selector = None) -> List[str]:
+        """State/province/country names (in registry order), optionally limited to `region`."""
+        return self.stations(region=region)['state'].drop_duplicates().tolist()
+
+    def station_query(self, **filters) -> str:
+        """IEM query fragment ('station=AAA&station=BBB&') for the ASOS stations matching `filters`."""
+        filters.setdefault('source', 'asos')
+        ids = self.stations(**filters)['id'].drop_duplicates()
+        return ''.join(f'station={station_id}&' for station_id in ids)
+
+    def mesonet_metadata(self, year: int) -> Dict[str, Dict[str, Any]]:
+        """Mesonet metadata keyed by bull# ({'station_id', 'lat', 'lon', 'year'}), as used by the parsers."""
+        mesonet = self.stations(source='mesonet')
+        return {
+            row.key: {'station_id': row.id, 'lat': row.lat, 'lon': row.lon, 'year': year}
+            for row in mesonet.itertuples(index=False)
+        }
+
+    def mesonet_urls(self) -> List[str]:
+        """Bulletin page URLs of every Mesonet station, in registry order."""
+        return self.stations(source='mesonet')['url'].tolist()
+
+    def fill_coordinates(self, coordinates: pd.DataFrame) -> int:
+        """
+        Fills missing lat/lon from a frame with 'station', 'lat' and 'lon' columns (e.g. an IEM
+        response or network GeoJSON) and rebuilds the spatial index. Returns the number filled.
+        """
+        known = coordinates.dropna(subset=['lat', 'lon']).drop_duplicates('station').set_index('station')
+        with self._lock:
+            missing = self.table['lat'].isna() | self.table['lon'].isna()
+            matches = missing & self.table['id'].isin(known.index)
+            if not matches.any():
+                return 0
+            table = self.table.copy()
+            table.loc[matches, 'lat'] = table.loc[matches, 'id'].map(known['lat']).values
+            table.loc[matches, 'lon'] = table.loc[matches, 'id'].map(known['lon']).values
+            # Filled on a copy: rows keep their positions, so lookups running meanwhile stay valid
+            self.table = table
+            self._build_indexes()
+        return int(matches.sum())
+
+
+@lru_cache(maxsize=None)
+def load_registry(path: str = REGISTRY_PATH) -> StationRegistry:
+    """Process-wide registry instance (the CSV is read once per path)."""
+    return StationRegistry.load(path)
+
+
+def refresh_coordinates(registry: StationRegistry, networks: Optional[Sequence[str]] = None) -> int:
+    """
+    Downloads IEM network GeoJSON for `networks` (default: every ASOS network in the registry)
+    and fills missing coordinates. Returns the number filled.
+    """
+    import http_client
+
+    filled = 0
+    if networks is None:
+        networks = registry.stations(source='asos')['network'].drop_duplicates().tolist()
+    for network in networks:
+        url = IEM_NETWORK_GEOJSON_URL.format(network=network)
+        try:
+            features = http_client.get(url, timeout=30).json().get('features', [])
+        except Exception as e:
+            print(f"[REGISTRY] Warning: Could not fetch {network}: {e}")
+            continue
+        coordinates = pd.DataFrame([
+            {'station': f['properties'].get('sid'), 'lon': f['geometry']['coordinates'][0], 'lat': f['geometry']['coordinates'][1]}
+            for f in features if f.get('geometry')
+        ], columns=['station', 'lat', 'lon'])
+        count = registry.fill_coordinates(coordinates)
+        print(f"[REGISTRY] {network}: filled {count} station coordinates.")
+        filled += count
+    return filled
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Inspect or update the station registry.')
+    parser.add_argument('--refresh-coordinates', action='store_true',
+                        help='fill missing ASOS coordinates from IEM network metadata and save the registry')
+    args = parser.parse_args()
+
+    registry = StationRegistry.load()
+    if args.refresh_coordinates:
+        filled = refresh_coordinates(registry)
+        registry.save()
+        print(f"-> Filled {filled} coordinates; registry saved to {REGISTRY_PATH}")
+
+    table = registry.table
+    print(f"-> {len(table)} stations ({table['lat'].notna().sum()} with coordinates)")
+    print(table.groupby(['region', 'source']).size().to_string())
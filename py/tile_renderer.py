@@ -0,0 +1,152 @@
+'''
+Tiled rendering of the surface station map as a z/x/y Web Mercator pyramid.
+
+Instead of one giant figure, every tile is a small independent figure
+(TILE_SIZE_PX square) written to <output_dir>/<z>/<x>/<y>.png using the usual
+slippy-map numbering (x from the antimeridian eastward, y from the north edge
+southward), so a web map can pan the analysis tile by tile. Tiles are rendered
+in a process pool; each task receives only the stations that fall in its tile
+(plus a small margin so station models straddling an edge are not cut off), so
+peak memory per worker is one tile regardless of the station count.
+
+Stations are thinned once per zoom level on the whole pyramid (station_plot
+thin_stations) before they are split into tiles, so neighbouring tiles agree on
+which stations are shown and low zooms stay readable. Tiles are transparent
+overlays; tiles without stations are not written.
+
+Author: Nathan Beach
+Last Modified: October 16, 2026
+'''
+
+import os
+import numpy as np
+import cartopy.crs as ccrs
+from matplotlib.figure import Figure
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from station_plot import plot_station_models, project_stations, thin_stations
+
+# --- Configuration Constants ---
+TILE_SIZE_PX = 256
+TILE_DPI = 100
+TILE_FONT_SIZE = 7
+TILE_BARB_LENGTH = 5
+# Half-width of the Web Mercator square (metres); tiles split it into 2**z by 2**z cells
+WEB_MERCATOR_HALF_WIDTH = 20037508.342789244
+# Minimum spacing between stations as a fraction of one tile's width at that zoom
+TILE_SEPARATION_FRACTION = 0.25
+# Stations this close to a tile edge (fraction of the tile width) are also drawn on the neighbour
+TILE_MARGIN_FRACTION = 0.1
+
+TILE_PROJECTION = ccrs.GOOGLE_MERCATOR
+# Per-station arrays rendered on every tile (see plot_station_models)
+STATION_FIELDS = ['air_temp', 'dew_point', 'pressure', 'station_id', 'u', 'v', 'cloud_cover']
+
+
+def tile_width(zoom: int) -> float:
+    """Width of one tile at `zoom` in Web Mercator metres."""
+    return 2 * WEB_MERCATOR_HALF_WIDTH / 2 ** zoom
+
+
+def tile_bounds(zoom: int, x: int, y: int) -> Tuple[float, float, float, float]:
+    """Web Mercator bounds of tile z/x/y as [min_x, max_x, min_y, max_y]."""
+    width = tile_width(zoom)
+    min_x = -WEB_MERCATOR_HALF_WIDTH + x * width
+    max_y = WEB_MERCATOR_HALF_WIDTH - y * width
+    return min_x, min_x + width, max_y - width, max_y
+
+
+def tiles_for_extent(extent: Sequence[float], zoom: int) -> List[Tuple[int, int]]:
+    """(x, y) of every tile at `zoom` overlapping a [min_lon, max_lon, min_lat, max_lat] extent."""
+    min_lon, max_lon, min_lat, max_lat = extent
+    mx, my = project_stations(TILE_PROJECTION, [min_lon, max_lon], [max_lat, min_lat])
+    width = tile_width(zoom)
+    last = 2 ** zoom - 1
+    x0, x1 = (int(np.clip((v + WEB_MERCATOR_HALF_WIDTH) // width, 0, last)) for v in mx)
+    y0, y1 = (int(np.clip((WEB_MERCATOR_HALF_WIDTH - v) // width, 0, last)) for v in my)
+    return [(x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1)]
+
+
+def assign_tiles(mx: np.ndarray, my: np.ndarray, zoom: int,
+                 margin_fraction: float = TILE_MARGIN_FRACTION) -> Dict[Tuple[int, int], np.ndarray]:
+    """
+    Groups projected station positions by tile at `zoom`: {(x, y): station indices}. A station
+    within `margin_fraction` of a tile edge is listed for the neighbouring tile as well.
+    """
+    width = tile_width(zoom)
+    margin = margin_fraction * width
+    last = 2 ** zoom - 1
+    col = lambda v: np.clip(np.floor((v + WEB_MERCATOR_HALF_WIDTH) / width), 0, last).astype(int)
+    row = lambda v: np.clip(np.floor((WEB_MERCATOR_HALF_WIDTH - v) / width), 0, last).astype(int)
+
+    index = np.arange(len(mx))
+    # Every station lands in at most 2x2 tiles when the margin is below one tile width
+    pairs = np.unique(np.concatenate([
+        np.column_stack([index, col(mx + dx), row(my + dy)])
+        for dx in (-margin, margin) for dy in (-margin, margin)
+    ]), axis=0)
+
+    order = np.lexsort((pairs[:, 0], pairs[:, 2], pairs[:, 1]))
+    pairs = pairs[order]
+    keys, starts = np.unique(pairs[:, 1:], axis=0, return_index=True)
+    groups = np.split(pairs[:, 0], starts[1:])
+    return {(int(x), int(y)): stations for (x, y), stations in zip(keys, groups)}
+
+
+def render_tile(zoom: int, x: int, y: int, lons: np.ndarray, lats: np.ndarray,
+                fields: Dict[str, np.ndarray], output_dir: str) -> str:
+    """Renders one tile's stations to <output_dir>/<z>/<x>/<y>.png and returns the path."""
+    min_x, max_x, min_y, max_y = tile_bounds(zoom, x, y)
+    size_in = TILE_SIZE_PX / TILE_DPI
+
+    # A bare Figure (no pyplot) keeps no global state, so workers free each tile completely
+    fig = Figure(figsize=(size_in, size_in), dpi=TILE_DPI)
+    ax = fig.add_axes([0, 0, 1, 1], projection=TILE_PROJECTION)
+    ax.set_axis_off()
+    plot_station_models(ax, TILE_PROJECTION, lons, lats, fields['air_temp'], fields['dew_point'],
+                        fields['pressure'], fields['station_id'], fields['u'], fields['v'],
+                        cloud_cover=fields.get('cloud_cover'), fontsize=TILE_FONT_SIZE, barb_length=TILE_BARB_LENGTH)
+    ax.set_extent([min_x, max_x, min_y, max_y], crs=TILE_PROJECTION)
+
+    path = os.path.join(output_dir, str(zoom), str(x), f'{y}.png')
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fig.savefig(path, dpi=TILE_DPI, transparent=True)
+    return path
+
+
+def _render_tile_task(task: tuple) -> str:
+    return render_tile(*task)
+
+
+def render_tile_pyramid(lons: np.ndarray, lats: np.ndarray, fields: Dict[str, np.ndarray], output_dir: str,
+                        min_zoom: int, max_zoom: int, extent: Optional[Sequence[float]] = None,
+                        priority: Optional[np.ndarray] = None, max_workers: Optional[int] = None) -> List[str]:
+    """
+    Writes the station map as tiles for every zoom in [min_zoom, max_zoom] and returns the paths.
+
+    `fields` holds the per-station arrays named in STATION_FIELDS (cloud_cover optional).
+    Only tiles overlapping `extent` ([min_lon, max_lon, min_lat, max_lat], default: all) are
+    rendered. `priority` decides which stations survive thinning (see thin_stations).
+    """
+    lons = np.asarray(lons, dtype=float)
+    lats = np.asarray(lats, dtype=float)
+    fields = {name: np.asarray(values) for name, values in fields.items() if values is not None}
+    mx, my = project_stations(TILE_PROJECTION, lons, lats)
+
+    tasks = []
+    for zoom in range(min_zoom, max_zoom + 1):
+        keep = np.flatnonzero(thin_stations(mx, my, TILE_SEPARATION_FRACTION * tile_width(zoom), priority))
+        tiles = assign_tiles(mx[keep], my[keep], zoom)
+        wanted = set(tiles_for_extent(extent, zoom)) if extent is not None else tiles.keys()
+        for tile in sorted(wanted):
+            if tile not in tiles:
+                continue
+            stations = keep[tiles[tile]]
+            tile_fields = {name: values[stations] for name, values in fields.items()}
+            tasks.append((zoom, tile[0], tile[1], lons[stations], lats[stations], tile_fields, output_dir))
+
+    print(f"[TILES] Rendering {len(tasks)} tiles (zoom {min_zoom}-{max_zoom}) to {output_dir}")
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # chunksize batches small tile tasks per worker round trip
+        return list(executor.map(_render_tile_task, tasks, chunksize=max(1, len(tasks) // (4 * (os.cpu_count() or 1)))))
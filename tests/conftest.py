@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The pipeline modules import each other flat from py/ (e.g. `import generator`)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'py'))
@@ -0,0 +1,90 @@
+import threading
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+
+import backfill
+import generator
+
+HOUR = datetime(2025, 11, 29, 18)
+
+
+@pytest.fixture(autouse=True)
+def no_weight_cache(monkeypatch):
+    monkeypatch.setattr(generator, 'USE_WEIGHT_CACHE', False)
+
+
+def _reports(n: int = 12) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    min_lon, max_lon, min_lat, max_lat = generator.MISSOURI_BOUNDS
+    df = pd.DataFrame({
+        'station': [f'S{i:02d}' for i in range(n)],
+        'lat': rng.uniform(min_lat, max_lat, n),
+        'lon': rng.uniform(min_lon, max_lon, n),
+        'valid': HOUR,
+    })
+    for column, _ in generator.GRID_VARIABLES.values():
+        df[column] = rng.normal(10, 3, n)
+    return df
+
+
+def test_process_hour_writes_netcdf(tmp_path):
+    details = backfill.process_hour(HOUR, _reports(), 'idw', str(tmp_path / 'nc'), str(tmp_path / 'maps'), render=False)
+    assert (tmp_path / 'nc').exists() and details['netcdf'].endswith('2025112918.nc')
+
+
+def test_process_hour_fails_when_netcdf_is_not_written(tmp_path, monkeypatch):
+    def disk_full(self, *args, **kwargs):
+        raise OSError('No space left on device')
+    monkeypatch.setattr(xr.Dataset, 'to_netcdf', disk_full)
+
+    with pytest.raises(OSError, match='not written'):
+        backfill.process_hour(HOUR, _reports(), 'idw', str(tmp_path / 'nc'), str(tmp_path / 'maps'), render=False)
+
+
+def test_process_hour_does_not_count_stale_files(tmp_path, monkeypatch):
+    outputs = backfill.hour_outputs(HOUR, str(tmp_path / 'nc'), str(tmp_path / 'maps'))
+    (tmp_path / 'nc' / '20251129').mkdir(parents=True)
+    with open(outputs['netcdf'], 'w') as f:
+        f.write('left over from an earlier attempt')
+    monkeypatch.setattr(xr.Dataset, 'to_netcdf', lambda self, *args, **kwargs: None)
+
+    with pytest.raises(OSError, match='not written'):
+        backfill.process_hour(HOUR, _reports(), 'idw', str(tmp_path / 'nc'), str(tmp_path / 'maps'), render=False)
+
+
+class _BrokenPool():
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def submit(self, *args, **kwargs):
+        raise RuntimeError('pool is broken')
+
+
+class _StrictBacklog(threading.BoundedSemaphore):
+    # Fails instead of blocking forever when every permit has leaked
+    def acquire(self, blocking=True, timeout=None):
+        if not super().acquire(timeout=5):
+            raise RuntimeError('backlog permit leaked')
+        return True
+
+
+def test_failed_submit_releases_backlog(tmp_path, monkeypatch):
+    hours = pd.date_range('2025-11-29 00:00', periods=6, freq='h').to_pydatetime()
+    monkeypatch.setattr(backfill, 'ProcessPoolExecutor', _BrokenPool)
+    monkeypatch.setattr(backfill.threading, 'BoundedSemaphore', _StrictBacklog)
+    monkeypatch.setattr(generator, 'fetch_and_process_range', lambda start, end: {hour: _reports() for hour in hours})
+
+    # One worker has BACKLOG_PER_WORKER permits, fewer than the hours handed off
+    manifest = backfill.run_backfill(hours[0], hours[-1], output_dir=str(tmp_path), workers=1, fetch_workers=1, render=False)
+    assert len(manifest.failed) == len(hours) and not manifest.completed
+    assert all('pool is broken' in error for error in manifest.failed.values())
@@ -0,0 +1,76 @@
+import metpy.calc as mpcalc
+import numpy as np
+import pytest
+from metpy.units import units
+
+import fast_calc
+import generator
+
+RNG = np.random.default_rng(0)
+N = 2000
+TEMP_F = RNG.uniform(-30, 115, N)
+DEWPOINT_F = TEMP_F - RNG.uniform(0, 40, N)
+RH_PERCENT = RNG.uniform(1, 100, N)
+SPEED = RNG.uniform(0, 60, N)
+DIRECTION = RNG.uniform(0, 360, N)
+for values in (TEMP_F, DEWPOINT_F, RH_PERCENT, SPEED, DIRECTION):
+    values[RNG.random(N) < 0.05] = np.nan
+
+
+def _close(fast, reference):
+    np.testing.assert_allclose(fast, reference, rtol=fast_calc.VALIDATION_RTOL, atol=fast_calc.VALIDATION_ATOL, equal_nan=True)
+
+
+@pytest.mark.parametrize('kernel, unit', [
+    (fast_calc.knots_to_ms, units.knots),
+    (fast_calc.mph_to_ms, units('mile/hour')),
+])
+def test_speed_conversions(kernel, unit):
+    _close(kernel(SPEED), (SPEED * unit).to('m/s').magnitude)
+
+
+def test_degf_to_degc():
+    _close(fast_calc.degf_to_degc(TEMP_F), (TEMP_F * units.degF).to('degC').magnitude)
+
+
+def test_relative_humidity_from_dewpoint():
+    reference = mpcalc.relative_humidity_from_dewpoint(TEMP_F * units.degF, DEWPOINT_F * units.degF).to('percent')
+    fast = fast_calc.relative_humidity_from_dewpoint(fast_calc.degf_to_degc(TEMP_F), fast_calc.degf_to_degc(DEWPOINT_F))
+    _close(fast, reference.magnitude)
+
+
+def test_dewpoint_from_relative_humidity():
+    reference = mpcalc.dewpoint_from_relative_humidity(TEMP_F * units.degF, RH_PERCENT * units.percent).to('degC')
+    _close(fast_calc.dewpoint_from_relative_humidity(fast_calc.degf_to_degc(TEMP_F), RH_PERCENT), reference.magnitude)
+
+
+def test_wind_components():
+    u_ref, v_ref = mpcalc.wind_components(SPEED * units('m/s'), DIRECTION * units.degrees)
+    u_fast, v_fast = fast_calc.wind_components(SPEED, DIRECTION)
+    _close(u_fast, u_ref.magnitude)
+    _close(v_fast, v_ref.magnitude)
+
+
+def test_validate_against_metpy():
+    assert fast_calc.validate_against_metpy(n=1000)
+
+
+BULLETIN = '''Station: Test   Year = 2025
+ Mon Day Time  Tair  RH  T2in  T4in  T8in  T20in T40in  Wspd  Wdir  Solar Precip
+ 11  29   100  45.2  80  44.1  45.0  46.0  47.0  48.0   5.2   180   0    0.00
+ 11  29   200  44.0  85  43.9  44.8  45.9  47.0  48.0   0.0   360   0    0.01
+ 11  29   300  41.5 100  43.0  44.1  45.5  46.8  48.0  12.7   275   12   0.00
+ 11  29   400   M    M   43.0  44.1  45.5  46.8  48.0   3.1    M    0    0.00
+'''
+
+
+def test_mesonet_parsing_matches_metpy_mode(monkeypatch):
+    metadata = {'station_id': 'Test', 'lat': 38.0, 'lon': -92.0, 'year': 2025}
+    monkeypatch.setattr(generator, 'FAST_UNIT_MODE', False)
+    reference = generator.parse_mesonet_data(BULLETIN, metadata)
+    monkeypatch.setattr(generator, 'FAST_UNIT_MODE', True)
+    fast = generator.parse_mesonet_data(BULLETIN, metadata)
+
+    assert len(reference) == 4
+    for column in ['air_temp_c', 'dew_point_c', 'rh_percent', 'soil_temp_2in_c', 'soil_temp_4in_c', 'wind_speed_ms', 'u', 'v']:
+        _close(fast[column].values, reference[column].values)
@@ -0,0 +1,136 @@
+import numpy as np
+import pytest
+import scipy.interpolate as si
+
+import generator
+from interpolater import ENGINES, BarnesEngine, IDWEngine, RBFEngine, make_engine, to_km
+
+X, Y = np.meshgrid(np.linspace(-95.5, -89.0, 60), np.linspace(36.0, 40.7, 50))
+GRID_POINTS = np.column_stack([X.ravel(), Y.ravel()])
+
+
+def _stations(n: int = 40, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return np.column_stack([rng.uniform(-95.5, -89.0, n), rng.uniform(36.0, 40.7, n)])
+
+
+def _field(points: np.ndarray) -> np.ndarray:
+    return np.sin(np.deg2rad(points[:, 0]) * 20) + np.cos(np.deg2rad(points[:, 1]) * 15)
+
+
+def _network() -> np.ndarray:
+    return np.array([[meta['lon'], meta['lat']] for meta in generator.STATION_METADATA.values()], dtype=float)
+
+
+@pytest.mark.parametrize('name', list(ENGINES))
+def test_engine_grids_real_network(name):
+    # The Mesonet network has co-located stations (e.g. Bradford, CapenPark and Sanborn Boone)
+    points = _network()
+    assert len(np.unique(points, axis=0)) < len(points)
+    gridded = make_engine(name).grid(points, {'T_2m': _field(points), 'RH': points[:, 1]}, X, Y)
+    for values in gridded.values():
+        assert values.shape == X.shape
+        assert np.isfinite(values).any()
+
+
+@pytest.mark.parametrize('name', list(ENGINES))
+def test_engine_handles_collinear_stations(name):
+    points = np.column_stack([np.linspace(-95.0, -90.0, 6), np.linspace(37.0, 40.0, 6)])
+    gridded = make_engine(name).grid(points, {'T_2m': _field(points)}, X, Y)['T_2m']
+    assert gridded.shape == X.shape
+    if name in ('linear', 'cubic'):
+        # No triangle: the mask group is skipped, not raised
+        assert np.isnan(gridded).all()
+    else:
+        assert np.isfinite(gridded).any()
+
+
+@pytest.mark.parametrize('method', ['linear', 'cubic'])
+def test_triangulation_matches_griddata(method):
+    points = _stations()
+    values = _field(points)
+    gridded = make_engine(method).grid(points, {'T_2m': values}, X, Y)['T_2m']
+    expected = si.griddata(points, values, (X, Y), method=method)
+    np.testing.assert_allclose(gridded, expected, rtol=1e-10, atol=1e-10, equal_nan=True)
+
+
+@pytest.mark.parametrize('neighbors', [None, 10])
+def test_rbf_matches_scipy(neighbors):
+    points = _stations()
+    values = np.column_stack([_field(points), points[:, 1]])
+    engine = RBFEngine(neighbors=neighbors)
+    engine.setup(points, GRID_POINTS)
+    ref_lat = GRID_POINTS[:, 1].mean()
+    expected = si.RBFInterpolator(to_km(points, ref_lat), values, neighbors=neighbors)(to_km(GRID_POINTS, ref_lat))
+    np.testing.assert_allclose(engine.evaluate(values), expected, atol=1e-3)
+
+
+def test_rbf_averages_colocated_stations():
+    points = _stations()
+    values = _field(points)
+    duplicated = np.vstack([points, points[:1]])
+    engine = RBFEngine()
+    engine.setup(duplicated, points)
+    result = engine.evaluate(np.append(values, values[0] + 2.0))
+    assert result[0] == pytest.approx(values[0] + 1.0, abs=1e-3)
+    np.testing.assert_allclose(result[1:], values[1:], atol=1e-3)
+
+
+def test_rbf_solves_in_setup():
+    engine = RBFEngine()
+    engine.setup(_stations(), GRID_POINTS)
+    assert engine._operator.shape == (len(GRID_POINTS), 40)
+    np.testing.assert_allclose(engine.weight_matrix().toarray(), engine._operator)
+
+
+def test_idw_matches_brute_force():
+    points = _stations()
+    values = _field(points)
+    engine = IDWEngine(neighbors=len(points))
+    engine.setup(points, GRID_POINTS)
+    ref_lat = GRID_POINTS[:, 1].mean()
+    distance = np.linalg.norm(to_km(GRID_POINTS, ref_lat)[:, None] - to_km(points, ref_lat)[None], axis=2)
+    weights = 1.0 / distance ** 2
+    np.testing.assert_allclose(engine.evaluate(values), weights @ values / weights.sum(axis=1))
+
+
+def test_idw_is_exact_at_stations():
+    points = _stations()
+    values = _field(points)
+    engine = IDWEngine()
+    engine.setup(points, points)
+    np.testing.assert_allclose(engine.evaluate(values), values)
+
+
+def test_barnes_matches_dense_passes():
+    points = _stations()
+    values = _field(points)
+    engine = BarnesEngine(passes=2, gamma=0.3, kappa=2500.0)
+    engine.setup(points, GRID_POINTS)
+
+    ref_lat = GRID_POINTS[:, 1].mean()
+    station_km, grid_km = to_km(points, ref_lat), to_km(GRID_POINTS, ref_lat)
+    cutoff = 3.0 * np.sqrt(2500.0)
+
+    def weights(targets, kappa):
+        distance = np.linalg.norm(targets[:, None] - station_km[None], axis=2)
+        w = np.where(distance <= cutoff, np.exp(-distance ** 2 / kappa), 0.0)
+        with np.errstate(invalid='ignore'):
+            return w / w.sum(axis=1, keepdims=True)
+
+    grid_analysis = weights(grid_km, 2500.0) @ values
+    station_analysis = weights(station_km, 2500.0) @ values
+    grid_analysis += weights(grid_km, 750.0) @ (values - station_analysis)
+    np.testing.assert_allclose(engine.evaluate(values), grid_analysis, rtol=1e-10, equal_nan=True)
+
+
+@pytest.mark.parametrize('name', [name for name in ENGINES if make_engine(name).linear])
+def test_weight_matrix_reproduces_evaluate(name):
+    points = _stations()
+    values = np.column_stack([_field(points), points[:, 0]])
+    engine = make_engine(name)
+    engine.setup(points, GRID_POINTS)
+    direct = engine.evaluate(values)
+    via_operator = engine.weight_matrix() @ values
+    covered = np.isfinite(direct[:, 0])
+    np.testing.assert_allclose(via_operator[covered], direct[covered], atol=1e-8)
@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+
+from generator import select_mesonet_reports
+from mesonet_parser import build_valid_times
+
+
+def _combine_date_time(row, year):
+    # The row-by-row helper build_valid_times replaced (parse_mesonet_data before user-006)
+    try:
+        month = str(int(row['Month'])).zfill(2)
+        day = str(int(row['Day'])).zfill(2)
+        time_int = row['Time_HHMM']
+
+        if time_int == 2400:
+            dt_str = f"{year}-{month}-{day} 23:59"
+            dt = pd.to_datetime(dt_str, format='%Y-%m-%d %H:%M')
+            return dt + pd.Timedelta(minutes=1)
+        else:
+            time_str = str(int(time_int)).zfill(4)
+            hour = time_str[:-2].zfill(2)
+            minute = time_str[-2:]
+            dt_str = f"{year}-{month}-{day} {hour}:{minute}"
+            return pd.to_datetime(dt_str, format='%Y-%m-%d %H:%M', errors='coerce')
+    except:
+        return pd.NaT
+
+
+def test_build_valid_times_matches_row_helper():
+    df = pd.DataFrame({
+        'Month': [11, 11, 12, 2, 2, 4, 11, np.nan, 11, 11, 11, 11, 11.0, 'x'],
+        'Day': [29, 30, 31, 28, 29, 31, 29, 29, np.nan, 29, 29, 29, 29.7, 29],
+        'Time_HHMM': [0, 2400, 2400, 2359, 100, 1200, 2500, 100, 100, 1260, -100, np.nan, 1530.9, 100],
+    })
+    expected = df.apply(lambda row: _combine_date_time(row, 2025), axis=1)
+    result = build_valid_times(df['Month'], df['Day'], df['Time_HHMM'], 2025)
+    pd.testing.assert_series_equal(result, pd.Series(pd.to_datetime(expected), index=df.index), check_names=False)
+
+
+def test_build_valid_times_random_rows():
+    rng = np.random.default_rng(0)
+    n = 500
+    df = pd.DataFrame({
+        'Month': rng.integers(0, 14, n).astype(float),
+        'Day': rng.integers(0, 33, n).astype(float),
+        'Time_HHMM': rng.integers(0, 25, n) * 100 + rng.choice([0, 15, 30, 45, 59, 75], n),
+    })
+    expected = df.apply(lambda row: _combine_date_time(row, 2024), axis=1)
+    result = build_valid_times(df['Month'], df['Day'], df['Time_HHMM'], 2024)
+    pd.testing.assert_series_equal(result, pd.Series(pd.to_datetime(expected), index=df.index), check_names=False)
+
+
+def _select_per_station(frames, target_time_utc):
+    # The per-station loop select_mesonet_reports replaced (fetch_and_process_mesonet before user-008)
+    all_stations_data = []
+    for _, mesonet_df in frames:
+        filtered_df = mesonet_df[
+            (mesonet_df['valid_utc'].dt.date == target_time_utc.date()) &
+            (mesonet_df['valid_utc'].dt.hour == target_time_utc.hour)
+        ].copy()
+        if not filtered_df.empty:
+            filtered_df['time_diff'] = abs(filtered_df['valid_utc'] - target_time_utc)
+            best_report = filtered_df.loc[filtered_df['time_diff'].idxmin()].copy()
+            best_report['valid'] = best_report['valid_utc']
+            all_stations_data.append(best_report.drop(columns=['valid_utc', 'time_diff']).to_frame().T)
+    return pd.concat(all_stations_data, ignore_index=True) if all_stations_data else pd.DataFrame()
+
+
+def _station_frame(station: str, minutes: list, start: str = '2025-11-29 17:00') -> pd.DataFrame:
+    valid_utc = pd.Timestamp(start) + pd.to_timedelta(minutes, unit='min')
+    return pd.DataFrame({
+        'station': station,
+        'lat': 38.0,
+        'lon': -92.0,
+        'air_temp_c': np.arange(len(minutes), dtype=float),
+        'valid_utc': valid_utc,
+    })
+
+
+def test_select_mesonet_reports_matches_per_station_loop():
+    target = pd.Timestamp('2025-11-29 18:00').to_pydatetime()
+    frames = [
+        ({}, _station_frame('Zeta', [45, 60, 75, 90])),
+        # Duplicate timestamps: the first one wins, as with idxmin
+        ({}, _station_frame('Alpha', [70, 65, 65, 119])),
+        ({}, _station_frame('Outside', [0, 30, 59, 120, 24 * 60 + 60])),
+        ({}, _station_frame('Empty', [])),
+        ({}, _station_frame('Late', [119, 100])),
+    ]
+    expected = _select_per_station(frames, target)
+    result = select_mesonet_reports(frames, target)
+    assert list(result['station']) == ['Zeta', 'Alpha', 'Late']
+    pd.testing.assert_frame_equal(result, expected[result.columns], check_dtype=False)
+
+
+def test_select_mesonet_reports_without_reports_in_hour():
+    frames = [({}, _station_frame('Outside', [0, 30, 120]))]
+    assert select_mesonet_reports(frames, pd.Timestamp('2025-11-29 18:00').to_pydatetime()).empty
+    assert select_mesonet_reports([], pd.Timestamp('2025-11-29 18:00').to_pydatetime()).empty
@@ -0,0 +1,69 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+import metar_decoder
+
+METARS = pd.Series([
+    'KSTL 291751Z 18012G20KT 10SM FEW250 12/03 A3012 RMK AO2 SLP201 T01170028',
+    'KCOU 291754Z 27005KT 10SM CLR 08/M02 A3020 RMK AO2 SLP238',
+    'KMKC 291753Z VRB03KT 10SM SCT120 10/01 A3015 RMK AO2 SLP982',
+    'KJLN 291753Z 00000KT 10SM CLR 11/00 A3016 RMK AO2',
+    'KSGF 291752Z 36015KT 7SM -RA OVC015 05/04 A2992 RMK AO2 SLP132 P0001',
+    None,
+    'KIRK 291755Z AUTO 21008KT 10SM CLR 09/M01 A3018 RMK AO2 SLP499',
+], index=[10, 11, 12, 13, 14, 15, 16])
+
+
+def _decode_line_by_line(metar: pd.Series) -> pd.DataFrame:
+    # The per-line loop decode_metar replaced (map_generation.py before user-012)
+    wind_spd_pattern = r'(VRB|[0-9]{3})?([0-9]{2})?(G[0-9]{1,3})?KT'
+    slp_pattern = r'(?i)SLP([0-9]{3})'
+    rows = []
+    for line in metar.fillna(''):
+        wind_match = re.search(wind_spd_pattern, line)
+        slp_match = re.search(slp_pattern, line)
+        rows.append({
+            'wind_dir': wind_match.group(1) if wind_match else None,
+            'wind_speed': wind_match.group(2) if wind_match else None,
+            'wind_gust': wind_match.group(3)[1:] if wind_match and wind_match.group(3) else None,
+            'slp': slp_match.group(1) if slp_match else None,
+        })
+    return pd.DataFrame(rows, index=metar.index)
+
+
+def test_decode_metar_matches_line_by_line():
+    decoded = metar_decoder.decode_metar(METARS)
+    expected = _decode_line_by_line(METARS)
+    assert decoded.index.equals(METARS.index)
+
+    expected_dir = pd.to_numeric(expected['wind_dir'].replace('VRB', None), errors='coerce')
+    np.testing.assert_array_equal(decoded['wind_dir_deg'].values, expected_dir.values)
+    np.testing.assert_array_equal(decoded['wind_speed_kt'].values, pd.to_numeric(expected['wind_speed']).values)
+    np.testing.assert_array_equal(decoded['wind_gust_kt'].values, pd.to_numeric(expected['wind_gust']).values)
+    np.testing.assert_array_equal(decoded['slp_hpa'].values, metar_decoder.decode_slp(expected['slp']).values)
+
+
+def test_decoded_values():
+    decoded = metar_decoder.decode_metar(METARS)
+    assert decoded.loc[10].tolist() == [1020.1, 180.0, 12.0, 20.0]
+    assert np.isnan(decoded.loc[12, 'wind_dir_deg']) and decoded.loc[12, 'wind_speed_kt'] == 3.0
+    assert decoded.loc[12, 'slp_hpa'] == 998.2
+    assert np.isnan(decoded.loc[13, 'slp_hpa'])
+    assert decoded.loc[15].isna().all()
+    assert decoded.loc[16, 'slp_hpa'] == 1049.9
+
+
+def test_slp_station_code_round_trips():
+    slp_hpa = metar_decoder.decode_metar(METARS)['slp_hpa']
+    codes = metar_decoder.slp_station_code(slp_hpa)
+    assert codes.loc[10] == '201' and codes.loc[12] == '982' and codes.loc[16] == '499'
+    assert codes.loc[13] is None
+
+
+def test_attach_decoded_metar_keeps_rows_aligned():
+    df = pd.DataFrame({'station': ['KSTL', 'KCOU'], 'metar': METARS.iloc[:2].values}, index=[5, 3])
+    attached = metar_decoder.attach_decoded_metar(df)
+    assert attached.loc[3, 'slp_hpa'] == 1023.8
+    assert attached.loc[5, 'wind_gust_kt'] == 20.0
@@ -0,0 +1,48 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import generator
+
+HOURS = [datetime(2025, 11, 29, 18), datetime(2025, 11, 29, 19)]
+
+
+@pytest.fixture(autouse=True)
+def no_weight_cache(monkeypatch):
+    # Keep the tests from writing operators into the shared Data/cache directory
+    monkeypatch.setattr(generator, 'USE_WEIGHT_CACHE', False)
+
+
+def _reports(n: int = 12) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    min_lon, max_lon, min_lat, max_lat = generator.MISSOURI_BOUNDS
+    df = pd.DataFrame({
+        'station': [f'S{i:02d}' for i in range(n)],
+        'lat': rng.uniform(min_lat, max_lat, n),
+        'lon': rng.uniform(min_lon, max_lon, n),
+    })
+    for column, _ in generator.GRID_VARIABLES.values():
+        df[column] = rng.normal(10, 3, n)
+    return df
+
+
+def test_all_empty_batch_gives_nan_cube(tmp_path):
+    ds = generator.regrid_and_save_batch(
+        {hour: pd.DataFrame() for hour in HOURS}, generator.GRID_RESOLUTION_KM, generator.MISSOURI_BOUNDS,
+        str(tmp_path / 'empty.nc'), engine=generator.make_engine('idw')
+    )
+    assert ds.sizes['time'] == len(HOURS)
+    for var_name in generator.GRID_VARIABLES:
+        assert ds[var_name].dims == ('time', 'latitude', 'longitude')
+        assert np.isnan(ds[var_name].values).all()
+
+
+def test_empty_hour_is_nan_slice(tmp_path):
+    ds = generator.regrid_and_save_batch(
+        {HOURS[0]: _reports(), HOURS[1]: pd.DataFrame()}, generator.GRID_RESOLUTION_KM, generator.MISSOURI_BOUNDS,
+        str(tmp_path / 'mixed.nc'), engine=generator.make_engine('idw')
+    )
+    assert np.isfinite(ds['T_2m'].isel(time=0).values).any()
+    assert np.isnan(ds['T_2m'].isel(time=1).values).all()
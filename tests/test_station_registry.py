@@ -0,0 +1,89 @@
+import shutil
+
+import pandas as pd
+import pytest
+
+import http_client
+import station_registry
+from station_registry import StationRegistry
+
+MISSOURI_BOUNDS = [-95.5, -89.0, 36.0, 40.7]
+# MO_ASOS sites as IEM's network GeoJSON lists them (real coordinates for three, the rest
+# spread over the state)
+KNOWN_SITES = {'STL': (-90.3733, 38.7525), 'COU': (-92.2194, 38.8181), 'SGF': (-93.3886, 37.2358)}
+
+
+def _mo_asos_features():
+    table = StationRegistry.load().table
+    ids = table.loc[table['network'] == 'MO_ASOS', 'id'].tolist()
+    return [
+        {'properties': {'sid': sid}, 'geometry': {'coordinates': list(KNOWN_SITES.get(sid, (-94.0 + 0.2 * i, 37.0 + 0.2 * i)))}}
+        for i, sid in enumerate(ids)
+    ]
+
+
+class _GeoJSON():
+    def __init__(self, features):
+        self.features = features
+
+    def json(self):
+        return {'features': self.features}
+
+
+@pytest.fixture
+def registry_csv(tmp_path):
+    path = tmp_path / 'station_registry.csv'
+    shutil.copy(station_registry.REGISTRY_PATH, path)
+    return str(path)
+
+
+@pytest.fixture
+def iem(monkeypatch):
+    requested = []
+
+    def get(url, timeout, **kwargs):
+        requested.append(url)
+        if 'MO_ASOS' not in url:
+            raise ConnectionError('offline')
+        return _GeoJSON(_mo_asos_features())
+    monkeypatch.setattr(http_client, 'get', get)
+    return requested
+
+
+def test_bbox_lookup_fetches_and_saves_missing_coordinates(registry_csv, iem):
+    registry = StationRegistry.load(registry_csv)
+    assert 'STL' in set(registry.stations(state='missouri', source='asos')['id'])
+
+    in_missouri = registry.stations(bbox=MISSOURI_BOUNDS, source='asos')
+    assert {'STL', 'COU', 'SGF'} <= set(in_missouri['id'])
+    # Only the networks of the unlocated stations in the selection are fetched, once
+    registry.stations(bbox=MISSOURI_BOUNDS, source='asos')
+    assert iem and len(iem) == len(set(iem))
+
+    # The next process finds the coordinates in the CSV and stays offline
+    iem.clear()
+    reloaded = StationRegistry.load(registry_csv)
+    assert {'STL', 'COU', 'SGF'} <= set(reloaded.stations(bbox=MISSOURI_BOUNDS, state='missouri')['id'])
+    assert not iem
+
+
+def test_bbox_lookup_without_network_keeps_located_stations(registry_csv, monkeypatch, capsys):
+    def offline(url, timeout, **kwargs):
+        raise ConnectionError('offline')
+    monkeypatch.setattr(http_client, 'get', offline)
+
+    registry = StationRegistry.load(registry_csv)
+    mesonet = registry.stations(bbox=MISSOURI_BOUNDS, source='mesonet')
+    assert len(mesonet) == len(registry.stations(source='mesonet'))
+    registry.stations(bbox=MISSOURI_BOUNDS, source='asos')
+    assert 'have no coordinates' in capsys.readouterr().out
+
+
+def test_fill_coordinates_from_reports(registry_csv, monkeypatch):
+    monkeypatch.setattr(station_registry, 'AUTO_REFRESH_COORDINATES', False)
+    registry = StationRegistry.load(registry_csv)
+    assert 'STL' not in set(registry.stations(bbox=MISSOURI_BOUNDS)['id'])
+
+    filled = registry.fill_coordinates(pd.DataFrame({'station': ['STL'], 'lat': [38.7525], 'lon': [-90.3733]}))
+    assert filled == int((registry.table['id'] == 'STL').sum())
+    assert 'STL' in set(registry.stations(bbox=MISSOURI_BOUNDS)['id'])
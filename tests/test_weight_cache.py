@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from interpolater import CachedOperatorEngine, make_engine
+from response_cache import WeightCache
+
+X, Y = np.meshgrid(np.linspace(-95.5, -89.0, 40), np.linspace(36.0, 40.7, 30))
+
+
+def _stations(n: int = 30) -> np.ndarray:
+    rng = np.random.default_rng(3)
+    return np.column_stack([rng.uniform(-95.5, -89.0, n), rng.uniform(36.0, 40.7, n)])
+
+
+@pytest.mark.parametrize('name', ['idw', 'barnes', 'linear', 'rbf'])
+def test_cached_operator_matches_backend(tmp_path, name):
+    points = _stations()
+    rng = np.random.default_rng(4)
+    data = {'T_2m': rng.normal(10, 3, len(points)), 'RH': rng.uniform(20, 100, len(points))}
+    # A missing station gives that variable its own mask group (and operator)
+    data['RH'][5] = np.nan
+
+    expected = make_engine(name).grid(points, data, X, Y)
+    cached = CachedOperatorEngine(make_engine(name), WeightCache(str(tmp_path)))
+    result = cached.grid(points, data, X, Y)
+    for var_name in data:
+        np.testing.assert_allclose(result[var_name], expected[var_name], atol=1e-8, equal_nan=True)
+    assert cached.cache_misses == 2 and cached.cache_hits == 0
+
+
+def test_operator_is_reused_from_memory_and_disk(tmp_path):
+    points = _stations()
+    values = {'T_2m': np.linspace(0, 1, len(points))}
+    first = CachedOperatorEngine(make_engine('idw'), WeightCache(str(tmp_path)))
+    expected = first.grid(points, values, X, Y)['T_2m']
+    first.grid(points, values, X, Y)
+    assert (first.cache_misses, first.cache_hits) == (1, 1)
+
+    # A new process only has the files
+    second = CachedOperatorEngine(make_engine('idw'), WeightCache(str(tmp_path)))
+    np.testing.assert_allclose(second.grid(points, values, X, Y)['T_2m'], expected)
+    assert (second.cache_misses, second.cache_hits) == (0, 1)
+
+
+def test_operator_key_depends_on_backend_config():
+    points = _stations()
+    grid_points = np.column_stack([X.ravel(), Y.ravel()])
+    cache = WeightCache('unused')
+    keys = {
+        CachedOperatorEngine(make_engine('idw', neighbors=neighbors), cache).operator_key(points, grid_points)
+        for neighbors in (4, 8)
+    }
+    keys.add(CachedOperatorEngine(make_engine('idw'), cache).operator_key(points[:-1], grid_points))
+    assert len(keys) == 3
+
+
+def test_cubic_cannot_be_cached(tmp_path):
+    with pytest.raises(ValueError):
+        CachedOperatorEngine(make_engine('cubic'), WeightCache(str(tmp_path)))